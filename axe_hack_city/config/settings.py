@@ -1,4 +1,5 @@
 import os
+from typing import Dict, List, Literal, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -9,6 +10,53 @@ class Settings(BaseSettings):
         f"sqlite:///{os.path.join(os.path.dirname(__file__), '..', database_file)}"
     )
     environment: str  # Add this if you want to capture the environment
+    # Read-only connections per database; writes use one dedicated connection
+    sqlite_pool_size: int = 5
+    sqlite_pool_timeout: float = 30.0
+    bulk_chunk_size: int = 500
+    stream_batch_size: int = 500
+    # Single-writer queue: writes arriving within the window share one commit
+    sqlite_write_window_ms: float = 2.0
+    sqlite_write_batch_size: int = 256
+    # SQLite PRAGMA profile (see database/pragmas.py); the sqlite_* values
+    # below override single PRAGMAs of the profile when set
+    sqlite_pragma_profile: Literal["safe", "balanced", "fast"] = "balanced"
+    sqlite_journal_mode: Optional[
+        Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+    ] = None
+    sqlite_synchronous: Optional[Literal["OFF", "NORMAL", "FULL", "EXTRA"]] = None
+    sqlite_cache_size: Optional[int] = None
+    sqlite_mmap_size: Optional[int] = None
+    sqlite_temp_store: Optional[Literal["DEFAULT", "FILE", "MEMORY"]] = None
+    sqlite_busy_timeout: Optional[int] = None
+    sqlite_foreign_keys: Optional[bool] = None
+    # Expression indexes on JSON keys as "Table.column.key", e.g.
+    # ["Item.effects.poison", "PlayerProgression.faction_reputations.3"]
+    sqlite_json_indexes: List[str] = []
+    # Codec per structured column as "Table.column"; others are written as JSON.
+    # Keep JSON where SQL needs json_extract (filters, JSON indexes).
+    sqlite_column_codecs: Dict[str, Literal["json", "msgpack"]] = {
+        "FloorLayout.walls": "msgpack",
+        "FloorLayout.doors": "msgpack",
+        "Location.coordinates": "msgpack",
+    }
+    # SQLAlchemy engine pools (database/engine_pool.py). Without a class, file
+    # databases get a queue pool and in-memory SQLite a static pool; size,
+    # overflow and timeout only apply to queue pools
+    sqlalchemy_pool_class: Optional[
+        Literal["queue", "static", "singleton_thread", "null"]
+    ] = None
+    sqlalchemy_pool_size: int = 5
+    sqlalchemy_max_overflow: int = 10
+    sqlalchemy_pool_timeout: float = 30.0
+    sqlalchemy_pool_recycle: int = -1
+    sqlalchemy_pool_pre_ping: bool = False
+    # Tests/development: fail on any lazy relationship load (database/loading.py)
+    sqlalchemy_strict_loading: bool = False
+    # Read-through cache of rarely written entities (database/entity_cache.py),
+    # per model; a size of 0 disables it
+    entity_cache_size: int = 10000
+    entity_cache_ttl_seconds: float = 300.0
 
     class Config:
         env_file = ".env"
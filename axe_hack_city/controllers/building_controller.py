@@ -1,8 +1,10 @@
 # controllers/building_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
+from ..database.loading import LoadPlan
+from ..database.single_flight import coalesced_get, coalesced_list
 from ..database.sqlalchemy_repository import SQLAlchemyRepository
 from ..models.building_model import Building
 
@@ -10,6 +12,17 @@ from ..models.building_model import Building
 class BuildingController:
     """Controller for managing Building entities."""
 
+    # Load plans for endpoints; relationships left out raise instead of
+    # lazily issuing one query per building
+    SUMMARY_LOAD: LoadPlan = {"*": "raise"}
+    DETAIL_LOAD: LoadPlan = {
+        "floors": "selectin",
+        "floors.npcs": "selectin",
+        "loot": "selectin",
+        "npcs": "selectin",
+        "*": "raise",
+    }
+
     def __init__(self, session: Session):
         """Initialize the BuildingController.
 
@@ -29,40 +42,56 @@ class BuildingController:
         """
         return self.repository.create(building)
 
-    def get_building(self, building_id: int) -> Building:
+    def get_building(
+        self,
+        building_id: int,
+        fields: Optional[List[str]] = None,
+        load: Optional[LoadPlan] = None,
+    ) -> Union[Building, Dict[str, Any]]:
         """Retrieve a building by its ID.
 
+        Concurrent identical reads share one query.
+
         Args:
             building_id (int): The ID of the building.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
+            load (Optional[LoadPlan]): How to fetch relationships, e.g.
+                :attr:`DETAIL_LOAD`; the mapper defaults when omitted.
 
         Returns:
-            Building: The requested building.
+            Union[Building, Dict[str, Any]]: The requested building.
         """
-        return self.repository.get(building_id)
+        return coalesced_get(self.repository, building_id, fields, load)
 
-    def update_building(self, building: Building) -> Building:
+    def update_building(self, building: Building) -> Optional[Building]:
         """Update an existing building.
 
         Args:
             building (Building): The building to update.
 
         Returns:
-            Building: The updated building.
+            Optional[Building]: The updated building, or None if it does not exist.
         """
         return self.repository.update(building)
 
-    def delete_building(self, building_id: int) -> None:
+    def delete_building(self, building_id: int) -> int:
         """Delete a building by its ID.
 
         Args:
             building_id (int): The ID of the building to delete.
+
+        Returns:
+            int: 1 if the building was deleted, 0 if it did not exist.
         """
-        self.repository.delete(building_id)
+        return self.repository.delete(building_id)
 
     def list_buildings(self, **filters) -> List[Building]:
         """List buildings with optional filters.
 
+        Concurrent identical reads share one query.
+
         Returns:
             List[Building]: A list of buildings.
         """
-        return self.repository.list(**filters)
+        return coalesced_list(self.repository, **filters)
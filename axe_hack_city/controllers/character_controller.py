@@ -1,5 +1,5 @@
 # controllers/character_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -29,35 +29,42 @@ class CharacterController:
         """
         return self.repository.create(character)
 
-    def get_character(self, character_id: int) -> Character:
+    def get_character(
+        self, character_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Character, Dict[str, Any]]:
         """Retrieve a character by its ID.
 
         Args:
             character_id (int): The ID of the character.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            Character: The requested character.
+            Union[Character, Dict[str, Any]]: The requested character.
         """
-        return self.repository.get(character_id)
+        return self.repository.get(character_id, fields)
 
-    def update_character(self, character: Character) -> Character:
+    def update_character(self, character: Character) -> Optional[Character]:
         """Update an existing character.
 
         Args:
             character (Character): The character to update.
 
         Returns:
-            Character: The updated character.
+            Optional[Character]: The updated character, or None if it does not exist.
         """
         return self.repository.update(character)
 
-    def delete_character(self, character_id: int) -> None:
+    def delete_character(self, character_id: int) -> int:
         """Delete a character by its ID.
 
         Args:
             character_id (int): The ID of the character to delete.
+
+        Returns:
+            int: 1 if the character was deleted, 0 if it did not exist.
         """
-        self.repository.delete(character_id)
+        return self.repository.delete(character_id)
 
     def list_characters(self, **filters) -> List[Character]:
         """List characters with optional filters.
@@ -1,9 +1,10 @@
 # controllers/crafting_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
-from ..database.sqlalchemy_repository import SQLAlchemyRepository
+from ..database.entity_cache import get_cache
+from ..database.sqlalchemy_repository import SQLAlchemyRepository, UpsertKey
 from ..models.crafting_model import CraftingRecipe as Crafting
 
 
@@ -17,6 +18,7 @@ class CraftingController:
             session (Session): SQLAlchemy session.
         """
         self.repository = SQLAlchemyRepository(session, Crafting)
+        self.cache = get_cache("crafting_recipes")
 
     def create_crafting(self, crafting: Crafting) -> Crafting:
         """Create a new crafting item.
@@ -29,35 +31,79 @@ class CraftingController:
         """
         return self.repository.create(crafting)
 
-    def get_crafting(self, crafting_id: int) -> Crafting:
+    def get_crafting(
+        self, crafting_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Crafting, Dict[str, Any]]:
         """Retrieve a crafting item by its ID.
 
+        Whole crafting items are read through the shared entity cache.
+
         Args:
             crafting_id (int): The ID of the crafting item.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            Crafting: The requested crafting item.
+            Union[Crafting, Dict[str, Any]]: The requested crafting item.
         """
-        return self.repository.get(crafting_id)
+        if fields:
+            return self.repository.get(crafting_id, fields)
+        return self.cache.get(self.repository, crafting_id)
 
-    def update_crafting(self, crafting: Crafting) -> Crafting:
+    def update_crafting(self, crafting: Crafting) -> Optional[Crafting]:
         """Update an existing crafting item.
 
         Args:
             crafting (Crafting): The crafting item to update.
 
         Returns:
-            Crafting: The updated crafting item.
+            Optional[Crafting]: The updated crafting item, or None if it does not exist.
+        """
+        updated = self.repository.update(crafting)
+        self.cache.invalidate(self.repository.session, [crafting.id])
+        return updated
+
+    def upsert_crafting(self, crafting: Crafting, key: UpsertKey = "id") -> Crafting:
+        """Create a crafting item, or update the crafting item with the same key.
+
+        Args:
+            crafting (Crafting): The crafting item to create or update.
+            key (UpsertKey): ``"id"``, or columns under a UNIQUE constraint.
+
+        Returns:
+            Crafting: The created or updated crafting item.
         """
-        return self.repository.update(crafting)
+        stored = self.repository.upsert(crafting, key)
+        self.cache.invalidate(self.repository.session, [stored.id])
+        return stored
+
+    def upsert_craftings(
+        self, craftings: List[Crafting], key: UpsertKey = "id"
+    ) -> List[int]:
+        """Create or update many crafting items in a single transaction.
 
-    def delete_crafting(self, crafting_id: int) -> None:
+        Args:
+            craftings (List[Crafting]): The crafting items to create or update.
+            key (UpsertKey): ``"id"``, or columns under a UNIQUE constraint.
+
+        Returns:
+            List[int]: The IDs of the crafting items, in input order.
+        """
+        ids = self.repository.upsert_many(craftings, key)
+        self.cache.invalidate(self.repository.session, ids)
+        return ids
+
+    def delete_crafting(self, crafting_id: int) -> int:
         """Delete a crafting item by its ID.
 
         Args:
             crafting_id (int): The ID of the crafting item to delete.
+
+        Returns:
+            int: 1 if the crafting item was deleted, 0 if it did not exist.
         """
-        self.repository.delete(crafting_id)
+        self.cache.invalidate(self.repository.session, [crafting_id])
+        return self.repository.delete(crafting_id)
 
     def list_craftings(self, **filters) -> List[Crafting]:
         """List crafting items with optional filters.
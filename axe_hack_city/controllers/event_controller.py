@@ -1,6 +1,6 @@
 # controllers/event_controller.py
 # controllers/events_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -30,35 +30,52 @@ class EventsController:
         """
         return self.repository.create(event)
 
-    def get_event(self, event_id: int) -> Event:
+    def get_event(
+        self, event_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Event, Dict[str, Any]]:
         """Retrieve an event by its ID.
 
         Args:
             event_id (int): The ID of the event.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            Event: The requested event.
+            Union[Event, Dict[str, Any]]: The requested event.
         """
-        return self.repository.get(event_id)
+        return self.repository.get(event_id, fields)
 
-    def update_event(self, event: Event) -> Event:
+    def update_event(self, event: Event) -> Optional[Event]:
         """Update an existing event.
 
         Args:
             event (Event): The event to update.
 
         Returns:
-            Event: The updated event.
+            Optional[Event]: The updated event, or None if it does not exist.
         """
         return self.repository.update(event)
 
-    def delete_event(self, event_id: int) -> None:
+    def delete_event(self, event_id: int) -> int:
         """Delete an event by its ID.
 
         Args:
             event_id (int): The ID of the event to delete.
+
+        Returns:
+            int: 1 if the event was deleted, 0 if it did not exist.
+        """
+        return self.repository.delete(event_id)
+
+    def delete_events_where(self, **filters) -> int:
+        """Delete every event matching the filters, e.g. ``end_time__lt=now``.
+
+        Rows are removed in chunks, each in its own short transaction.
+
+        Returns:
+            int: The number of deleted events.
         """
-        self.repository.delete(event_id)
+        return self.repository.delete_where(**filters)
 
     def list_events(self, **filters) -> List[Event]:
         """List events with optional filters.
@@ -1,8 +1,10 @@
 # controllers/faction_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
+from ..database.entity_cache import get_cache
+from ..database.loading import LoadPlan
 from ..database.sqlalchemy_repository import SQLAlchemyRepository
 from ..models.faction_model import Faction
 
@@ -10,6 +12,16 @@ from ..models.faction_model import Faction
 class FactionController:
     """Controller for managing Faction entities."""
 
+    # Load plans for endpoints; relationships left out raise instead of
+    # lazily issuing one query per faction
+    SUMMARY_LOAD: LoadPlan = {"*": "raise"}
+    DETAIL_LOAD: LoadPlan = {
+        "allies": "selectin",
+        "enemies": "selectin",
+        "npcs": "selectin",
+        "*": "raise",
+    }
+
     def __init__(self, session: Session):
         """Initialize the FactionController.
 
@@ -17,6 +29,7 @@ class FactionController:
             session (Session): SQLAlchemy session.
         """
         self.repository = SQLAlchemyRepository(session, Faction)
+        self.cache = get_cache("factions")
 
     def create_faction(self, faction: Faction) -> Faction:
         """Create a new faction.
@@ -29,35 +42,54 @@ class FactionController:
         """
         return self.repository.create(faction)
 
-    def get_faction(self, faction_id: int) -> Faction:
+    def get_faction(
+        self,
+        faction_id: int,
+        fields: Optional[List[str]] = None,
+        load: Optional[LoadPlan] = None,
+    ) -> Union[Faction, Dict[str, Any]]:
         """Retrieve a faction by its ID.
 
+        Whole factions are read through the shared entity cache.
+
         Args:
             faction_id (int): The ID of the faction.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
+            load (Optional[LoadPlan]): How to fetch relationships, e.g.
+                :attr:`DETAIL_LOAD`; the mapper defaults when omitted.
 
         Returns:
-            Faction: The requested faction.
+            Union[Faction, Dict[str, Any]]: The requested faction.
         """
-        return self.repository.get(faction_id)
+        if fields or load:
+            return self.repository.get(faction_id, fields, load)
+        return self.cache.get(self.repository, faction_id)
 
-    def update_faction(self, faction: Faction) -> Faction:
+    def update_faction(self, faction: Faction) -> Optional[Faction]:
         """Update an existing faction.
 
         Args:
             faction (Faction): The faction to update.
 
         Returns:
-            Faction: The updated faction.
+            Optional[Faction]: The updated faction, or None if it does not exist.
         """
-        return self.repository.update(faction)
+        updated = self.repository.update(faction)
+        self.cache.invalidate(self.repository.session, [faction.id])
+        return updated
 
-    def delete_faction(self, faction_id: int) -> None:
+    def delete_faction(self, faction_id: int) -> int:
         """Delete a faction by its ID.
 
         Args:
             faction_id (int): The ID of the faction to delete.
+
+        Returns:
+            int: 1 if the faction was deleted, 0 if it did not exist.
         """
-        self.repository.delete(faction_id)
+        self.cache.invalidate(self.repository.session, [faction_id])
+        return self.repository.delete(faction_id)
 
     def list_factions(self, **filters) -> List[Faction]:
         """List factions with optional filters.
@@ -1,8 +1,9 @@
 # controllers/floor_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
+from ..database.loading import LoadPlan
 from ..database.sqlalchemy_repository import SQLAlchemyRepository
 from ..models.floor_model import Floor
 
@@ -10,6 +11,16 @@ from ..models.floor_model import Floor
 class FloorController:
     """Controller for managing Floor entities."""
 
+    # Load plans for endpoints; relationships left out raise instead of
+    # lazily issuing one query per floor
+    SUMMARY_LOAD: LoadPlan = {"*": "raise"}
+    DETAIL_LOAD: LoadPlan = {
+        "layout": "joined",
+        "loot": "selectin",
+        "npcs": "selectin",
+        "*": "raise",
+    }
+
     def __init__(self, session: Session):
         """Initialize the FloorController.
 
@@ -29,35 +40,47 @@ class FloorController:
         """
         return self.repository.create(floor)
 
-    def get_floor(self, floor_id: int) -> Floor:
+    def get_floor(
+        self,
+        floor_id: int,
+        fields: Optional[List[str]] = None,
+        load: Optional[LoadPlan] = None,
+    ) -> Union[Floor, Dict[str, Any]]:
         """Retrieve a floor by its ID.
 
         Args:
             floor_id (int): The ID of the floor.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
+            load (Optional[LoadPlan]): How to fetch relationships, e.g.
+                :attr:`DETAIL_LOAD`; the mapper defaults when omitted.
 
         Returns:
-            Floor: The requested floor.
+            Union[Floor, Dict[str, Any]]: The requested floor.
         """
-        return self.repository.get(floor_id)
+        return self.repository.get(floor_id, fields, load)
 
-    def update_floor(self, floor: Floor) -> Floor:
+    def update_floor(self, floor: Floor) -> Optional[Floor]:
         """Update an existing floor.
 
         Args:
             floor (Floor): The floor to update.
 
         Returns:
-            Floor: The updated floor.
+            Optional[Floor]: The updated floor, or None if it does not exist.
         """
         return self.repository.update(floor)
 
-    def delete_floor(self, floor_id: int) -> None:
+    def delete_floor(self, floor_id: int) -> int:
         """Delete a floor by its ID.
 
         Args:
             floor_id (int): The ID of the floor to delete.
+
+        Returns:
+            int: 1 if the floor was deleted, 0 if it did not exist.
         """
-        self.repository.delete(floor_id)
+        return self.repository.delete(floor_id)
 
     def list_floors(self, **filters) -> List[Floor]:
         """List floors with optional filters.
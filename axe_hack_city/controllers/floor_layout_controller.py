@@ -1,5 +1,5 @@
 # controllers/floor_layout_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -29,35 +29,43 @@ class FloorLayoutController:
         """
         return self.repository.create(floor_layout)
 
-    def get_floor_layout(self, floor_layout_id: int) -> FloorLayout:
+    def get_floor_layout(
+        self, floor_layout_id: int, fields: Optional[List[str]] = None
+    ) -> Union[FloorLayout, Dict[str, Any]]:
         """Retrieve a floor layout by its ID.
 
         Args:
             floor_layout_id (int): The ID of the floor layout.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            FloorLayout: The requested floor layout.
+            Union[FloorLayout, Dict[str, Any]]: The requested floor layout.
         """
-        return self.repository.get(floor_layout_id)
+        return self.repository.get(floor_layout_id, fields)
 
-    def update_floor_layout(self, floor_layout: FloorLayout) -> FloorLayout:
+    def update_floor_layout(self, floor_layout: FloorLayout) -> Optional[FloorLayout]:
         """Update an existing floor layout.
 
         Args:
             floor_layout (FloorLayout): The floor layout to update.
 
         Returns:
-            FloorLayout: The updated floor layout.
+            Optional[FloorLayout]: The updated floor layout,
+                or None if it does not exist.
         """
         return self.repository.update(floor_layout)
 
-    def delete_floor_layout(self, floor_layout_id: int) -> None:
+    def delete_floor_layout(self, floor_layout_id: int) -> int:
         """Delete a floor layout by its ID.
 
         Args:
             floor_layout_id (int): The ID of the floor layout to delete.
+
+        Returns:
+            int: 1 if the floor layout was deleted, 0 if it did not exist.
         """
-        self.repository.delete(floor_layout_id)
+        return self.repository.delete(floor_layout_id)
 
     def list_floor_layouts(self, **filters) -> List[FloorLayout]:
         """List floor layouts with optional filters.
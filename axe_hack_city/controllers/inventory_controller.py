@@ -1,8 +1,9 @@
 # controllers/inventory_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
+from ..database.loading import LoadPlan
 from ..database.sqlalchemy_repository import SQLAlchemyRepository
 from ..models.inventory_model import Inventory
 
@@ -10,6 +11,11 @@ from ..models.inventory_model import Inventory
 class InventoryController:
     """Controller for managing Inventory entities."""
 
+    # Load plans for endpoints; relationships left out raise instead of
+    # lazily issuing one query per inventory
+    SUMMARY_LOAD: LoadPlan = {"*": "raise"}
+    DETAIL_LOAD: LoadPlan = {"items": "selectin", "*": "raise"}
+
     def __init__(self, session: Session):
         """Initialize the InventoryController.
 
@@ -29,35 +35,48 @@ class InventoryController:
         """
         return self.repository.create(inventory)
 
-    def get_inventory(self, inventory_id: int) -> Inventory:
+    def get_inventory(
+        self,
+        inventory_id: int,
+        fields: Optional[List[str]] = None,
+        load: Optional[LoadPlan] = None,
+    ) -> Union[Inventory, Dict[str, Any]]:
         """Retrieve an inventory item by its ID.
 
         Args:
             inventory_id (int): The ID of the inventory item.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
+            load (Optional[LoadPlan]): How to fetch relationships, e.g.
+                :attr:`DETAIL_LOAD`; the mapper defaults when omitted.
 
         Returns:
-            Inventory: The requested inventory item.
+            Union[Inventory, Dict[str, Any]]: The requested inventory item.
         """
-        return self.repository.get(inventory_id)
+        return self.repository.get(inventory_id, fields, load)
 
-    def update_inventory(self, inventory: Inventory) -> Inventory:
+    def update_inventory(self, inventory: Inventory) -> Optional[Inventory]:
         """Update an existing inventory item.
 
         Args:
             inventory (Inventory): The inventory item to update.
 
         Returns:
-            Inventory: The updated inventory item.
+            Optional[Inventory]: The updated inventory item,
+                or None if it does not exist.
         """
         return self.repository.update(inventory)
 
-    def delete_inventory(self, inventory_id: int) -> None:
+    def delete_inventory(self, inventory_id: int) -> int:
         """Delete an inventory item by its ID.
 
         Args:
             inventory_id (int): The ID of the inventory item to delete.
+
+        Returns:
+            int: 1 if the inventory item was deleted, 0 if it did not exist.
         """
-        self.repository.delete(inventory_id)
+        return self.repository.delete(inventory_id)
 
     def list_inventories(self, **filters) -> List[Inventory]:
         """List inventory items with optional filters.
@@ -1,9 +1,10 @@
 # controllers/item_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
-from ..database.sqlalchemy_repository import SQLAlchemyRepository
+from ..database.entity_cache import get_cache
+from ..database.sqlalchemy_repository import SQLAlchemyRepository, UpsertKey
 from ..models.item_model import Item
 
 
@@ -17,6 +18,7 @@ class ItemController:
             session (Session): SQLAlchemy session.
         """
         self.repository = SQLAlchemyRepository(session, Item)
+        self.cache = get_cache("items")
 
     def create_item(self, item: Item) -> Item:
         """Create a new item.
@@ -29,35 +31,111 @@ class ItemController:
         """
         return self.repository.create(item)
 
-    def get_item(self, item_id: int) -> Item:
+    def create_items(self, items: List[Item]) -> List[int]:
+        """Create many items in a single transaction.
+
+        Args:
+            items (List[Item]): The items to create.
+
+        Returns:
+            List[int]: The IDs of the created items, in input order.
+        """
+        return self.repository.create_many(items)
+
+    def get_item(
+        self, item_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Item, Dict[str, Any]]:
         """Retrieve an item by its ID.
 
         Args:
             item_id (int): The ID of the item.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            Item: The requested item.
+            Union[Item, Dict[str, Any]]: The requested item.
         """
-        return self.repository.get(item_id)
+        if fields:
+            return self.repository.get(item_id, fields)
+        return self.cache.get(self.repository, item_id)
 
-    def update_item(self, item: Item) -> Item:
+    def update_item(self, item: Item) -> Optional[Item]:
         """Update an existing item.
 
         Args:
             item (Item): The item to update.
 
         Returns:
-            Item: The updated item.
+            Optional[Item]: The updated item, or None if it does not exist.
+        """
+        updated = self.repository.update(item)
+        self.cache.invalidate(self.repository.session, [item.id])
+        return updated
+
+    def update_items(self, items: List[Item]) -> int:
+        """Update many existing items in a single transaction.
+
+        Args:
+            items (List[Item]): The items to update.
+
+        Returns:
+            int: The number of items updated.
+        """
+        updated = self.repository.update_many(items)
+        self.cache.invalidate(self.repository.session, [item.id for item in items])
+        return updated
+
+    def upsert_item(self, item: Item, key: UpsertKey = "id") -> Item:
+        """Create an item, or update the item with the same key.
+
+        Args:
+            item (Item): The item to create or update.
+            key (UpsertKey): ``"id"``, or columns under a UNIQUE constraint.
+
+        Returns:
+            Item: The created or updated item.
+        """
+        stored = self.repository.upsert(item, key)
+        self.cache.invalidate(self.repository.session, [stored.id])
+        return stored
+
+    def upsert_items(self, items: List[Item], key: UpsertKey = "id") -> List[int]:
+        """Create or update many items in a single transaction.
+
+        Args:
+            items (List[Item]): The items to create or update.
+            key (UpsertKey): ``"id"``, or columns under a UNIQUE constraint.
+
+        Returns:
+            List[int]: The IDs of the items, in input order.
         """
-        return self.repository.update(item)
+        ids = self.repository.upsert_many(items, key)
+        self.cache.invalidate(self.repository.session, ids)
+        return ids
 
-    def delete_item(self, item_id: int) -> None:
+    def delete_item(self, item_id: int) -> int:
         """Delete an item by its ID.
 
         Args:
             item_id (int): The ID of the item to delete.
+
+        Returns:
+            int: 1 if the item was deleted, 0 if it did not exist.
+        """
+        self.cache.invalidate(self.repository.session, [item_id])
+        return self.repository.delete(item_id)
+
+    def delete_items(self, item_ids: List[int]) -> int:
+        """Delete many items by ID in a single transaction.
+
+        Args:
+            item_ids (List[int]): The IDs of the items to delete.
+
+        Returns:
+            int: The number of items deleted.
         """
-        self.repository.delete(item_id)
+        self.cache.invalidate(self.repository.session, item_ids)
+        return self.repository.delete_many(item_ids)
 
     def list_items(self, **filters) -> List[Item]:
         """List items with optional filters.
@@ -1,8 +1,14 @@
 # controllers/location_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ..database.async_sqlalchemy_repository import AsyncSQLAlchemyRepository
+from ..database.loading import LoadPlan
+from ..database.single_flight import (async_coalesced_get,
+                                      async_coalesced_list, coalesced_get,
+                                      coalesced_list)
 from ..database.sqlalchemy_repository import SQLAlchemyRepository
 from ..models.location_model import Location
 
@@ -10,6 +16,11 @@ from ..models.location_model import Location
 class LocationController:
     """Controller for managing Location entities."""
 
+    # Load plans for endpoints; relationships left out raise instead of
+    # lazily issuing one query per location
+    SUMMARY_LOAD: LoadPlan = {"*": "raise"}
+    DETAIL_LOAD: LoadPlan = {"events": "selectin", "*": "raise"}
+
     def __init__(self, session: Session):
         """Initialize the LocationController.
 
@@ -29,40 +40,137 @@ class LocationController:
         """
         return self.repository.create(location)
 
-    def get_location(self, location_id: int) -> Location:
+    def get_location(
+        self,
+        location_id: int,
+        fields: Optional[List[str]] = None,
+        load: Optional[LoadPlan] = None,
+    ) -> Union[Location, Dict[str, Any]]:
         """Retrieve a location by its ID.
 
+        Concurrent identical reads share one query.
+
         Args:
             location_id (int): The ID of the location.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
+            load (Optional[LoadPlan]): How to fetch relationships, e.g.
+                :attr:`DETAIL_LOAD`; the mapper defaults when omitted.
 
         Returns:
-            Location: The requested location.
+            Union[Location, Dict[str, Any]]: The requested location.
         """
-        return self.repository.get(location_id)
+        return coalesced_get(self.repository, location_id, fields, load)
 
-    def update_location(self, location: Location) -> Location:
+    def update_location(self, location: Location) -> Optional[Location]:
         """Update an existing location.
 
         Args:
             location (Location): The location to update.
 
         Returns:
-            Location: The updated location.
+            Optional[Location]: The updated location, or None if it does not exist.
         """
         return self.repository.update(location)
 
-    def delete_location(self, location_id: int) -> None:
+    def delete_location(self, location_id: int) -> int:
         """Delete a location by its ID.
 
         Args:
             location_id (int): The ID of the location to delete.
+
+        Returns:
+            int: 1 if the location was deleted, 0 if it did not exist.
         """
-        self.repository.delete(location_id)
+        return self.repository.delete(location_id)
 
     def list_locations(self, **filters) -> List[Location]:
         """List locations with optional filters.
 
+        Concurrent identical reads share one query.
+
+        Returns:
+            List[Location]: A list of locations.
+        """
+        return coalesced_list(self.repository, **filters)
+
+
+class AsyncLocationController:
+    """Controller for managing Location entities without blocking the event loop."""
+
+    # Lazy loads fail under asyncio, so endpoints should always pass a plan
+    SUMMARY_LOAD = LocationController.SUMMARY_LOAD
+    DETAIL_LOAD = LocationController.DETAIL_LOAD
+
+    def __init__(self, session: AsyncSession):
+        """Initialize the AsyncLocationController.
+
+        Args:
+            session (AsyncSession): Async SQLAlchemy session.
+        """
+        self.repository = AsyncSQLAlchemyRepository(session, Location)
+
+    async def create_location(self, location: Location) -> Location:
+        """Create a new location.
+
+        Args:
+            location (Location): The location to create.
+
+        Returns:
+            Location: The created location.
+        """
+        return await self.repository.create(location)
+
+    async def get_location(
+        self,
+        location_id: int,
+        fields: Optional[List[str]] = None,
+        load: Optional[LoadPlan] = None,
+    ) -> Union[Location, Dict[str, Any]]:
+        """Retrieve a location by its ID.
+
+        Concurrent identical reads share one query.
+
+        Args:
+            location_id (int): The ID of the location.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
+            load (Optional[LoadPlan]): How to fetch relationships, e.g.
+                :attr:`DETAIL_LOAD`; the mapper defaults when omitted.
+
+        Returns:
+            Union[Location, Dict[str, Any]]: The requested location.
+        """
+        return await async_coalesced_get(self.repository, location_id, fields, load)
+
+    async def update_location(self, location: Location) -> Optional[Location]:
+        """Update an existing location.
+
+        Args:
+            location (Location): The location to update.
+
+        Returns:
+            Optional[Location]: The updated location, or None if it does not exist.
+        """
+        return await self.repository.update(location)
+
+    async def delete_location(self, location_id: int) -> int:
+        """Delete a location by its ID.
+
+        Args:
+            location_id (int): The ID of the location to delete.
+
+        Returns:
+            int: 1 if the location was deleted, 0 if it did not exist.
+        """
+        return await self.repository.delete(location_id)
+
+    async def list_locations(self, **filters) -> List[Location]:
+        """List locations with optional filters.
+
+        Concurrent identical reads share one query.
+
         Returns:
             List[Location]: A list of locations.
         """
-        return self.repository.list(**filters)
+        return await async_coalesced_list(self.repository, **filters)
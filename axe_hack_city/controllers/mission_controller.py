@@ -1,5 +1,5 @@
 # controllers/mission_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -29,35 +29,52 @@ class MissionController:
         """
         return self.repository.create(mission)
 
-    def get_mission(self, mission_id: int) -> Mission:
+    def get_mission(
+        self, mission_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Mission, Dict[str, Any]]:
         """Retrieve a mission by its ID.
 
         Args:
             mission_id (int): The ID of the mission.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            Mission: The requested mission.
+            Union[Mission, Dict[str, Any]]: The requested mission.
         """
-        return self.repository.get(mission_id)
+        return self.repository.get(mission_id, fields)
 
-    def update_mission(self, mission: Mission) -> Mission:
+    def update_mission(self, mission: Mission) -> Optional[Mission]:
         """Update an existing mission.
 
         Args:
             mission (Mission): The mission to update.
 
         Returns:
-            Mission: The updated mission.
+            Optional[Mission]: The updated mission, or None if it does not exist.
         """
         return self.repository.update(mission)
 
-    def delete_mission(self, mission_id: int) -> None:
+    def delete_mission(self, mission_id: int) -> int:
         """Delete a mission by its ID.
 
         Args:
             mission_id (int): The ID of the mission to delete.
+
+        Returns:
+            int: 1 if the mission was deleted, 0 if it did not exist.
+        """
+        return self.repository.delete(mission_id)
+
+    def delete_missions_where(self, **filters) -> int:
+        """Delete every mission matching the filters, e.g. ``status="failed"``.
+
+        Rows are removed in chunks, each in its own short transaction.
+
+        Returns:
+            int: The number of deleted missions.
         """
-        self.repository.delete(mission_id)
+        return self.repository.delete_where(**filters)
 
     def list_missions(self, **filters) -> List[Mission]:
         """List missions with optional filters.
@@ -1,5 +1,5 @@
 # controllers/npc_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -29,35 +29,75 @@ class NPCController:
         """
         return self.repository.create(npc)
 
-    def get_npc(self, npc_id: int) -> NPC:
+    def create_npcs(self, npcs: List[NPC]) -> List[int]:
+        """Create many NPCs in a single transaction.
+
+        Args:
+            npcs (List[NPC]): The NPCs to create.
+
+        Returns:
+            List[int]: The IDs of the created NPCs, in input order.
+        """
+        return self.repository.create_many(npcs)
+
+    def get_npc(
+        self, npc_id: int, fields: Optional[List[str]] = None
+    ) -> Union[NPC, Dict[str, Any]]:
         """Retrieve an NPC by its ID.
 
         Args:
             npc_id (int): The ID of the NPC.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            NPC: The requested NPC.
+            Union[NPC, Dict[str, Any]]: The requested NPC.
         """
-        return self.repository.get(npc_id)
+        return self.repository.get(npc_id, fields)
 
-    def update_npc(self, npc: NPC) -> NPC:
+    def update_npc(self, npc: NPC) -> Optional[NPC]:
         """Update an existing NPC.
 
         Args:
             npc (NPC): The NPC to update.
 
         Returns:
-            NPC: The updated NPC.
+            Optional[NPC]: The updated NPC, or None if it does not exist.
         """
         return self.repository.update(npc)
 
-    def delete_npc(self, npc_id: int) -> None:
+    def update_npcs(self, npcs: List[NPC]) -> int:
+        """Update many existing NPCs in a single transaction.
+
+        Args:
+            npcs (List[NPC]): The NPCs to update.
+
+        Returns:
+            int: The number of NPCs updated.
+        """
+        return self.repository.update_many(npcs)
+
+    def delete_npc(self, npc_id: int) -> int:
         """Delete an NPC by its ID.
 
         Args:
             npc_id (int): The ID of the NPC to delete.
+
+        Returns:
+            int: 1 if the NPC was deleted, 0 if it did not exist.
+        """
+        return self.repository.delete(npc_id)
+
+    def delete_npcs(self, npc_ids: List[int]) -> int:
+        """Delete many NPCs by ID in a single transaction.
+
+        Args:
+            npc_ids (List[int]): The IDs of the NPCs to delete.
+
+        Returns:
+            int: The number of NPCs deleted.
         """
-        self.repository.delete(npc_id)
+        return self.repository.delete_many(npc_ids)
 
     def list_npcs(self, **filters) -> List[NPC]:
         """List NPCs with optional filters.
@@ -1,5 +1,5 @@
 # controllers/progression_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -29,35 +29,43 @@ class ProgressionController:
         """
         return self.repository.create(progression)
 
-    def get_progression(self, progression_id: int) -> Progression:
+    def get_progression(
+        self, progression_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Progression, Dict[str, Any]]:
         """Retrieve a progression by its ID.
 
         Args:
             progression_id (int): The ID of the progression.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            Progression: The requested progression.
+            Union[Progression, Dict[str, Any]]: The requested progression.
         """
-        return self.repository.get(progression_id)
+        return self.repository.get(progression_id, fields)
 
-    def update_progression(self, progression: Progression) -> Progression:
+    def update_progression(self, progression: Progression) -> Optional[Progression]:
         """Update an existing progression.
 
         Args:
             progression (Progression): The progression to update.
 
         Returns:
-            Progression: The updated progression.
+            Optional[Progression]: The updated progression,
+                or None if it does not exist.
         """
         return self.repository.update(progression)
 
-    def delete_progression(self, progression_id: int) -> None:
+    def delete_progression(self, progression_id: int) -> int:
         """Delete a progression by its ID.
 
         Args:
             progression_id (int): The ID of the progression to delete.
+
+        Returns:
+            int: 1 if the progression was deleted, 0 if it did not exist.
         """
-        self.repository.delete(progression_id)
+        return self.repository.delete(progression_id)
 
     def list_progressions(self, **filters) -> List[Progression]:
         """List progressions with optional filters.
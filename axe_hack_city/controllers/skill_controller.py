@@ -1,9 +1,10 @@
 # controllers/skill_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
-from ..database.sqlalchemy_repository import SQLAlchemyRepository
+from ..database.entity_cache import get_cache
+from ..database.sqlalchemy_repository import SQLAlchemyRepository, UpsertKey
 from ..models.skill_model import Skill
 
 
@@ -17,6 +18,7 @@ class SkillController:
             session (Session): SQLAlchemy session.
         """
         self.repository = SQLAlchemyRepository(session, Skill)
+        self.cache = get_cache("skills")
 
     def create_skill(self, skill: Skill) -> Skill:
         """Create a new skill.
@@ -29,35 +31,77 @@ class SkillController:
         """
         return self.repository.create(skill)
 
-    def get_skill(self, skill_id: int) -> Skill:
+    def get_skill(
+        self, skill_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Skill, Dict[str, Any]]:
         """Retrieve a skill by its ID.
 
+        Whole skills are read through the shared entity cache.
+
         Args:
             skill_id (int): The ID of the skill.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            Skill: The requested skill.
+            Union[Skill, Dict[str, Any]]: The requested skill.
         """
-        return self.repository.get(skill_id)
+        if fields:
+            return self.repository.get(skill_id, fields)
+        return self.cache.get(self.repository, skill_id)
 
-    def update_skill(self, skill: Skill) -> Skill:
+    def update_skill(self, skill: Skill) -> Optional[Skill]:
         """Update an existing skill.
 
         Args:
             skill (Skill): The skill to update.
 
         Returns:
-            Skill: The updated skill.
+            Optional[Skill]: The updated skill, or None if it does not exist.
+        """
+        updated = self.repository.update(skill)
+        self.cache.invalidate(self.repository.session, [skill.id])
+        return updated
+
+    def upsert_skill(self, skill: Skill, key: UpsertKey = "id") -> Skill:
+        """Create a skill, or update the skill with the same key.
+
+        Args:
+            skill (Skill): The skill to create or update.
+            key (UpsertKey): ``"id"``, or columns under a UNIQUE constraint.
+
+        Returns:
+            Skill: The created or updated skill.
         """
-        return self.repository.update(skill)
+        stored = self.repository.upsert(skill, key)
+        self.cache.invalidate(self.repository.session, [stored.id])
+        return stored
+
+    def upsert_skills(self, skills: List[Skill], key: UpsertKey = "id") -> List[int]:
+        """Create or update many skills in a single transaction.
 
-    def delete_skill(self, skill_id: int) -> None:
+        Args:
+            skills (List[Skill]): The skills to create or update.
+            key (UpsertKey): ``"id"``, or columns under a UNIQUE constraint.
+
+        Returns:
+            List[int]: The IDs of the skills, in input order.
+        """
+        ids = self.repository.upsert_many(skills, key)
+        self.cache.invalidate(self.repository.session, ids)
+        return ids
+
+    def delete_skill(self, skill_id: int) -> int:
         """Delete a skill by its ID.
 
         Args:
             skill_id (int): The ID of the skill to delete.
+
+        Returns:
+            int: 1 if the skill was deleted, 0 if it did not exist.
         """
-        self.repository.delete(skill_id)
+        self.cache.invalidate(self.repository.session, [skill_id])
+        return self.repository.delete(skill_id)
 
     def list_skills(self, **filters) -> List[Skill]:
         """List skills with optional filters.
@@ -1,5 +1,5 @@
 # controllers/street_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -29,35 +29,42 @@ class StreetController:
         """
         return self.repository.create(street)
 
-    def get_street(self, street_id: int) -> Street:
+    def get_street(
+        self, street_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Street, Dict[str, Any]]:
         """Retrieve a street by its ID.
 
         Args:
             street_id (int): The ID of the street.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            Street: The requested street.
+            Union[Street, Dict[str, Any]]: The requested street.
         """
-        return self.repository.get(street_id)
+        return self.repository.get(street_id, fields)
 
-    def update_street(self, street: Street) -> Street:
+    def update_street(self, street: Street) -> Optional[Street]:
         """Update an existing street.
 
         Args:
             street (Street): The street to update.
 
         Returns:
-            Street: The updated street.
+            Optional[Street]: The updated street, or None if it does not exist.
         """
         return self.repository.update(street)
 
-    def delete_street(self, street_id: int) -> None:
+    def delete_street(self, street_id: int) -> int:
         """Delete a street by its ID.
 
         Args:
             street_id (int): The ID of the street to delete.
+
+        Returns:
+            int: 1 if the street was deleted, 0 if it did not exist.
         """
-        self.repository.delete(street_id)
+        return self.repository.delete(street_id)
 
     def list_streets(self, **filters) -> List[Street]:
         """List streets with optional filters.
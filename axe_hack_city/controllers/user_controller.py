@@ -1,5 +1,5 @@
 # controllers/user_controller.py
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -29,35 +29,42 @@ class UserController:
         """
         return self.repository.create(user)
 
-    def get_user(self, user_id: int) -> User:
+    def get_user(
+        self, user_id: int, fields: Optional[List[str]] = None
+    ) -> Union[User, Dict[str, Any]]:
         """Retrieve a user by its ID.
 
         Args:
             user_id (int): The ID of the user.
+            fields (Optional[List[str]]): Load only these fields and return
+                them as a dict instead of a model.
 
         Returns:
-            User: The requested user.
+            Union[User, Dict[str, Any]]: The requested user.
         """
-        return self.repository.get(user_id)
+        return self.repository.get(user_id, fields)
 
-    def update_user(self, user: User) -> User:
+    def update_user(self, user: User) -> Optional[User]:
         """Update an existing user.
 
         Args:
             user (User): The user to update.
 
         Returns:
-            User: The updated user.
+            Optional[User]: The updated user, or None if it does not exist.
         """
         return self.repository.update(user)
 
-    def delete_user(self, user_id: int) -> None:
+    def delete_user(self, user_id: int) -> int:
         """Delete a user by its ID.
 
         Args:
             user_id (int): The ID of the user to delete.
+
+        Returns:
+            int: 1 if the user was deleted, 0 if it did not exist.
         """
-        self.repository.delete(user_id)
+        return self.repository.delete(user_id)
 
     def list_users(self, **filters) -> List[User]:
         """List users with optional filters.
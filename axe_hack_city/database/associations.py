@@ -0,0 +1,225 @@
+# database/associations.py
+import sqlite3
+import sys
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
+                    Tuple)
+
+from ..config.settings import settings
+from .batching import chunked
+from .codecs import decode_value
+from .create_tables import ASSOCIATIONS, AssociationSpec
+from .write_queue import WriteQueue
+
+# During the online migration a list lives in exactly one place: the legacy
+# JSON column while it is non-NULL, otherwise the junction table. Repository
+# writes always use the junction table and clear the JSON column.
+
+_BY_OWNER: Dict[Tuple[str, str], AssociationSpec] = {
+    (association.owner_table.lower(), association.column): association
+    for association in ASSOCIATIONS
+}
+
+
+def association_for(table_name: str, column: str) -> Optional[AssociationSpec]:
+    """Return the junction table backing a column, if it has one.
+
+    Args:
+        table_name (str): Owner table name; SQLite compares these
+            case-insensitively, and so does this lookup.
+        column (str): Column name.
+
+    Returns:
+        Optional[AssociationSpec]: The association, or None for plain columns.
+    """
+    return _BY_OWNER.get((table_name.lower(), column))
+
+
+def members_sql(association: AssociationSpec, owners: int) -> str:
+    """Build the SELECT of several owners' lists, in list order.
+
+    Args:
+        association (AssociationSpec): The association to read.
+        owners (int): Number of owner IDs bound to the statement.
+
+    Returns:
+        str: The statement, returning (owner ID, member ID) rows.
+    """
+    placeholders = ", ".join("?" for _ in range(owners))
+    return (
+        f"SELECT {association.owner_key}, {association.member_key} "
+        f"FROM {association.table} "
+        f"WHERE {association.owner_key} IN ({placeholders}) "
+        f"ORDER BY {association.owner_key}, position"
+    )
+
+
+def load_members(
+    connection: sqlite3.Connection,
+    association: AssociationSpec,
+    owner_ids: Sequence[int],
+) -> Dict[int, List[int]]:
+    """Load the lists of several owners with one query per chunk of IDs.
+
+    Args:
+        connection (sqlite3.Connection): An open database connection.
+        association (AssociationSpec): The association to read.
+        owner_ids (Sequence[int]): Owners to load.
+
+    Returns:
+        Dict[int, List[int]]: Member IDs in list order, keyed by owner ID.
+            Owners without rows are missing from the dict.
+    """
+    members: Dict[int, List[int]] = {}
+    for chunk in chunked(owner_ids, settings.bulk_chunk_size):
+        rows = connection.execute(members_sql(association, len(chunk)), chunk)
+        for owner_id, member_id in rows:
+            members.setdefault(owner_id, []).append(member_id)
+    return members
+
+
+def attach_members(
+    connection: sqlite3.Connection,
+    associations: Tuple[Tuple[int, AssociationSpec], ...],
+    id_index: int,
+    rows: List[Sequence[Any]],
+) -> List[List[Any]]:
+    """Fill association columns of fetched rows with Python lists.
+
+    Legacy JSON values are decoded; cleared ones are loaded from the
+    junction tables.
+
+    Args:
+        connection (sqlite3.Connection): Connection the rows were read with.
+        associations (Tuple[Tuple[int, AssociationSpec], ...]): Row position
+            and association of each association column.
+        id_index (int): Row position of the owner ID.
+        rows (List[Sequence[Any]]): Rows as returned by the cursor.
+
+    Returns:
+        List[List[Any]]: Rows ready for decoding.
+    """
+    rows = [list(row) for row in rows]
+    for index, association in associations:
+        pending = [row[id_index] for row in rows if row[index] is None]
+        members = load_members(connection, association, pending) if pending else {}
+        for row in rows:
+            if row[index] is None:
+                row[index] = members.get(row[id_index], [])
+            else:
+                row[index] = decode_value(row[index])
+    return rows
+
+
+def replace_members(
+    connection: sqlite3.Connection,
+    association: AssociationSpec,
+    owner_id: int,
+    member_ids: Optional[Iterable[int]],
+) -> None:
+    """Store an owner's list in the junction table, replacing any old rows.
+
+    Must run inside the caller's write transaction.
+
+    Args:
+        connection (sqlite3.Connection): The write connection.
+        association (AssociationSpec): The association to write.
+        owner_id (int): The owner's ID.
+        member_ids (Optional[Iterable[int]]): The new list; None stores an
+            empty one.
+    """
+    connection.execute(
+        f"DELETE FROM {association.table} WHERE {association.owner_key} = ?",
+        (owner_id,),
+    )
+    if member_ids:
+        connection.executemany(
+            f"INSERT INTO {association.table} "
+            f"({association.owner_key}, position, {association.member_key}) "
+            f"VALUES (?, ?, ?)",
+            (
+                (owner_id, position, member)
+                for position, member in enumerate(member_ids)
+            ),
+        )
+
+
+def _backfill_batch(
+    association: AssociationSpec, after: int, batch_size: int
+) -> Callable[[sqlite3.Connection], Tuple[int, int]]:
+    # Builds the writer operation that moves the next keyset batch
+    def operation(connection: sqlite3.Connection) -> Tuple[int, int]:
+        ids = [
+            row[0]
+            for row in connection.execute(
+                f"SELECT id FROM {association.owner_table} "
+                f"WHERE id > ? AND {association.column} IS NOT NULL "
+                f"ORDER BY id LIMIT ?",
+                (after, batch_size),
+            )
+        ]
+        if not ids:
+            return 0, after
+        first, last = ids[0], ids[-1]
+        connection.execute(
+            f"INSERT OR IGNORE INTO {association.table} "
+            f"({association.owner_key}, position, {association.member_key}) "
+            f"SELECT owner.id, member.key, member.value "
+            f"FROM {association.owner_table} AS owner, "
+            f"json_each(owner.{association.column}) AS member "
+            f"WHERE owner.id BETWEEN ? AND ? "
+            f"AND owner.{association.column} IS NOT NULL",
+            (first, last),
+        )
+        connection.execute(
+            f"UPDATE {association.owner_table} SET {association.column} = NULL "
+            f"WHERE id BETWEEN ? AND ? AND {association.column} IS NOT NULL",
+            (first, last),
+        )
+        return len(ids), last
+
+    return operation
+
+
+def backfill_associations(
+    writer: WriteQueue, batch_size: int = settings.bulk_chunk_size
+) -> Dict[str, int]:
+    """Move legacy JSON lists into the junction tables, one batch at a time.
+
+    Each batch is a short write transaction queued behind regular writes, so
+    the application keeps serving while this runs. It is idempotent and
+    resumes where it stopped, since moved rows have their JSON cleared.
+
+    Args:
+        writer (WriteQueue): Write queue for the migrated database.
+        batch_size (int): Owner rows moved per transaction.
+
+    Returns:
+        Dict[str, int]: Owner rows moved, keyed by ``Table.column``.
+    """
+    moved: Dict[str, int] = {}
+    for association in ASSOCIATIONS:
+        key = f"{association.owner_table}.{association.column}"
+        moved[key] = 0
+        after = 0
+        while True:
+            count, after = writer.execute(
+                _backfill_batch(association, after, batch_size)
+            )
+            if not count:
+                break
+            moved[key] += count
+    return moved
+
+
+if __name__ == "__main__":
+    # python -m axe_hack_city.database.associations [database]
+    # Safe to run against the live database while the API is serving.
+    from .migrations import bootstrap_schema
+
+    queue = WriteQueue(sys.argv[1] if len(sys.argv) > 1 else settings.database_url)
+    try:
+        bootstrap_schema(queue)
+        for column, count in backfill_associations(queue).items():
+            print(f"{column:<30} {count:>8} rows moved")
+    finally:
+        queue.close()
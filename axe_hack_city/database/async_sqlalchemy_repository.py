@@ -0,0 +1,198 @@
+# database/async_sqlalchemy_repository.py
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, Union
+
+from sqlalchemy import delete, insert, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config.settings import settings
+from .batching import chunked
+from .loading import LoadPlan, loader_options
+from .sqlalchemy_repository import SQLAlchemyStatements, T, UpsertKey
+
+
+class AsyncSQLAlchemyRepository(SQLAlchemyStatements[T]):
+    """Non-blocking counterpart of SQLAlchemyRepository for async routers.
+
+    Like it, writes are flushed and the caller's unit of work commits.
+    """
+
+    def __init__(self, session: AsyncSession, model: Type[T]):
+        self.session = session
+        self.model = model
+
+    async def create(self, entity: T) -> T:
+        """Creates a new record in the database."""
+        self.session.add(entity)
+        await self.session.flush()
+        return entity
+
+    async def create_many(
+        self, entities: List[T], chunk_size: int = settings.bulk_chunk_size
+    ) -> List[int]:
+        """Bulk inserts records in chunks and returns their IDs."""
+        ids: List[int] = []
+        statement = insert(self.model).returning(
+            self.model.id, sort_by_parameter_order=True
+        )
+        for chunk in chunked(entities, chunk_size):
+            rows = [self._column_values(entity) for entity in chunk]
+            ids.extend((await self.session.scalars(statement, rows)).all())
+        return ids
+
+    async def get(
+        self,
+        entity_id: int,
+        fields: Optional[List[str]] = None,
+        load: Optional[LoadPlan] = None,
+    ) -> Union[T, Dict[str, Any], None]:
+        """Fetches a record by its ID, as a dict of ``fields`` when given.
+
+        Relationships must be covered by ``load``: lazy loading cannot run
+        under asyncio.
+        """
+        if not fields:
+            return await self.session.get(
+                self.model, entity_id, options=loader_options(self.model, load)
+            )
+        query = select(*self._columns(fields)).where(self.model.id == entity_id)
+        row = (await self.session.execute(query)).mappings().first()
+        return dict(row) if row else None
+
+    async def update(self, entity: T) -> Optional[T]:
+        """Updates the columns set on an entity, returning the stored record."""
+        if inspect(entity).persistent:
+            # Loaded in this session: the flush writes only modified columns
+            await self.session.flush()
+            return entity
+        values = self._changed_values(entity)
+        if not values:
+            return await self.get(entity.id)
+        result = await self.session.scalars(self._update_statement(entity, values))
+        return result.first()
+
+    async def update_many(
+        self, entities: List[T], chunk_size: int = settings.bulk_chunk_size
+    ) -> int:
+        """Bulk updates the set columns by primary key in chunks, skipping IDs
+        that are not stored; returns the number of rows updated.
+        """
+        updated = 0
+        for chunk in chunked(entities, chunk_size):
+            existing = set(await self.session.scalars(self._existing_ids(chunk)))
+            rows = self._update_rows(chunk, existing)
+            if rows:
+                await self.session.execute(update(self.model), rows)
+            updated += len(rows)
+        return updated
+
+    async def upsert(self, entity: T, key: UpsertKey = "id") -> T:
+        """Inserts a record, or writes the columns set on it over the record
+        with the same ``key`` (``id``, or columns under a UNIQUE constraint).
+        """
+        key = (key,) if isinstance(key, str) else tuple(key)
+        row, updated = self._upsert_values(entity, key)
+        statement = (
+            self._upsert_statement(self.session.get_bind().dialect.name, key, updated)
+            .values(row)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return (await self.session.scalars(statement)).one()
+
+    async def upsert_many(
+        self,
+        entities: List[T],
+        key: UpsertKey = "id",
+        chunk_size: int = settings.bulk_chunk_size,
+    ) -> List[int]:
+        """Bulk upserts records, one statement per chunk, returning their IDs
+        in input order.
+        """
+        key = (key,) if isinstance(key, str) else tuple(key)
+        dialect = self.session.get_bind().dialect.name
+        ids: List[int] = [0] * len(entities)
+        for statement, rows in self._upsert_batches(dialect, entities, key):
+            for chunk in chunked(rows, chunk_size):
+                result = await self.session.execute(
+                    statement, [row for _, row in chunk]
+                )
+                stored = {tuple(returned[1:]): returned[0] for returned in result}
+                for position, row in chunk:
+                    ids[position] = stored[tuple(row[c] for c in key)]
+        return ids
+
+    async def delete(self, entity_id: int) -> int:
+        """Deletes a record by its ID with one DELETE, returning the row count."""
+        result = await self.session.execute(
+            delete(self.model).where(self.model.id == entity_id)
+        )
+        return result.rowcount
+
+    async def delete_many(
+        self, entity_ids: List[int], chunk_size: int = settings.bulk_chunk_size
+    ) -> int:
+        """Deletes records by ID in chunks and returns the count."""
+        deleted = 0
+        for chunk in chunked(entity_ids, chunk_size):
+            result = await self.session.execute(
+                delete(self.model).where(self.model.id.in_(chunk)),
+                execution_options={"synchronize_session": False},
+            )
+            deleted += result.rowcount
+        return deleted
+
+    async def delete_where(
+        self, chunk_size: int = settings.bulk_chunk_size, **filters
+    ) -> int:
+        """Deletes every record matching ``filters`` a chunk at a time.
+
+        Chunks are committed one by one only when no transaction is open.
+        """
+        statement = self._delete_chunk(filters, chunk_size)
+        commit_chunks = not self.session.in_transaction()
+        deleted = 0
+        while True:
+            result = await self.session.execute(
+                statement, execution_options={"synchronize_session": False}
+            )
+            if commit_chunks:
+                await self.session.commit()
+            deleted += result.rowcount
+            if result.rowcount < chunk_size:
+                return deleted
+
+    async def list(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        order_by: Union[str, List[str], None] = None,
+        load: Optional[LoadPlan] = None,
+        **filters,
+    ) -> List[Union[T, Dict[str, Any]]]:
+        """Fetches a page of filtered, ordered records, resuming after ``after``."""
+        query = self._list_query(limit, after, fields, order_by, filters, load)
+        if fields:
+            result = await self.session.execute(query)
+            return [dict(row) for row in result.mappings()]
+        return (await self.session.scalars(query)).unique().all()
+
+    async def stream(
+        self,
+        batch_size: int = settings.stream_batch_size,
+        fields: Optional[List[str]] = None,
+        order_by: Union[str, List[str], None] = None,
+        load: Optional[LoadPlan] = None,
+        **filters,
+    ) -> AsyncIterator[Union[T, Dict[str, Any]]]:
+        """Yields matching records, loading ``batch_size`` rows at a time."""
+        query = self._filtered(
+            self._select(fields, load), filters, order_by
+        ).execution_options(yield_per=batch_size)
+        if fields:
+            result = await self.session.stream(query)
+            async for row in result.mappings():
+                yield dict(row)
+        else:
+            async for entity in await self.session.stream_scalars(query):
+                yield entity
@@ -0,0 +1,22 @@
+# database/batching.py
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most ``chunk_size`` items.
+
+    Args:
+        items (Iterable[T]): The items to split.
+        chunk_size (int): Maximum length of each chunk.
+
+    Yields:
+        List[T]: The next chunk.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
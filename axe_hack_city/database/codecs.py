@@ -0,0 +1,204 @@
+# database/codecs.py
+import json
+import sqlite3
+import sys
+import warnings
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from sqlalchemy.types import Text, TypeDecorator
+
+from ..config.settings import settings
+from .create_tables import IDENTIFIER
+from .write_queue import WriteQueue
+
+try:
+    import msgpack
+except ImportError:  # optional: binary columns fall back to JSON text
+    msgpack = None
+
+# Structured columns are written with the codec configured for them in
+# Settings.sqlite_column_codecs and JSON otherwise. The storage class tells
+# the format when reading (TEXT is JSON, BLOB is msgpack), so rows written
+# before a codec change stay readable until they are rewritten.
+
+Encoded = Union[str, bytes]
+
+
+def encode_json(value: Any) -> str:
+    return json.dumps(value)
+
+
+def encode_msgpack(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+CODECS: Dict[str, Callable[[Any], Encoded]] = {
+    "json": encode_json,
+    "msgpack": encode_msgpack,
+}
+
+# SQLite typeof() of the values each codec writes
+STORAGE_CLASSES = {"json": "text", "msgpack": "blob"}
+
+
+def decode_value(stored: Encoded) -> Any:
+    """Decode a stored structured value, whichever codec wrote it.
+
+    Args:
+        stored (Encoded): JSON text or a msgpack blob.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        RuntimeError: For a blob when msgpack is not installed.
+    """
+    if isinstance(stored, bytes):
+        if msgpack is None:
+            raise RuntimeError("msgpack is required to read binary columns")
+        return msgpack.unpackb(stored, strict_map_key=False)
+    return json.loads(stored)
+
+
+@lru_cache(maxsize=None)
+def codec_for(table_name: str, column: str) -> str:
+    """Return the name of the codec a column is written with.
+
+    Args:
+        table_name (str): Table name, compared case-insensitively.
+        column (str): Column name.
+
+    Returns:
+        str: A key of :data:`CODECS`.
+    """
+    configured = {
+        name.lower(): codec for name, codec in settings.sqlite_column_codecs.items()
+    }
+    codec = configured.get(f"{table_name}.{column}".lower(), "json")
+    if codec == "msgpack" and msgpack is None:
+        warnings.warn(
+            f"msgpack is not installed; writing {table_name}.{column} as JSON",
+            RuntimeWarning,
+        )
+        return "json"
+    return codec
+
+
+def encoder_for(table_name: str, column: str) -> Callable[[Any], Encoded]:
+    """Return the function that serializes values of a column.
+
+    Args:
+        table_name (str): Table name, compared case-insensitively.
+        column (str): Column name.
+
+    Returns:
+        Callable[[Any], Encoded]: The column's encoder.
+    """
+    return CODECS[codec_for(table_name, column)]
+
+
+class EncodedJSON(TypeDecorator):
+    """SQLAlchemy column type for structured values stored with a codec.
+
+    Reads JSON text and msgpack blobs alike, so a column can switch codecs
+    and be rewritten in place.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def __init__(self, codec: str = "json"):
+        super().__init__()
+        if codec == "msgpack" and msgpack is None:
+            codec = "json"
+        self.codec = codec
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[Encoded]:
+        if value is None:
+            return None
+        return CODECS[self.codec](value)
+
+    def process_result_value(self, value: Optional[Encoded], dialect: Any) -> Any:
+        if value is None:
+            return None
+        return decode_value(value)
+
+
+def _rewrite_batch(
+    table_name: str, column: str, codec: str, after: int, batch_size: int
+) -> Callable[[sqlite3.Connection], Tuple[int, int]]:
+    # Builds the writer operation that re-encodes the next keyset batch
+    encode = CODECS[codec]
+    storage_class = STORAGE_CLASSES[codec]
+
+    def operation(connection: sqlite3.Connection) -> Tuple[int, int]:
+        rows = connection.execute(
+            f"SELECT id, {column} FROM {table_name} "
+            f"WHERE id > ? AND {column} IS NOT NULL "
+            f"AND typeof({column}) != ? ORDER BY id LIMIT ?",
+            (after, storage_class, batch_size),
+        ).fetchall()
+        if not rows:
+            return 0, after
+        connection.executemany(
+            f"UPDATE {table_name} SET {column} = ? WHERE id = ?",
+            ((encode(decode_value(value)), id) for id, value in rows),
+        )
+        return len(rows), rows[-1][0]
+
+    return operation
+
+
+def rewrite_column(
+    writer: WriteQueue,
+    table_name: str,
+    column: str,
+    batch_size: int = settings.bulk_chunk_size,
+) -> int:
+    """Re-encode a column's rows written with another codec, one batch at a time.
+
+    Each batch is a short transaction through the write queue, so this can run
+    against the live database; it resumes where it stopped when rerun.
+
+    Args:
+        writer (WriteQueue): Write queue for the database.
+        table_name (str): Table to rewrite.
+        column (str): Column to rewrite with its configured codec.
+        batch_size (int): Rows re-encoded per transaction.
+
+    Returns:
+        int: Rows rewritten.
+
+    Raises:
+        ValueError: If the table or column name is not a plain identifier.
+    """
+    if not (IDENTIFIER.match(table_name) and IDENTIFIER.match(column)):
+        raise ValueError(f"Invalid column: {table_name}.{column}")
+    codec = codec_for(table_name, column)
+    rewritten = 0
+    after = 0
+    while True:
+        count, after = writer.execute(
+            _rewrite_batch(table_name, column, codec, after, batch_size)
+        )
+        if not count:
+            return rewritten
+        rewritten += count
+
+
+if __name__ == "__main__":
+    # python -m axe_hack_city.database.codecs [database] [Table.column ...]
+    # Rewrites the given columns, or every column in sqlite_column_codecs.
+    from .migrations import bootstrap_schema
+
+    args = sys.argv[1:]
+    queue = WriteQueue(args[0] if args else settings.database_url)
+    try:
+        bootstrap_schema(queue)
+        for name in args[1:] or list(settings.sqlite_column_codecs):
+            table_name, column = name.split(".")
+            count = rewrite_column(queue, table_name, column)
+            print(f"{name:<30} {codec_for(table_name, column):<8} {count:>8} rows")
+    finally:
+        queue.close()
@@ -0,0 +1,253 @@
+# database/connection_pool.py
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from queue import Empty, LifoQueue
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import quote
+
+from ..config.settings import settings
+from .pragmas import apply_pragmas, resolve_pragmas
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled connection becomes free within the pool timeout."""
+
+
+@dataclass
+class PoolMetrics:
+    """Point-in-time counters used to size a connection pool.
+
+    Attributes:
+        pool_size (int): Maximum number of connections the pool may open.
+        connections_open (int): Connections currently opened by the pool.
+        in_use (int): Connections currently checked out.
+        idle (int): Opened connections waiting in the pool.
+        checkouts (int): Total successful checkouts.
+        waits (int): Checkouts that had to wait for a connection to be returned.
+        timeouts (int): Checkouts that gave up after the pool timeout.
+        total_wait_seconds (float): Time spent waiting across all checkouts.
+        max_wait_seconds (float): Longest single wait for a connection.
+    """
+
+    pool_size: int
+    connections_open: int
+    in_use: int
+    idle: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+def sqlite_path(database_url: str) -> str:
+    """Convert a SQLAlchemy style ``sqlite:///`` URL into a path for sqlite3.
+
+    Args:
+        database_url (str): A database URL or a plain file path.
+
+    Returns:
+        str: The file path sqlite3 should open.
+    """
+    prefix = "sqlite:///"
+    if database_url.startswith(prefix):
+        return database_url[len(prefix) :]
+    return database_url
+
+
+class SQLiteConnectionPool:
+    """A checkout/checkin pool of long-lived sqlite3 connections.
+
+    A read-only pool opens its connections with ``mode=ro`` and leaves writes
+    to the database's single :class:`~.write_queue.WriteQueue`; under WAL the
+    readers never block the writer or each other.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        pool_size: int = settings.sqlite_pool_size,
+        timeout: float = settings.sqlite_pool_timeout,
+        pragmas: Optional[Dict[str, Any]] = None,
+        read_only: bool = False,
+    ):
+        """Initialize the pool. Connections are opened lazily on first checkout.
+
+        Args:
+            db_path (str): Database URL or file path.
+            pool_size (int): Maximum number of open connections.
+            timeout (float): Seconds to wait for a free connection.
+            pragmas (Optional[Dict[str, Any]]): PRAGMAs for each new
+                connection; defaults to the profile configured in Settings.
+            read_only (bool): Open connections with ``mode=ro``. The database
+                file must already exist.
+        """
+        self.db_path = sqlite_path(db_path)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.read_only = read_only
+        self.pragmas = resolve_pragmas() if pragmas is None else pragmas
+        if read_only:
+            # The journal mode is persistent and set by the write connection
+            self.pragmas = {
+                name: value
+                for name, value in self.pragmas.items()
+                if name != "journal_mode"
+            }
+        self._idle: LifoQueue = LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection that may be shared between threads."""
+        if self.read_only:
+            conn = sqlite3.connect(
+                f"file:{quote(self.db_path)}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        apply_pragmas(conn, self.pragmas)
+        return conn
+
+    def _checkout(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        try:
+            conn = self._idle.get_nowait()
+        except Empty:
+            conn = None
+        if conn is None:
+            with self._lock:
+                can_open = self._opened < self.pool_size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                started = time.perf_counter()
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except Empty:
+                    with self._lock:
+                        self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No connection available within {self.timeout}s"
+                    ) from None
+                waited = time.perf_counter() - started
+                with self._lock:
+                    self._waits += 1
+                    self._total_wait += waited
+                    self._max_wait = max(self._max_wait, waited)
+        with self._lock:
+            self._checkouts += 1
+            self._in_use += 1
+        return conn
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._in_use -= 1
+        if self._closed:
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+            return
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check a connection out of the pool for the duration of the block.
+
+        Any transaction left open by a failing block is rolled back before the
+        connection is returned to the pool.
+
+        Yields:
+            sqlite3.Connection: A pooled connection.
+        """
+        conn = self._checkout()
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._checkin(conn)
+
+    def metrics(self) -> PoolMetrics:
+        """Return a snapshot of the pool counters.
+
+        Returns:
+            PoolMetrics: The current pool metrics.
+        """
+        with self._lock:
+            return PoolMetrics(
+                pool_size=self.pool_size,
+                connections_open=self._opened,
+                in_use=self._in_use,
+                idle=self._opened - self._in_use,
+                checkouts=self._checkouts,
+                waits=self._waits,
+                timeouts=self._timeouts,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+            )
+
+    def close(self) -> None:
+        """Close every idle connection. Checked-out ones close on checkin."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+
+_pools: Dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str = settings.database_url) -> SQLiteConnectionPool:
+    """Return the process-wide read-only pool for a database, creating it if needed.
+
+    Writes go through :func:`~.write_queue.get_writer` instead.
+
+    Args:
+        db_path (str): Database URL or file path.
+
+    Returns:
+        SQLiteConnectionPool: The shared read-only pool for that database.
+    """
+    key = sqlite_path(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SQLiteConnectionPool(db_path, read_only=True)
+        return pool
+
+
+def close_pools() -> None:
+    """Close and forget every pool opened by :func:`get_pool`."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -1,5 +1,10 @@
 import json
+import re
 import sqlite3
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+from .filters import JSON_KEY, json_path
 
 
 def create_building_table(cursor: sqlite3.Cursor):
@@ -256,22 +261,224 @@ def create_street_table(cursor: sqlite3.Cursor):
     )
 
 
+TABLE_CREATORS = [
+    create_building_table,
+    create_floor_table,
+    create_item_table,
+    create_npc_table,
+    create_character_table,
+    create_inventory_table,
+    create_crafting_table,
+    create_event_table,
+    create_faction_table,
+    create_floor_layout_table,
+    create_location_table,
+    create_mission_table,
+    create_progression_table,
+    create_skill_table,
+    create_user_table,
+    create_street_table,
+]
+
+
+def create_all_tables(cursor: sqlite3.Cursor):
+    for create_table in TABLE_CREATORS:
+        create_table(cursor)
+
+
 def create_tables(connection: sqlite3.Connection):
     cursor = connection.cursor()
-    create_building_table(cursor)
-    create_floor_table(cursor)
-    create_item_table(cursor)
-    create_npc_table(cursor)
-    create_character_table(cursor)
-    create_inventory_table(cursor)
-    create_crafting_table(cursor)
-    create_event_table(cursor)
-    create_faction_table(cursor)
-    create_floor_layout_table(cursor)
-    create_location_table(cursor)
-    create_mission_table(cursor)
-    create_progression_table(cursor)
-    create_skill_table(cursor)
-    create_user_table(cursor)
-    create_street_table(cursor)
+    create_all_tables(cursor)
     connection.commit()
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """A secondary index on one table.
+
+    Attributes:
+        table (str): Indexed table.
+        columns (Tuple[str, ...]): Indexed columns, in index order.
+        unique (bool): Whether the index enforces uniqueness.
+    """
+
+    table: str
+    columns: Tuple[str, ...]
+    unique: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"ix_{self.table.lower()}_{'_'.join(self.columns)}"
+
+    @property
+    def ddl(self) -> str:
+        unique = "UNIQUE " if self.unique else ""
+        return (
+            f"CREATE {unique}INDEX IF NOT EXISTS {self.name} "
+            f"ON {self.table} ({', '.join(self.columns)});"
+        )
+
+
+# Foreign keys and the columns the game looks rows up by
+INDEXES: List[IndexSpec] = [
+    IndexSpec("Floor", ("building_id",)),
+    IndexSpec("NPC", ("faction",)),
+    IndexSpec("Character", ("inventory_id",)),
+    IndexSpec("CraftingRecipe", ("output_id",)),
+    IndexSpec("Event", ("location_id",)),
+    IndexSpec("Mission", ("giver_id",)),
+    IndexSpec("Mission", ("status",)),
+    IndexSpec("PlayerProgression", ("character_id",)),
+]
+
+
+def create_indexes(cursor: sqlite3.Cursor):
+    for index in INDEXES:
+        cursor.execute(index.ddl)
+
+
+@dataclass(frozen=True)
+class AssociationSpec:
+    """A list-of-IDs column stored as rows of a junction table.
+
+    Rows are keyed by owner and list position, so order and duplicates
+    survive; a second index on (member, owner) answers reverse lookups such
+    as "which events is character 42 in?".
+
+    Attributes:
+        owner_table (str): Table whose column the list belongs to.
+        column (str): The list column, formerly JSON TEXT.
+        table (str): Junction table holding one row per list element.
+        owner_key (str): Junction column referencing the owner's id.
+        member_key (str): Junction column holding the listed ID.
+    """
+
+    owner_table: str
+    column: str
+    table: str
+    owner_key: str
+    member_key: str
+
+    @property
+    def ddl(self) -> str:
+        return f"""
+    CREATE TABLE IF NOT EXISTS {self.table} (
+        {self.owner_key} INTEGER NOT NULL
+            REFERENCES {self.owner_table}(id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        {self.member_key} INTEGER NOT NULL,
+        PRIMARY KEY ({self.owner_key}, position)
+    ) WITHOUT ROWID;
+    """
+
+    @property
+    def member_index(self) -> IndexSpec:
+        return IndexSpec(self.table, (self.member_key, self.owner_key))
+
+
+ASSOCIATIONS: List[AssociationSpec] = [
+    AssociationSpec(
+        "Character",
+        "clan_members",
+        "character_clan_members",
+        "character_id",
+        "member_id",
+    ),
+    AssociationSpec(
+        "Event", "participants", "event_participants", "event_id", "character_id"
+    ),
+    AssociationSpec("Faction", "allies", "faction_allies", "faction_id", "ally_id"),
+    AssociationSpec("Faction", "enemies", "faction_enemies", "faction_id", "enemy_id"),
+    AssociationSpec("Faction", "npcs", "faction_npcs", "faction_id", "npc_id"),
+    AssociationSpec("Inventory", "items", "inventory_items", "inventory_id", "item_id"),
+    AssociationSpec("Mission", "rewards", "mission_rewards", "mission_id", "item_id"),
+    AssociationSpec(
+        "CraftingRecipe",
+        "ingredients",
+        "crafting_recipe_ingredients",
+        "recipe_id",
+        "item_id",
+    ),
+    AssociationSpec(
+        "User", "character_ids", "user_characters", "user_id", "character_id"
+    ),
+]
+
+
+def create_association_tables(cursor: sqlite3.Cursor):
+    # Existing JSON values are moved over by database/associations.py
+    for association in ASSOCIATIONS:
+        cursor.execute(association.ddl)
+        cursor.execute(association.member_index.ddl)
+
+
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+@dataclass(frozen=True)
+class JsonIndexSpec:
+    """A partial expression index on one top-level key of a JSON column.
+
+    Filters such as ``effects.poison__gt=0`` compile to the same
+    ``json_extract`` expression, so SQLite can seek on the index instead of
+    decoding every row. Rows without the key are left out of the index.
+
+    Attributes:
+        table (str): Indexed table.
+        column (str): JSON TEXT column.
+        key (str): Top-level object key to index.
+    """
+
+    table: str
+    column: str
+    key: str
+
+    @classmethod
+    def parse(cls, declaration: str) -> "JsonIndexSpec":
+        """Parse a ``Table.column.key`` declaration.
+
+        Raises:
+            ValueError: If the declaration is malformed.
+        """
+        parts = declaration.split(".")
+        if (
+            len(parts) != 3
+            or not all(IDENTIFIER.match(part) for part in parts[:2])
+            or not JSON_KEY.match(parts[2])
+        ):
+            raise ValueError(f"Invalid JSON index declaration: {declaration}")
+        return cls(*parts)
+
+    @property
+    def name(self) -> str:
+        return f"ix_json_{self.table.lower()}_{self.column}_{self.key}"
+
+    @property
+    def expression(self) -> str:
+        return f"json_extract({self.column}, '{json_path(self.key)}')"
+
+    @property
+    def ddl(self) -> str:
+        return (
+            f"CREATE INDEX IF NOT EXISTS {self.name} "
+            f"ON {self.table} ({self.expression}) "
+            f"WHERE {self.expression} IS NOT NULL;"
+        )
+
+
+def sync_json_indexes(cursor: sqlite3.Cursor, specs: Iterable[JsonIndexSpec]):
+    # Declarations are configuration, not migrations: create what is declared
+    # and drop JSON indexes that no longer are
+    declared = {spec.name: spec for spec in specs}
+    existing = [
+        row[0]
+        for row in cursor.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'index' AND name LIKE 'ix\\_json\\_%' ESCAPE '\\'"
+        )
+    ]
+    for name in existing:
+        if name not in declared:
+            cursor.execute(f"DROP INDEX {name}")
+    for spec in declared.values():
+        cursor.execute(spec.ddl)
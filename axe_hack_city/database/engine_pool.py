@@ -0,0 +1,169 @@
+# database/engine_pool.py
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import (AsyncAdaptedQueuePool, NullPool, Pool, QueuePool,
+                             SingletonThreadPool, StaticPool)
+
+from ..config.settings import Settings, settings
+
+# Settings.sqlalchemy_pool_class values:
+#   queue:            bounded pool of connections shared by all threads
+#   static:           one connection for everything; needed for :memory:
+#   singleton_thread: one connection per thread (sync engines only)
+#   null:             open and close a connection per checkout
+POOL_CLASSES: Dict[str, Type[Pool]] = {
+    "queue": QueuePool,
+    "static": StaticPool,
+    "singleton_thread": SingletonThreadPool,
+    "null": NullPool,
+}
+
+
+@dataclass
+class EnginePoolMetrics:
+    """Counters describing how an engine's connection pool is coping.
+
+    Attributes:
+        pool_class (str): Name of the pool class in use.
+        pool_size (Optional[int]): Connections kept open; None if unbounded.
+        overflow (Optional[int]): Connections open beyond ``pool_size`` now.
+        checked_out (int): Connections in use right now.
+        checkouts (int): Total successful checkouts.
+        saturated_checkouts (int): Checkouts that found every pooled
+            connection busy and had to overflow or wait.
+        timeouts (int): Checkouts that gave up after the pool timeout.
+        total_checkout_seconds (float): Time spent in checkout, waits included.
+        max_checkout_seconds (float): Longest single checkout.
+    """
+
+    pool_class: str
+    pool_size: Optional[int]
+    overflow: Optional[int]
+    checked_out: int
+    checkouts: int
+    saturated_checkouts: int
+    timeouts: int
+    total_checkout_seconds: float
+    max_checkout_seconds: float
+
+
+class _CheckoutStats:
+    # Shared by a pool and the pools recreate() makes from it on dispose()
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.saturated_checkouts = 0
+        self.timeouts = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+
+def _timed(pool_class: Type[Pool]) -> Type[Pool]:
+    # A fresh subclass per engine, so each engine keeps its own counters
+    stats = _CheckoutStats()
+
+    def connect(self):
+        saturated = isinstance(self, QueuePool) and self.checkedout() >= self.size()
+        start = time.perf_counter()
+        try:
+            connection = pool_class.connect(self)
+        except exc.TimeoutError:
+            with stats.lock:
+                stats.timeouts += 1
+            raise
+        elapsed = time.perf_counter() - start
+        with stats.lock:
+            stats.checkouts += 1
+            stats.saturated_checkouts += saturated
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+        return connection
+
+    return type(
+        f"Timed{pool_class.__name__}",
+        (pool_class,),
+        {"connect": connect, "checkout_stats": stats},
+    )
+
+
+def _is_memory_sqlite(database: Optional[str]) -> bool:
+    return not database or database == ":memory:" or "mode=memory" in database
+
+
+def engine_options(
+    database_url: str, is_async: bool = False, config: Settings = settings
+) -> Dict[str, Any]:
+    """Build the pooling arguments for ``create_engine``.
+
+    Without ``sqlalchemy_pool_class``, file SQLite databases and servers get
+    a queue pool and in-memory SQLite a static pool, since every new
+    connection to ``:memory:`` would see an empty database. SQLite
+    connections are opened with ``check_same_thread=False`` because pooled
+    connections move between threads.
+
+    Args:
+        database_url (str): The engine's database URL.
+        is_async (bool): Whether the options are for an async engine.
+        config (Settings): Settings to read the pool configuration from.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for ``create_engine`` or
+            ``create_async_engine``.
+
+    Raises:
+        ValueError: For a pool class the engine cannot use.
+    """
+    url = make_url(database_url)
+    sqlite = url.get_backend_name() == "sqlite"
+    name = config.sqlalchemy_pool_class
+    if name is None:
+        name = "static" if sqlite and _is_memory_sqlite(url.database) else "queue"
+    if is_async and name == "singleton_thread":
+        raise ValueError("singleton_thread pools cannot serve async engines")
+    pool_class = POOL_CLASSES[name]
+    if is_async and name == "queue":
+        pool_class = AsyncAdaptedQueuePool
+    options: Dict[str, Any] = {
+        "poolclass": _timed(pool_class),
+        "pool_pre_ping": config.sqlalchemy_pool_pre_ping,
+        "pool_recycle": config.sqlalchemy_pool_recycle,
+    }
+    if name == "queue":
+        options["pool_size"] = config.sqlalchemy_pool_size
+        options["max_overflow"] = config.sqlalchemy_max_overflow
+        options["pool_timeout"] = config.sqlalchemy_pool_timeout
+    if sqlite:
+        options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+def engine_pool_metrics(engine: Engine) -> EnginePoolMetrics:
+    """Return a snapshot of an engine's pool counters.
+
+    Args:
+        engine (Engine): An engine built with :func:`engine_options`; for
+            async engines pass ``async_engine.sync_engine``.
+
+    Returns:
+        EnginePoolMetrics: The current pool metrics.
+    """
+    pool = engine.pool
+    stats: _CheckoutStats = getattr(pool, "checkout_stats", _CheckoutStats())
+    queued = isinstance(pool, QueuePool)
+    with stats.lock:
+        return EnginePoolMetrics(
+            pool_class=type(pool).__name__.removeprefix("Timed"),
+            pool_size=pool.size() if queued else None,
+            overflow=max(pool.overflow(), 0) if queued else None,
+            checked_out=pool.checkedout() if queued else 0,
+            checkouts=stats.checkouts,
+            saturated_checkouts=stats.saturated_checkouts,
+            timeouts=stats.timeouts,
+            total_checkout_seconds=stats.total_seconds,
+            max_checkout_seconds=stats.max_seconds,
+        )
@@ -0,0 +1,309 @@
+# database/entity_cache.py
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import (Session, SessionTransaction,
+                            make_transient_to_detached)
+
+from ..config.settings import settings
+from .sqlalchemy_repository import SQLAlchemyRepository, T
+
+# Cross-request cache of rarely written rows (items, skills, recipes...).
+# It stores column values, never session-bound objects: a hit rebuilds the
+# entity and merges it into the caller's session without a query, so lazy
+# relationships keep working. Writes invalidate their keys at once and again
+# when the transaction ends; until then the writing session does not refill
+# them, so uncommitted values never reach other requests.
+
+_PENDING = "entity_cache_pending"
+
+# Loader options, load path and per-instance loader callables a query left
+# on an entity. None of them refers to the instance itself, so they can be
+# shared across sessions, as Session.merge does.
+LoaderState = Tuple[Any, Any, Dict[str, Any]]
+
+
+@dataclass
+class CacheMetrics:
+    """Counters describing how well an entity cache is working.
+
+    Attributes:
+        size (int): Entries cached right now.
+        max_size (int): Most entries kept before the least recently used
+            one is evicted.
+        hits (int): Reads served from memory.
+        misses (int): Reads that went to the database.
+        evictions (int): Entries dropped to stay within ``max_size``.
+        expirations (int): Entries dropped because they outlived the TTL.
+        invalidations (int): Entries dropped because they were written.
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class EntityCache:
+    """A bounded LRU cache of one model's rows with a time-to-live.
+
+    Thread-safe; one instance serves every request through :func:`get_cache`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.entity_cache_size,
+        ttl: float = settings.entity_cache_ttl_seconds,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int): Most entries kept; 0 disables caching.
+            ttl (float): Seconds an entry may be served after it was loaded.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Database reads in flight per key, as [readers, drops]. A drop while
+        # a read runs tells it the row may predate a commit; the epoch does
+        # the same for clear(). Keys leave once their last read ends.
+        self._reads: Dict[int, List[int]] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, repository: SQLAlchemyRepository[T], entity_id: int) -> Optional[T]:
+        """Read an entity through the cache.
+
+        Args:
+            repository (SQLAlchemyRepository[T]): Repository, and session,
+                to load from on a miss and to attach the entity to.
+            entity_id (int): The entity's ID.
+
+        Returns:
+            Optional[T]: The entity, persistent in the repository's session,
+                or None if it does not exist.
+        """
+        session = repository.session
+        model = repository.model
+        # The session's own copy is the freshest one for this transaction
+        key = inspect(model).identity_key_from_primary_key((entity_id,))
+        current = session.identity_map.get(key)
+        if current is not None:
+            return current
+        values = self._lookup(entity_id)
+        if values is not None:
+            return attach(session, model, values)
+        generation = self._begin_read(entity_id)
+        values = None
+        try:
+            entity = repository.get(entity_id)
+            pending = session.info.get(_PENDING, {}).get(self, ())
+            if entity is not None and entity_id not in pending:
+                values = snapshot(entity)
+        finally:
+            self._end_read(entity_id, values, generation)
+        return entity
+
+    def invalidate(self, session: Session, entity_ids: Iterable[int]) -> None:
+        """Drop written entities, now and when the session's transaction ends.
+
+        Args:
+            session (Session): The session doing the write.
+            entity_ids (Iterable[int]): IDs of the written entities.
+        """
+        entity_ids = set(entity_ids)
+        self._drop(entity_ids)
+        session.info.setdefault(_PENDING, {}).setdefault(self, set()).update(entity_ids)
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after a bulk content reload."""
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._epoch += 1
+            self._entries.clear()
+
+    def _begin_read(self, entity_id: int) -> Tuple[int, int]:
+        with self._lock:
+            read = self._reads.setdefault(entity_id, [0, 0])
+            read[0] += 1
+            return self._epoch, read[1]
+
+    def _lookup(self, entity_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(entity_id)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[entity_id]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(entity_id)
+            self._hits += 1
+            return entry[1]
+
+    def _end_read(
+        self,
+        entity_id: int,
+        values: Optional[Dict[str, Any]],
+        generation: Tuple[int, int],
+    ) -> None:
+        with self._lock:
+            read = self._reads[entity_id]
+            read[0] -= 1
+            if not read[0]:
+                del self._reads[entity_id]
+            if values is None or self.max_size <= 0:
+                return
+            # Dropped since the row was read: it may be the pre-commit one
+            if (self._epoch, read[1]) != generation:
+                return
+            self._entries[entity_id] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(entity_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _drop(self, entity_ids: Set[int]) -> None:
+        with self._lock:
+            for entity_id in entity_ids:
+                read = self._reads.get(entity_id)
+                if read is not None:
+                    read[1] += 1
+                if self._entries.pop(entity_id, None) is not None:
+                    self._invalidations += 1
+
+    def metrics(self) -> CacheMetrics:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            CacheMetrics: The current cache metrics.
+        """
+        with self._lock:
+            return CacheMetrics(
+                size=len(self._entries),
+                max_size=self.max_size,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+            )
+
+
+def snapshot(entity: Any) -> Dict[str, Any]:
+    """Copy an entity's column values so they can outlive its session.
+
+    Args:
+        entity (Any): A loaded ORM entity.
+
+    Returns:
+        Dict[str, Any]: Column values keyed by attribute; relationships are
+            left out and load lazily on the entity :func:`attach` rebuilds.
+    """
+    return copy.deepcopy(
+        {
+            attr.key: getattr(entity, attr.key)
+            for attr in inspect(entity).mapper.column_attrs
+        }
+    )
+
+
+def loader_state(entity: Any) -> LoaderState:
+    """Capture the relationship loading a query set up on an entity.
+
+    Args:
+        entity (Any): An entity loaded with loader options, e.g. a load plan.
+
+    Returns:
+        LoaderState: The options and the per-instance loaders they installed
+            (such as ``raise``), which :func:`attach` can give a rebuilt copy.
+    """
+    state = inspect(entity)
+    return state.load_options, state.load_path, dict(state.callables)
+
+
+def attach(
+    session: Session,
+    model: Type[T],
+    values: Dict[str, Any],
+    loader: Optional[LoaderState] = None,
+) -> T:
+    """Rebuild an entity from a :func:`snapshot` inside a session, without SQL.
+
+    Args:
+        session (Session): Session the entity should belong to.
+        model (Type[T]): The mapped class.
+        values (Dict[str, Any]): The snapshot; it is copied, not consumed.
+        loader (Optional[LoaderState]): Relationship loading to give the
+            entity, from :func:`loader_state`; the mapper defaults if omitted.
+
+    Returns:
+        T: The entity, persistent in ``session``; the session's own copy
+            when it already holds one.
+    """
+    key = inspect(model).identity_key_from_primary_key((values["id"],))
+    current = session.identity_map.get(key)
+    if current is not None:
+        return current
+    entity = model(**copy.deepcopy(values))
+    make_transient_to_detached(entity)
+    if loader is not None:
+        # Session.merge carries these three over to the merged instance
+        state = inspect(entity)
+        state.load_options, state.load_path, callables = loader
+        state.callables = dict(callables)
+    return session.merge(entity, load=False)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _invalidate_pending(session: Session, transaction: SessionTransaction) -> None:
+    # Runs after the outermost COMMIT or ROLLBACK: readers that refilled a
+    # key while the write was uncommitted may have cached the old row
+    if transaction.parent is None:
+        for cache, entity_ids in session.info.pop(_PENDING, {}).items():
+            cache._drop(entity_ids)
+
+
+_caches: Dict[str, EntityCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name: str) -> EntityCache:
+    """Return the process-wide cache with a given name, creating it if needed.
+
+    Args:
+        name (str): Cache name, conventionally the table name.
+
+    Returns:
+        EntityCache: The shared cache.
+    """
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = _caches[name] = EntityCache()
+        return cache
+
+
+def cache_metrics() -> Dict[str, CacheMetrics]:
+    """Return the metrics of every cache created by :func:`get_cache`.
+
+    Returns:
+        Dict[str, CacheMetrics]: Metrics keyed by cache name.
+    """
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.metrics() for name, cache in caches.items()}
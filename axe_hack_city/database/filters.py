@@ -0,0 +1,232 @@
+# database/filters.py
+import re
+from dataclasses import dataclass
+from typing import (Any, Collection, Dict, List, Optional, Sequence, Tuple,
+                    Union)
+
+from sqlalchemy import func, literal_column
+
+# Lookup suffixes accepted in list() filters, e.g. ``weight__lt=5``.
+# A bare field name means equality.
+OPERATORS = {
+    "eq": "=",
+    "ne": "!=",
+    "lt": "<",
+    "lte": "<=",
+    "gt": ">",
+    "gte": ">=",
+    "in": "IN",
+    "startswith": "LIKE",
+}
+
+# Keys allowed in ``column.key`` filters on JSON columns. They are written into
+# the SQL text, not bound, so the expression matches the declared JSON indexes.
+JSON_KEY = re.compile(r"^[A-Za-z0-9_]+$")
+
+
+def json_path(key: str) -> str:
+    """Return the ``json_extract`` path of a top-level object key.
+
+    Args:
+        key (str): A key matching :data:`JSON_KEY`.
+
+    Returns:
+        str: The path, e.g. ``$."poison"``.
+    """
+    return f'$."{key}"'
+
+
+@dataclass(frozen=True)
+class Condition:
+    """One parsed filter, such as ``traffic > 80``.
+
+    Attributes:
+        field (str): Column name.
+        operator (str): Key of :data:`OPERATORS`.
+        value (Any): Value to compare against; a sequence for ``in``.
+        key (Optional[str]): For JSON columns, compare this top-level key of
+            the stored object instead of the whole column.
+    """
+
+    field: str
+    operator: str
+    value: Any
+    key: Optional[str] = None
+
+    @property
+    def sqlite_target(self) -> str:
+        """The column, or the ``json_extract`` expression for a JSON key."""
+        if self.key is None:
+            return self.field
+        return f"json_extract({self.field}, '{json_path(self.key)}')"
+
+
+@dataclass(frozen=True)
+class Ordering:
+    """One ORDER BY term.
+
+    Attributes:
+        field (str): Column name.
+        descending (bool): Sort high to low.
+    """
+
+    field: str
+    descending: bool = False
+
+
+def parse_filters(
+    filters: Dict[str, Any],
+    columns: Collection[str],
+    json_columns: Collection[str] = (),
+) -> List[Condition]:
+    """Parse ``field`` / ``field__operator`` keyword filters.
+
+    JSON columns also accept ``field.key`` to filter on one key of the stored
+    object, e.g. ``effects.poison__gt=0``.
+
+    Args:
+        filters (Dict[str, Any]): Keyword filters as passed to ``list()``.
+        columns (Collection[str]): Column names the filters may reference.
+        json_columns (Collection[str]): Columns that accept ``field.key``.
+
+    Returns:
+        List[Condition]: The parsed conditions.
+
+    Raises:
+        ValueError: On an unknown column, operator or JSON key.
+    """
+    conditions = []
+    for name, value in filters.items():
+        field, _, operator = name.partition("__")
+        field, dot, key = field.partition(".")
+        operator = operator or "eq"
+        if field not in columns:
+            raise ValueError(f"Unknown filter field: {field}")
+        if dot and field not in json_columns:
+            raise ValueError(f"Not a JSON field: {field}")
+        if dot and not JSON_KEY.match(key):
+            raise ValueError(f"Invalid JSON key: {key}")
+        if operator not in OPERATORS:
+            raise ValueError(f"Unknown filter operator: {operator}")
+        if operator == "in":
+            value = list(value)
+        conditions.append(Condition(field, operator, value, key if dot else None))
+    return conditions
+
+
+def parse_order_by(
+    order_by: Union[str, Sequence[str], None], columns: Collection[str]
+) -> List[Ordering]:
+    """Parse ``"-value,name"`` style orderings; a leading ``-`` sorts descending.
+
+    Args:
+        order_by (Union[str, Sequence[str], None]): Comma-separated string or
+            list of field names.
+        columns (Collection[str]): Column names that may be ordered on.
+
+    Returns:
+        List[Ordering]: The parsed orderings, empty when none were given.
+
+    Raises:
+        ValueError: On an unknown column.
+    """
+    if not order_by:
+        return []
+    terms = order_by.split(",") if isinstance(order_by, str) else order_by
+    orderings = []
+    for term in terms:
+        term = term.strip()
+        if not term:
+            continue
+        ordering = Ordering(term.lstrip("-"), term.startswith("-"))
+        if ordering.field not in columns:
+            raise ValueError(f"Unknown order_by field: {ordering.field}")
+        orderings.append(ordering)
+    return orderings
+
+
+def check_keyset(orderings: List[Ordering], after: Optional[int]) -> None:
+    """Reject ``after`` cursors combined with an ordering other than by id.
+
+    Raises:
+        ValueError: If keyset pagination cannot be applied.
+    """
+    if after is not None and any(o.field != "id" or o.descending for o in orderings):
+        raise ValueError("after can only be combined with ascending id order.")
+
+
+def escape_like(prefix: str) -> str:
+    """Escape LIKE wildcards so a prefix matches literally (ESCAPE '\\')."""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def compile_sqlite(conditions: List[Condition]) -> Tuple[List[str], List[Any]]:
+    """Compile conditions into parameterized SQLite WHERE clauses.
+
+    Args:
+        conditions (List[Condition]): Parsed conditions.
+
+    Returns:
+        Tuple[List[str], List[Any]]: Clauses to AND together and their params.
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    for condition in conditions:
+        sql_operator = OPERATORS[condition.operator]
+        target = condition.sqlite_target
+        if condition.operator == "in":
+            if not condition.value:
+                clauses.append("0")
+                continue
+            placeholders = ", ".join("?" for _ in condition.value)
+            clauses.append(f"{target} IN ({placeholders})")
+            params.extend(condition.value)
+        elif condition.operator == "startswith":
+            clauses.append(f"{target} LIKE ? ESCAPE '\\'")
+            params.append(escape_like(condition.value))
+        elif condition.value is None and condition.operator in ("eq", "ne"):
+            negation = " NOT" if condition.operator == "ne" else ""
+            clauses.append(f"{target} IS{negation} NULL")
+        else:
+            clauses.append(f"{target} {sql_operator} ?")
+            params.append(condition.value)
+    return clauses, params
+
+
+def compile_sqlalchemy(model: Any, conditions: List[Condition]) -> List[Any]:
+    """Compile conditions into SQLAlchemy column expressions.
+
+    Args:
+        model (Any): The mapped model class.
+        conditions (List[Condition]): Parsed conditions.
+
+    Returns:
+        List[Any]: Expressions to pass to ``Select.where``.
+    """
+    expressions = []
+    for condition in conditions:
+        column = getattr(model, condition.field)
+        if condition.key is not None:
+            # Literal path so the expression matches the declared JSON indexes
+            path = literal_column(f"'{json_path(condition.key)}'")
+            column = func.json_extract(column, path)
+        value = condition.value
+        if condition.operator == "eq":
+            expressions.append(column.is_(None) if value is None else column == value)
+        elif condition.operator == "ne":
+            expressions.append(
+                column.is_not(None) if value is None else column != value
+            )
+        elif condition.operator == "lt":
+            expressions.append(column < value)
+        elif condition.operator == "lte":
+            expressions.append(column <= value)
+        elif condition.operator == "gt":
+            expressions.append(column > value)
+        elif condition.operator == "gte":
+            expressions.append(column >= value)
+        elif condition.operator == "in":
+            expressions.append(column.in_(value))
+        elif condition.operator == "startswith":
+            expressions.append(column.startswith(value, autoescape=True))
+    return expressions
@@ -0,0 +1,103 @@
+# database/loading.py
+from typing import Any, Dict, List, Literal, Optional, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import (ORMExecuteState, Session, joinedload, lazyload,
+                            raiseload, selectinload)
+
+# A load plan maps relationship paths to how they are fetched, e.g.
+#   {"floors": "selectin", "floors.npcs": "selectin", "*": "raise"}
+# Dotted paths walk nested relationships; a path's parents must be listed
+# too. "*" sets the strategy for every relationship not named in the plan
+# at that level ("floors.*" for the floors' own relationships).
+#   selectin: one extra SELECT ... WHERE id IN (...) per relationship
+#   joined:   LEFT OUTER JOIN into the parent query; best for many-to-one
+#   raise:    accessing the relationship raises instead of querying
+#   lazy:     the mapper default, one query per parent row on access
+Strategy = Literal["selectin", "joined", "raise", "lazy"]
+LoadPlan = Dict[str, Strategy]
+
+_LOADERS = {
+    "selectin": selectinload,
+    "joined": joinedload,
+    "raise": raiseload,
+    "lazy": lazyload,
+}
+
+
+class LazyLoadError(RuntimeError):
+    """Raised in strict loading mode when a relationship is lazy loaded."""
+
+
+def loader_options(model: Type[Any], plan: Optional[LoadPlan]) -> List[Any]:
+    """Compile a load plan into ORM loader options for a query on ``model``.
+
+    Args:
+        model (Type[Any]): The mapped class being queried.
+        plan (Optional[LoadPlan]): Relationship paths and their strategies.
+
+    Returns:
+        List[Any]: Options for ``Select.options`` or ``Session.get``.
+
+    Raises:
+        ValueError: For an unknown strategy, an unknown relationship or a
+            path whose parent is not in the plan.
+    """
+    if not plan:
+        return []
+    options: Dict[str, Any] = {}
+    targets: Dict[str, Type[Any]] = {"": model}
+    # Parents sort before their children, and "*" after named siblings
+    for path in sorted(plan, key=lambda p: (p.count("."), p.endswith("*"), p)):
+        strategy = plan[path]
+        if strategy not in _LOADERS:
+            raise ValueError(f"Unknown loading strategy for {path}: {strategy}")
+        parent, _, name = path.rpartition(".")
+        if parent not in targets:
+            raise ValueError(f"Load path {path} needs {parent} in the plan")
+        owner = targets[parent]
+        if name == "*":
+            attribute: Any = "*"
+        else:
+            relationships = owner.__mapper__.relationships
+            if name not in relationships:
+                raise ValueError(f"Unknown relationship {owner.__name__}.{name}")
+            attribute = getattr(owner, name)
+            targets[path] = relationships[name].mapper.class_
+        loader = _LOADERS[strategy]
+        options[path] = (
+            getattr(options[parent], loader.__name__)(attribute)
+            if parent
+            else loader(attribute)
+        )
+    return list(options.values())
+
+
+def _reject_lazy_load(state: ORMExecuteState) -> None:
+    if state.lazy_loaded_from is not None:
+        path = state.loader_strategy_path
+        raise LazyLoadError(
+            f"Lazy load of {path[-1] if path else 'a relationship'}; "
+            f"add it to the endpoint's load plan"
+        )
+
+
+def forbid_lazy_loads(session_class: Type[Session] = Session) -> None:
+    """Make every lazy relationship load in ``session_class`` raise.
+
+    Meant for tests and development (``sqlalchemy_strict_loading``): an
+    endpoint that touches a relationship its load plan does not cover fails
+    with :class:`LazyLoadError` instead of quietly issuing a query per row.
+
+    Args:
+        session_class (Type[Session]): Session class to watch; async
+            sessions run on ``AsyncSession.sync_session_class``.
+    """
+    if not event.contains(session_class, "do_orm_execute", _reject_lazy_load):
+        event.listen(session_class, "do_orm_execute", _reject_lazy_load)
+
+
+def allow_lazy_loads(session_class: Type[Session] = Session) -> None:
+    """Undo :func:`forbid_lazy_loads` for ``session_class``."""
+    if event.contains(session_class, "do_orm_execute", _reject_lazy_load):
+        event.remove(session_class, "do_orm_execute", _reject_lazy_load)
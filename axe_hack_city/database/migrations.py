@@ -0,0 +1,140 @@
+# database/migrations.py
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Callable, List, Set, Tuple
+
+from ..config.settings import Settings, settings
+from .create_tables import (JsonIndexSpec, create_all_tables,
+                            create_association_tables, create_indexes,
+                            sync_json_indexes)
+from .write_queue import WriteQueue
+
+# Ordered (version, step) pairs. Each step receives a cursor inside the
+# migration transaction and must not commit. Append new steps; never edit
+# or reorder ones that have shipped.
+MIGRATIONS: List[Tuple[int, Callable[[sqlite3.Cursor], None]]] = [
+    (1, create_all_tables),
+    (2, create_indexes),
+    (3, create_association_tables),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+_bootstrapped: Set[str] = set()
+_bootstrap_lock = threading.Lock()
+
+
+def current_version(connection: sqlite3.Connection) -> int:
+    """Return the highest schema version recorded in the ledger.
+
+    Args:
+        connection (sqlite3.Connection): An open database connection.
+
+    Returns:
+        int: The applied schema version, or 0 for an empty database.
+    """
+    connection.execute(
+        """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        applied_at TEXT NOT NULL
+    );
+    """
+    )
+    row = connection.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def apply_migrations(connection: sqlite3.Connection) -> int:
+    """Apply every pending migration inside an already open write transaction.
+
+    Args:
+        connection (sqlite3.Connection): A connection holding the write lock.
+
+    Returns:
+        int: The schema version after migrating.
+    """
+    applied = current_version(connection)
+    cursor = connection.cursor()
+    for version, step in MIGRATIONS:
+        if version <= applied:
+            continue
+        step(cursor)
+        cursor.execute(
+            "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+            (version, datetime.now(timezone.utc).isoformat()),
+        )
+    return SCHEMA_VERSION
+
+
+def migrate(connection: sqlite3.Connection) -> int:
+    """Apply every pending migration and record it in the schema ledger.
+
+    The steps run inside a single ``BEGIN IMMEDIATE`` transaction, so two
+    processes bootstrapping the same file cannot both apply a step.
+
+    Args:
+        connection (sqlite3.Connection): An open database connection.
+
+    Returns:
+        int: The schema version after migrating.
+    """
+    if current_version(connection) >= SCHEMA_VERSION:
+        return SCHEMA_VERSION
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-read under the write lock in case another process just migrated
+        apply_migrations(connection)
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    return SCHEMA_VERSION
+
+
+def declared_json_indexes(config: Settings = settings) -> List[JsonIndexSpec]:
+    """Parse the JSON expression indexes declared in Settings.
+
+    Args:
+        config (Settings): Settings to read ``sqlite_json_indexes`` from.
+
+    Returns:
+        List[JsonIndexSpec]: The declared indexes.
+    """
+    return [JsonIndexSpec.parse(d) for d in config.sqlite_json_indexes]
+
+
+def prepare_schema(connection: sqlite3.Connection) -> int:
+    """Migrate, then bring the declared JSON indexes in line with Settings.
+
+    Must run inside an open write transaction, like :func:`apply_migrations`.
+
+    Args:
+        connection (sqlite3.Connection): A connection holding the write lock.
+
+    Returns:
+        int: The schema version after migrating.
+    """
+    version = apply_migrations(connection)
+    sync_json_indexes(connection.cursor(), declared_json_indexes())
+    return version
+
+
+def bootstrap_schema(writer: WriteQueue) -> None:
+    """Migrate a database once per process through its write connection.
+
+    This also creates the database file, so it must run before read-only
+    connections are opened. Later calls for the same database return without
+    touching it.
+
+    Args:
+        writer (WriteQueue): Write queue for the database to bootstrap.
+    """
+    if writer.db_path in _bootstrapped:
+        return
+    with _bootstrap_lock:
+        if writer.db_path in _bootstrapped:
+            return
+        writer.execute(prepare_schema)
+        _bootstrapped.add(writer.db_path)
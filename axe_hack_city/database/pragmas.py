@@ -0,0 +1,73 @@
+# database/pragmas.py
+from typing import Any, Dict
+
+from ..config.settings import Settings, settings
+
+# Named starting points; individual sqlite_* settings override single values.
+#   safe:     rollback journal, fsync on every commit
+#   balanced: WAL with fsync at checkpoints, large page cache and mmap
+#   fast:     like balanced but never fsyncs (a power loss may lose commits)
+PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+        "foreign_keys": True,
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "foreign_keys": True,
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256000,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "foreign_keys": True,
+    },
+}
+
+
+def resolve_pragmas(config: Settings = settings) -> Dict[str, Any]:
+    """Merge the selected profile with any per-PRAGMA overrides.
+
+    Args:
+        config (Settings): Settings to read the profile and overrides from.
+
+    Returns:
+        Dict[str, Any]: PRAGMA name to value, in the order they are applied.
+    """
+    pragmas = dict(PRAGMA_PROFILES[config.sqlite_pragma_profile])
+    for name in pragmas:
+        override = getattr(config, f"sqlite_{name}")
+        if override is not None:
+            pragmas[name] = override
+    return pragmas
+
+
+def apply_pragmas(connection: Any, pragmas: Dict[str, Any]) -> None:
+    """Apply PRAGMAs to a freshly opened DB-API SQLite connection.
+
+    Values come from validated settings, never from requests, because
+    PRAGMA arguments cannot be bound as parameters.
+
+    Args:
+        connection (Any): A sqlite3 (or compatible) connection.
+        pragmas (Dict[str, Any]): PRAGMA name to value.
+    """
+    cursor = connection.cursor()
+    for name, value in pragmas.items():
+        if isinstance(value, bool):
+            value = "ON" if value else "OFF"
+        cursor.execute(f"PRAGMA {name} = {value}")
+    cursor.close()
@@ -0,0 +1,151 @@
+# database/query_plans.py
+import sqlite3
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, create_model
+
+from .associations import members_sql
+from .connection_pool import sqlite_path
+from .create_tables import ASSOCIATIONS, INDEXES, sync_json_indexes
+from .migrations import declared_json_indexes, migrate
+from .sqlite_repository import SQLiteRepository
+from .table_plan import plan_for, projection_for
+
+TABLES = [
+    "Building",
+    "Floor",
+    "Item",
+    "NPC",
+    "Character",
+    "Inventory",
+    "CraftingRecipe",
+    "Event",
+    "Faction",
+    "FloorLayout",
+    "Location",
+    "Mission",
+    "PlayerProgression",
+    "Skill",
+    "User",
+    "Street",
+]
+
+
+class QueryPlanError(AssertionError):
+    """Raised when a hot query would scan a whole table."""
+
+
+def table_model(connection: sqlite3.Connection, table: str) -> Type[BaseModel]:
+    """Build a model of a table's columns for :func:`plan_for`.
+
+    Columns with a declared JSON index are typed as dicts, so list filters
+    on their keys compile to the indexed ``json_extract`` expression.
+
+    Args:
+        connection (sqlite3.Connection): A connection to a migrated database.
+        table (str): Table name.
+
+    Returns:
+        Type[BaseModel]: A model whose ``__tablename__`` is ``table``.
+    """
+    json_columns = {s.column for s in declared_json_indexes() if s.table == table}
+    fields: Dict[str, Any] = {
+        name: (Optional[dict] if name in json_columns else Any, None)
+        for _, name, *_ in connection.execute(f"PRAGMA table_info({table})")
+    }
+    model = create_model(table, **fields)
+    model.__tablename__ = table
+    return model
+
+
+def hot_queries(connection: sqlite3.Connection) -> List[Tuple[str, List[Any]]]:
+    """Return the statements the repositories run on every request.
+
+    They are built the way SQLiteRepository builds them: a get by ID, a
+    keyset page in ID order, both projected onto one column as well, a page
+    filtered on every declared index and JSON index, and the junction table
+    reads in both directions.
+
+    Args:
+        connection (sqlite3.Connection): A connection to a migrated database.
+
+    Returns:
+        List[Tuple[str, List[Any]]]: (SQL, parameters) pairs.
+    """
+    select = SQLiteRepository._select
+    models = {table: table_model(connection, table) for table in TABLES}
+    queries: List[Tuple[str, List[Any]]] = []
+    for model in models.values():
+        plan = plan_for(model)
+        field = next(column for column in plan.columns if column != "id")
+        projection = projection_for(model, (field,))
+        for reader in (plan, projection):
+            queries.append((reader.select_by_id_sql, [1]))
+            queries.append(select(model, reader.select_sql, {}, limit=100, after=1))
+    for index in INDEXES:
+        filters = {column: 1 for column in index.columns}
+        model = models[index.table]
+        queries.append(select(model, plan_for(model).select_sql, filters, limit=100))
+    for spec in declared_json_indexes():
+        filters = {f"{spec.column}.{spec.key}__gt": 1}
+        model = models[spec.table]
+        queries.append(select(model, plan_for(model).select_sql, filters, limit=100))
+    for a in ASSOCIATIONS:
+        queries.append((members_sql(a, 2), [1, 2]))
+        # Reverse lookups ("which events is character 42 in?") use member_index
+        queries.append(
+            (f"SELECT {a.owner_key} FROM {a.table} WHERE {a.member_key} = ?", [1])
+        )
+    return queries
+
+
+def scanning_queries(connection: sqlite3.Connection) -> List[Tuple[str, str]]:
+    """Run EXPLAIN QUERY PLAN on every hot query and collect full scans.
+
+    Args:
+        connection (sqlite3.Connection): A connection to a migrated database.
+
+    Returns:
+        List[Tuple[str, str]]: (SQL, plan detail) for each query that scans.
+    """
+    offenders = []
+    for sql, params in hot_queries(connection):
+        for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}", params):
+            detail = row[-1]
+            if detail.startswith("SCAN"):
+                offenders.append((sql, detail))
+    return offenders
+
+
+def verify_query_plans(connection: sqlite3.Connection) -> None:
+    """Fail if any hot query falls back to a table or index scan.
+
+    Args:
+        connection (sqlite3.Connection): A connection to a migrated database.
+
+    Raises:
+        QueryPlanError: Listing every offending query and its plan.
+    """
+    offenders = scanning_queries(connection)
+    if offenders:
+        lines = "\n".join(f"  {sql}  ->  {detail}" for sql, detail in offenders)
+        raise QueryPlanError(f"Hot queries fall back to a SCAN:\n{lines}")
+
+
+if __name__ == "__main__":
+    # python -m axe_hack_city.database.query_plans [database]
+    # Defaults to a fresh in-memory database built from the migrations.
+    path = sqlite_path(sys.argv[1]) if len(sys.argv) > 1 else ":memory:"
+    conn = sqlite3.connect(path)
+    try:
+        migrate(conn)
+        sync_json_indexes(conn.cursor(), declared_json_indexes())
+        verify_query_plans(conn)
+        checked = len(hot_queries(conn))
+    except QueryPlanError as exc:
+        print(exc, file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+    print(f"{checked} hot queries use an index.")
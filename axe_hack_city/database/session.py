@@ -1,11 +1,62 @@
 # database/session.py
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from ..config.settings import settings
+from .engine_pool import engine_options
+from .loading import forbid_lazy_loads
+from .pragmas import apply_pragmas, resolve_pragmas
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def async_database_url(database_url: str) -> str:
+    """Swap a plain SQLite URL onto the aiosqlite driver for the async engine."""
+    url = make_url(database_url)
+    if url.drivername == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+def _configure_sqlite(engine: Engine) -> None:
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # Same PRAGMA profile as the SQLiteRepository pool
+        apply_pragmas(dbapi_connection, resolve_pragmas())
+        # The driver would defer BEGIN until the first write, so a SAVEPOINT
+        # issued earlier became the outermost transaction and its RELEASE
+        # committed the request. SQLAlchemy emits BEGIN itself instead.
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+_configure_sqlite(engine)
+
+# expire_on_commit=False keeps committed objects usable without a reload SELECT
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+async_engine = create_async_engine(
+    async_database_url(settings.database_url),
+    **engine_options(settings.database_url, is_async=True),
+)
+_configure_sqlite(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+if settings.sqlalchemy_strict_loading:
+    # Async sessions run their ORM work through a sync Session as well
+    forbid_lazy_loads(Session)
 
 
 def get_session():
@@ -14,3 +65,8 @@ def get_session():
         yield db
     finally:
         db.close()
+
+
+async def get_async_session():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,371 @@
+# database/single_flight.py
+import asyncio
+import copy
+import json
+import threading
+from dataclasses import dataclass
+from typing import (Any, Awaitable, Callable, Dict, Hashable, List, Optional,
+                    TypeVar, Union)
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+
+from .async_sqlalchemy_repository import AsyncSQLAlchemyRepository
+from .entity_cache import attach, loader_state, snapshot
+from .loading import LoadPlan
+from .sqlalchemy_repository import SQLAlchemyRepository
+
+# Request coalescing ("single flight"): when identical reads overlap, the
+# first caller runs the query and the others wait for its result instead of
+# issuing the same query again. ORM entities belong to one session, so the
+# leader hands the others column snapshots that each attaches to its own
+# session (see entity_cache.attach), along with the loaders its load plan
+# installed, so a "raise" relationship raises on every copy. Reads are not
+# coalesced when
+#   - the caller's session has written in its transaction, since it must
+#     see its own uncommitted rows, or
+#   - the load plan eager-loads relationships, whose rows are not shared.
+
+R = TypeVar("R")
+
+_WROTE = "single_flight_wrote"
+_SHAREABLE_STRATEGIES = {"raise", "lazy"}
+
+
+@dataclass
+class FlightMetrics:
+    """Counters describing how many reads were coalesced.
+
+    Attributes:
+        calls (int): Reads requested.
+        executions (int): Reads that ran a query.
+        coalesced (int): Reads served by another caller's query.
+        in_flight (int): Queries running right now.
+    """
+
+    calls: int
+    executions: int
+    coalesced: int
+    in_flight: int
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.followers = 0
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._total = 0
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(
+        self,
+        key: Hashable,
+        load: Callable[[], R],
+        share: Callable[[R], Any],
+        receive: Callable[[Any], R],
+    ) -> R:
+        """Run ``load``, or wait for the identical call already running.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            load (Callable[[], R]): Produces the result; run by the first
+                caller only.
+            share (Callable[[R], Any]): Turns the result into a value safe
+                to hand to other threads; only run when someone waited.
+            receive (Callable[[Any], R]): Turns the shared value into a
+                result for a waiting caller.
+
+        Returns:
+            R: The result. A failed call raises its error in every caller.
+        """
+        with self._lock:
+            self._total += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+            else:
+                call.followers += 1
+                self._coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return receive(call.value)
+        try:
+            result = load()
+        except BaseException as error:
+            with self._lock:
+                del self._calls[key]
+            call.error = error
+            call.done.set()
+            raise
+        # Nobody can join once the call is removed, so followers is final
+        with self._lock:
+            del self._calls[key]
+        try:
+            if call.followers:
+                call.value = share(result)
+        except Exception as error:
+            call.error = error
+        finally:
+            call.done.set()
+        return result
+
+    def metrics(self) -> FlightMetrics:
+        """Return a snapshot of the coalescing counters.
+
+        Returns:
+            FlightMetrics: The current metrics.
+        """
+        with self._lock:
+            return FlightMetrics(
+                calls=self._total,
+                executions=self._executions,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls),
+            )
+
+
+class _AsyncCall:
+    def __init__(self, future: "asyncio.Future[Any]") -> None:
+        self.future = future
+        self.followers = 0
+
+
+class AsyncSingleFlight:
+    """Runs at most one call per key at a time within each event loop."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+        self._lock = threading.Lock()
+        self._total = 0
+        self._executions = 0
+        self._coalesced = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[R]],
+        share: Callable[[R], Any],
+        receive: Callable[[Any], R],
+    ) -> R:
+        """Await ``load``, or wait for the identical call already running.
+
+        Arguments and result are as for :meth:`SingleFlight.do`. A waiting
+        caller that is cancelled leaves the running call alone; if the
+        running call is cancelled, its waiters run ``load`` themselves.
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, key)
+        with self._lock:
+            self._total += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _AsyncCall(loop.create_future())
+                self._executions += 1
+            else:
+                call.followers += 1
+                self._coalesced += 1
+        if not leader:
+            try:
+                value = await asyncio.shield(call.future)
+            except asyncio.CancelledError:
+                if not call.future.cancelled():
+                    raise
+                return await load()
+            return receive(value)
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            self._finish(key)
+            call.future.cancel()
+            raise
+        except BaseException as error:
+            self._finish(key)
+            if call.followers:
+                call.future.set_exception(error)
+            raise
+        self._finish(key)
+        if call.followers:
+            try:
+                call.future.set_result(share(result))
+            except Exception as error:
+                call.future.set_exception(error)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+    def metrics(self) -> FlightMetrics:
+        """Return a snapshot of the coalescing counters.
+
+        Returns:
+            FlightMetrics: The current metrics.
+        """
+        with self._lock:
+            return FlightMetrics(
+                calls=self._total,
+                executions=self._executions,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls),
+            )
+
+
+_flights = SingleFlight()
+_async_flights = AsyncSingleFlight()
+
+
+def single_flight_metrics() -> Dict[str, FlightMetrics]:
+    """Return the coalescing metrics of sync and async repository reads.
+
+    Returns:
+        Dict[str, FlightMetrics]: Metrics keyed by ``sync`` and ``async``.
+    """
+    return {"sync": _flights.metrics(), "async": _async_flights.metrics()}
+
+
+def _shareable(session: Session, load: Optional[LoadPlan]) -> bool:
+    if session.info.get(_WROTE) or session.new or session.dirty or session.deleted:
+        return False
+    return not load or set(load.values()) <= _SHAREABLE_STRATEGIES
+
+
+def _key(model: Any, operation: str, **arguments: Any) -> Hashable:
+    # Filters may hold lists, so the arguments are keyed by their JSON text
+    return (model, operation, json.dumps(arguments, sort_keys=True, default=repr))
+
+
+def _share(result: Any) -> Any:
+    # Session-free copy of a repository result
+    if isinstance(result, list):
+        return [_share(item) for item in result]
+    if result is None or isinstance(result, dict):
+        return copy.deepcopy(result)
+    return snapshot(result), loader_state(result)
+
+
+def _receiver(session: Session, model: Any, projected: bool) -> Callable[[Any], Any]:
+    def receive(shared: Any) -> Any:
+        if isinstance(shared, list):
+            return [receive(item) for item in shared]
+        if shared is None or projected:
+            return copy.deepcopy(shared)
+        values, loader = shared
+        return attach(session, model, values, loader)
+
+    return receive
+
+
+def coalesced_get(
+    repository: SQLAlchemyRepository[Any],
+    entity_id: int,
+    fields: Optional[List[str]] = None,
+    load: Optional[LoadPlan] = None,
+) -> Union[Any, Dict[str, Any], None]:
+    """Like ``repository.get``, sharing the query with identical concurrent reads.
+
+    Args:
+        repository (SQLAlchemyRepository[Any]): Repository to read from.
+        entity_id (int): The entity's ID.
+        fields (Optional[List[str]]): Fields to return as a dict.
+        load (Optional[LoadPlan]): How to fetch relationships.
+
+    Returns:
+        Union[Any, Dict[str, Any], None]: The entity, persistent in the
+            repository's session, its fields, or None if it does not exist.
+    """
+    session = repository.session
+    if not _shareable(session, load):
+        return repository.get(entity_id, fields, load)
+    return _flights.do(
+        _key(repository.model, "get", id=entity_id, fields=fields, load=load),
+        lambda: repository.get(entity_id, fields, load),
+        _share,
+        _receiver(session, repository.model, bool(fields)),
+    )
+
+
+def coalesced_list(repository: SQLAlchemyRepository[Any], **options: Any) -> List[Any]:
+    """Like ``repository.list``, sharing the query with identical concurrent reads.
+
+    Args:
+        repository (SQLAlchemyRepository[Any]): Repository to read from.
+        **options: Arguments and filters for ``repository.list``.
+
+    Returns:
+        List[Any]: The entities, persistent in the repository's session, or dicts
+            when ``fields`` is given.
+    """
+    session = repository.session
+    if not _shareable(session, options.get("load")):
+        return repository.list(**options)
+    return _flights.do(
+        _key(repository.model, "list", **options),
+        lambda: repository.list(**options),
+        _share,
+        _receiver(session, repository.model, bool(options.get("fields"))),
+    )
+
+
+async def async_coalesced_get(
+    repository: AsyncSQLAlchemyRepository[Any],
+    entity_id: int,
+    fields: Optional[List[str]] = None,
+    load: Optional[LoadPlan] = None,
+) -> Union[Any, Dict[str, Any], None]:
+    """Async counterpart of :func:`coalesced_get`."""
+    session = repository.session.sync_session
+    if not _shareable(session, load):
+        return await repository.get(entity_id, fields, load)
+    return await _async_flights.do(
+        _key(repository.model, "get", id=entity_id, fields=fields, load=load),
+        lambda: repository.get(entity_id, fields, load),
+        _share,
+        _receiver(session, repository.model, bool(fields)),
+    )
+
+
+async def async_coalesced_list(
+    repository: AsyncSQLAlchemyRepository[Any], **options: Any
+) -> List[Any]:
+    """Async counterpart of :func:`coalesced_list`."""
+    session = repository.session.sync_session
+    if not _shareable(session, options.get("load")):
+        return await repository.list(**options)
+    return await _async_flights.do(
+        _key(repository.model, "list", **options),
+        lambda: repository.list(**options),
+        _share,
+        _receiver(session, repository.model, bool(options.get("fields"))),
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(state: ORMExecuteState) -> None:
+    if not state.is_select:
+        state.session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session: Session, flush_context: Any) -> None:
+    session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_writes(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_WROTE, None)
@@ -1,43 +1,400 @@
 # database/sqlalchemy_repository.py
-from typing import Generic, List, Type, TypeVar
+from typing import (Any, Dict, Generic, Iterator, List, Optional, Set, Tuple,
+                    Type, TypeVar, Union)
 
-from sqlalchemy import select
+from sqlalchemy import (JSON, Delete, Insert, Select, Update, delete, insert,
+                        inspect, select, update)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
+from ..config.settings import settings
+from .batching import chunked
+from .filters import (check_keyset, compile_sqlalchemy, parse_filters,
+                      parse_order_by)
+from .loading import LoadPlan, loader_options
+
 # Define a generic type T for your SQLAlchemy models
 T = TypeVar("T")
 
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE
+UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Upsert keys: "id", or columns under a UNIQUE constraint such as "username"
+UpsertKey = Union[str, Tuple[str, ...]]
+
+
+class SQLAlchemyStatements(Generic[T]):
+    """Statement building shared by the sync and async repositories."""
+
+    model: Type[T]
+
+    def _column_values(self, entity: T) -> Dict[str, Any]:
+        """Collects an entity's column attributes, leaving unset IDs to the DB."""
+        values = {
+            attr.key: getattr(entity, attr.key)
+            for attr in inspect(self.model).column_attrs
+        }
+        if values.get("id") is None:
+            values.pop("id", None)
+        return values
+
+    def _changed_values(self, entity: T) -> Dict[str, Any]:
+        """Collects the column attributes set on an entity, except its ID."""
+        state = inspect(entity)
+        return {
+            attr.key: state.dict[attr.key]
+            for attr in inspect(self.model).column_attrs
+            if attr.key != "id" and attr.key in state.dict
+        }
+
+    def _update_statement(self, entity: T, values: Dict[str, Any]) -> Update:
+        """Builds one UPDATE of the given columns that returns the stored row."""
+        return (
+            update(self.model)
+            .where(self.model.id == entity.id)
+            .values(values)
+            .returning(self.model)
+        )
+
+    def _existing_ids(self, entities: List[T]) -> Select:
+        """Builds a SELECT of the entities' IDs that are stored."""
+        return select(self.model.id).where(self.model.id.in_([e.id for e in entities]))
+
+    def _update_rows(
+        self, entities: List[T], existing: Set[int]
+    ) -> List[Dict[str, Any]]:
+        """Builds bulk UPDATE rows for the stored entities that set any column."""
+        rows = []
+        for entity in entities:
+            values = self._changed_values(entity)
+            if values and entity.id in existing:
+                rows.append({"id": entity.id, **values})
+        return rows
+
+    def _upsert_values(
+        self, entity: T, key: Tuple[str, ...]
+    ) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+        """Splits an entity into the row to insert and the columns set on it."""
+        row = self._column_values(entity)
+        missing = [column for column in key if row.get(column) is None]
+        if missing:
+            raise ValueError(f"Upsert key not set: {', '.join(missing)}")
+        updated = tuple(c for c in self._changed_values(entity) if c not in key)
+        return row, updated
+
+    def _upsert_statement(
+        self, dialect: str, key: Tuple[str, ...], updated: Tuple[str, ...]
+    ) -> Insert:
+        """Builds an INSERT that writes ``updated`` over rows whose key exists."""
+        if dialect not in UPSERT_INSERTS:
+            raise ValueError(f"Upserts are not supported on {dialect}")
+        statement = UPSERT_INSERTS[dialect](self.model)
+        # With nothing else to update, rewriting the key still returns the row
+        return statement.on_conflict_do_update(
+            index_elements=list(key),
+            set_={column: statement.excluded[column] for column in updated or key},
+        )
+
+    def _upsert_batches(
+        self, dialect: str, entities: List[T], key: Tuple[str, ...]
+    ) -> List[Tuple[Insert, List[Tuple[int, Dict[str, Any]]]]]:
+        """Groups entities setting the same columns under one bulk upsert.
+
+        Each statement returns ``id`` and the key, since rows of one
+        multi-row INSERT come back in no particular order.
+        """
+        groups: Dict[Tuple[Any, ...], List[Tuple[int, Dict[str, Any]]]] = {}
+        for position, entity in enumerate(entities):
+            row, updated = self._upsert_values(entity, key)
+            groups.setdefault((tuple(row), updated), []).append((position, row))
+        returned = [self.model.id] + [getattr(self.model, c) for c in key]
+        return [
+            (self._upsert_statement(dialect, key, updated).returning(*returned), rows)
+            for (_, updated), rows in groups.items()
+        ]
+
+    def _columns(self, fields: List[str]) -> List[Any]:
+        """Resolves field names to mapped columns, always including the ID."""
+        mapped = {attr.key: attr for attr in inspect(self.model).column_attrs}
+        unknown = set(fields) - set(mapped)
+        if unknown:
+            raise ValueError(
+                f"Unknown fields for {self.model.__name__}: "
+                f"{', '.join(sorted(unknown))}"
+            )
+        names = ["id"] + [name for name in mapped if name in fields and name != "id"]
+        return [getattr(self.model, name) for name in names]
+
+    def _select(
+        self, fields: Optional[List[str]], load: Optional[LoadPlan] = None
+    ) -> Select:
+        """Selects whole entities loaded per ``load``, or only some columns."""
+        if fields:
+            return select(*self._columns(fields))
+        return select(self.model).options(*loader_options(self.model, load))
+
+    def _filtered(
+        self,
+        query: Select,
+        filters: Dict[str, Any],
+        order_by: Union[str, List[str], None] = None,
+        after: Optional[int] = None,
+    ) -> Select:
+        """Applies filters, ordering (ID breaks ties) and the keyset cursor."""
+        orderings = parse_order_by(order_by, inspect(self.model).column_attrs.keys())
+        check_keyset(orderings, after)
+        conditions = self._conditions(filters)
+        if after is not None:
+            conditions.append(self.model.id > after)
+        terms = [
+            (
+                getattr(self.model, o.field).desc()
+                if o.descending
+                else getattr(self.model, o.field)
+            )
+            for o in orderings
+        ]
+        if "id" not in (o.field for o in orderings):
+            terms.append(self.model.id)
+        return query.where(*conditions).order_by(*terms)
+
+    def _conditions(self, filters: Dict[str, Any]) -> List[Any]:
+        """Compiles ``field`` / ``field__op`` filters into WHERE criteria."""
+        attrs = inspect(self.model).column_attrs
+        json_columns = [
+            attr.key
+            for attr in attrs
+            if any(isinstance(c.type, JSON) for c in attr.columns)
+        ]
+        return compile_sqlalchemy(
+            self.model, parse_filters(filters, attrs.keys(), json_columns)
+        )
+
+    def _delete_chunk(self, filters: Dict[str, Any], chunk_size: int) -> Delete:
+        """Builds a DELETE of the first ``chunk_size`` matching IDs."""
+        if not filters:
+            raise ValueError("delete_where needs at least one filter")
+        ids = (
+            select(self.model.id)
+            .where(*self._conditions(filters))
+            .order_by(self.model.id)
+            .limit(chunk_size)
+        )
+        return delete(self.model).where(self.model.id.in_(ids))
+
+    def _list_query(
+        self,
+        limit: Optional[int],
+        after: Optional[int],
+        fields: Optional[List[str]],
+        order_by: Union[str, List[str], None],
+        filters: Dict[str, Any],
+        load: Optional[LoadPlan] = None,
+    ) -> Select:
+        """Builds the SELECT behind ``list()``."""
+        query = self._filtered(self._select(fields, load), filters, order_by, after)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+
+class SQLAlchemyRepository(SQLAlchemyStatements[T]):
+    """CRUD over one model, flushing writes without committing them.
+
+    The caller owns the transaction, normally the request's unit of work
+    (see ``database/unit_of_work.py``).
+    """
 
-class SQLAlchemyRepository(Generic[T]):
     def __init__(self, session: Session, model: Type[T]):
         self.session = session
         self.model = model
 
     def create(self, entity: T) -> T:
-        """Creates a new record in the database."""
+        """Creates a new record in the database.
+
+        The flush's INSERT reports generated values itself (RETURNING, or the
+        row ID for a plain integer key), so no refresh SELECT follows.
+        """
         self.session.add(entity)
-        self.session.commit()
-        self.session.refresh(entity)
+        self.session.flush()
         return entity
 
-    def get(self, entity_id: int) -> T:
-        """Fetches a record by its ID."""
-        return self.session.get(self.model, entity_id)
+    def create_many(
+        self, entities: List[T], chunk_size: int = settings.bulk_chunk_size
+    ) -> List[int]:
+        """Bulk inserts records in chunks and returns their IDs."""
+        ids: List[int] = []
+        statement = insert(self.model).returning(
+            self.model.id, sort_by_parameter_order=True
+        )
+        for chunk in chunked(entities, chunk_size):
+            rows = [self._column_values(entity) for entity in chunk]
+            ids.extend(self.session.scalars(statement, rows).all())
+        return ids
 
-    def update(self, entity: T) -> T:
-        """Updates an existing record."""
-        self.session.merge(entity)
-        self.session.commit()
-        return entity
+    def get(
+        self,
+        entity_id: int,
+        fields: Optional[List[str]] = None,
+        load: Optional[LoadPlan] = None,
+    ) -> Union[T, Dict[str, Any], None]:
+        """Fetches a record by its ID, as a dict of ``fields`` when given.
+
+        ``load`` sets how relationships are fetched; see ``database/loading.py``.
+        """
+        if not fields:
+            return self.session.get(
+                self.model, entity_id, options=loader_options(self.model, load)
+            )
+        query = select(*self._columns(fields)).where(self.model.id == entity_id)
+        row = self.session.execute(query).mappings().first()
+        return dict(row) if row else None
+
+    def update(self, entity: T) -> Optional[T]:
+        """Updates the columns set on an entity, returning the stored record."""
+        if inspect(entity).persistent:
+            # Loaded in this session: the flush writes only modified columns
+            self.session.flush()
+            return entity
+        values = self._changed_values(entity)
+        if not values:
+            return self.get(entity.id)
+        return self.session.scalars(self._update_statement(entity, values)).first()
+
+    def update_many(
+        self, entities: List[T], chunk_size: int = settings.bulk_chunk_size
+    ) -> int:
+        """Bulk updates the set columns by primary key in chunks, skipping IDs
+        that are not stored; returns the number of rows updated.
+        """
+        updated = 0
+        for chunk in chunked(entities, chunk_size):
+            existing = set(self.session.scalars(self._existing_ids(chunk)))
+            rows = self._update_rows(chunk, existing)
+            if rows:
+                self.session.execute(update(self.model), rows)
+            updated += len(rows)
+        return updated
+
+    def upsert(self, entity: T, key: UpsertKey = "id") -> T:
+        """Inserts a record, or writes the columns set on it over the record
+        with the same ``key`` (``id``, or columns under a UNIQUE constraint).
+        """
+        key = (key,) if isinstance(key, str) else tuple(key)
+        row, updated = self._upsert_values(entity, key)
+        statement = (
+            self._upsert_statement(self.session.get_bind().dialect.name, key, updated)
+            .values(row)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return self.session.scalars(statement).one()
+
+    def upsert_many(
+        self,
+        entities: List[T],
+        key: UpsertKey = "id",
+        chunk_size: int = settings.bulk_chunk_size,
+    ) -> List[int]:
+        """Bulk upserts records, one statement per chunk, returning their IDs
+        in input order.
+        """
+        key = (key,) if isinstance(key, str) else tuple(key)
+        dialect = self.session.get_bind().dialect.name
+        ids: List[int] = [0] * len(entities)
+        for statement, rows in self._upsert_batches(dialect, entities, key):
+            for chunk in chunked(rows, chunk_size):
+                result = self.session.execute(statement, [row for _, row in chunk])
+                stored = {tuple(returned[1:]): returned[0] for returned in result}
+                for position, row in chunk:
+                    ids[position] = stored[tuple(row[c] for c in key)]
+        return ids
+
+    def delete(self, entity_id: int) -> int:
+        """Deletes a record by its ID with one DELETE, returning the row count.
+
+        The record is not loaded, so ORM-side cascades do not run; dependent
+        rows rely on the database's ON DELETE rules.
+        """
+        result = self.session.execute(
+            delete(self.model).where(self.model.id == entity_id)
+        )
+        return result.rowcount
+
+    def delete_many(
+        self, entity_ids: List[int], chunk_size: int = settings.bulk_chunk_size
+    ) -> int:
+        """Deletes records by ID in chunks and returns the count."""
+        deleted = 0
+        for chunk in chunked(entity_ids, chunk_size):
+            result = self.session.execute(
+                delete(self.model).where(self.model.id.in_(chunk)),
+                execution_options={"synchronize_session": False},
+            )
+            deleted += result.rowcount
+        return deleted
+
+    def delete_where(
+        self, chunk_size: int = settings.bulk_chunk_size, **filters
+    ) -> int:
+        """Deletes every record matching ``filters`` and returns the count.
+
+        Rows go ``chunk_size`` at a time. On a session with no open transaction,
+        such as a maintenance job's, each chunk is committed so the write lock
+        is released between chunks; inside a unit of work they all share it.
+        """
+        statement = self._delete_chunk(filters, chunk_size)
+        commit_chunks = not self.session.in_transaction()
+        deleted = 0
+        while True:
+            result = self.session.execute(
+                statement, execution_options={"synchronize_session": False}
+            )
+            if commit_chunks:
+                self.session.commit()
+            deleted += result.rowcount
+            if result.rowcount < chunk_size:
+                return deleted
+
+    def list(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        order_by: Union[str, List[str], None] = None,
+        load: Optional[LoadPlan] = None,
+        **filters,
+    ) -> List[Union[T, Dict[str, Any]]]:
+        """Fetches a page of filtered, ordered records, resuming after ``after``.
+
+        Filters take ``field=value`` or ``field__op=value``; see
+        ``database/filters.py`` for the operators. ``load`` sets how
+        relationships are fetched; see ``database/loading.py``.
+        """
+        query = self._list_query(limit, after, fields, order_by, filters, load)
+        if fields:
+            return [dict(row) for row in self.session.execute(query).mappings()]
+        # unique() folds the duplicate rows of joined collection loads
+        return self.session.scalars(query).unique().all()
+
+    def stream(
+        self,
+        batch_size: int = settings.stream_batch_size,
+        fields: Optional[List[str]] = None,
+        order_by: Union[str, List[str], None] = None,
+        load: Optional[LoadPlan] = None,
+        **filters,
+    ) -> Iterator[Union[T, Dict[str, Any]]]:
+        """Yields matching records, loading ``batch_size`` rows at a time.
 
-    def delete(self, entity_id: int) -> None:
-        """Deletes a record by its ID."""
-        entity = self.get(entity_id)
-        if entity:
-            self.session.delete(entity)
-            self.session.commit()
-
-    def list(self, **filters) -> List[T]:
-        """Fetches a list of records with optional filters."""
-        query = self.session.execute(select(self.model).filter_by(**filters))
-        return query.scalars().all()
+        Joined loading of collections cannot be combined with batching; use
+        selectin, which loads the relationships once per batch.
+        """
+        query = self._filtered(
+            self._select(fields, load), filters, order_by
+        ).execution_options(yield_per=batch_size)
+        if fields:
+            for row in self.session.execute(query).mappings():
+                yield dict(row)
+        else:
+            yield from self.session.scalars(query)
@@ -1,115 +1,379 @@
 # database/sqlite_repository.py
-import json
-import sqlite3
-from typing import Any, List, Type
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type,
+                    Union)
 
 from pydantic import BaseModel
 
 from ..config.settings import settings
-from .create_tables import create_tables
+from .associations import attach_members, replace_members
+from .batching import chunked
+from .connection_pool import SQLiteConnectionPool, get_pool
+from .filters import (check_keyset, compile_sqlite, parse_filters,
+                      parse_order_by)
+from .migrations import bootstrap_schema
+from .table_plan import (Projection, TablePlan, Upsert, partial_update_for,
+                         plan_for, projection_for, upsert_for)
+from .write_queue import WriteQueue, get_writer
 
 
 class SQLiteRepository:
-    def __init__(self, db_path: str = settings.database_url):
+    def __init__(
+        self,
+        db_path: str = settings.database_url,
+        pool: Optional[SQLiteConnectionPool] = None,
+        writer: Optional[WriteQueue] = None,
+    ):
         self.db_path = db_path
+        # Reads borrow read-only connections from a shared pool
+        self.pool = pool or get_pool(db_path)
+        # Writes go through one thread that group-commits concurrent callers
+        self.writer = writer or get_writer(db_path)
         self.create_tables()
 
     def create_tables(self):
-        # Use the imported create_tables function to create the necessary tables
-        with sqlite3.connect(self.db_path) as conn:
-            create_tables(conn)
+        # Migrates the schema on first use; a no-op once this process has done so
+        bootstrap_schema(self.writer)
 
     def create(self, model: Type[BaseModel]) -> BaseModel:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Get the table name from the model class
-            table_name = model.__class__.__name__.lower() + "s"
-            # Build the INSERT query dynamically based on the model's fields
-            fields = ", ".join(model.model_fields.keys())
-            placeholders = ", ".join(["?" for _ in model.model_fields])
-            query = f"INSERT INTO {table_name} ({fields}) VALUES ({placeholders})"
-            # Convert the model instance to a list of values (handle JSON serialization)
-            values = [
-                json.dumps(value) if isinstance(value, (list, dict)) else value
-                for value in model.model_dump().values()
-            ]
-            cursor.execute(query, values)
-            conn.commit()
-            # Retrieve the newly created record and return it as a model instance
-            record_id = cursor.lastrowid
-            return self.get(model.__class__, record_id)
-
-    def get(self, model: Type[BaseModel], id: int) -> BaseModel:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Get the table name from the model class
-            table_name = model.__name__.lower() + "s"
-            query = f"SELECT * FROM {table_name} WHERE id = ?"
-            cursor.execute(query, (id,))
-            row = cursor.fetchone()
-            if row:
-                # Convert the row to a dictionary and deserialize JSON fields
-                data = {
-                    field: (
-                        json.loads(value)
-                        if isinstance(model.model_fields[field].type_, (list, dict))
-                        else value
-                    )
-                    for field, value in zip(model.model_fields, row)
-                }
-                return model(**data)
-            else:
+        plan = plan_for(model.__class__)
+        params = plan.encode(model)
+
+        # RETURNING hands back the stored row, so no follow-up SELECT is needed
+        def insert(conn) -> List[Any]:
+            row = list(conn.execute(plan.insert_sql, params).fetchone())
+            self._write_members(conn, plan, model, row[plan.columns.index("id")])
+            return row
+
+        row = self.writer.execute(insert)
+        for index, _ in plan.associations:
+            row[index] = getattr(model, plan.columns[index]) or []
+        return plan.decode(row)
+
+    def create_many(
+        self, models: List[BaseModel], chunk_size: int = settings.bulk_chunk_size
+    ) -> List[int]:
+        if not models:
+            return []
+        plan = plan_for(models[0].__class__)
+
+        # One multi-row INSERT per chunk, all in one transaction. RETURNING
+        # order is unspecified, but AUTOINCREMENT hands out increasing ids
+        # in VALUES order, so the sorted ids line up with the chunk
+        def insert(conn) -> List[int]:
+            ids: List[int] = []
+            for chunk in chunked(models, chunk_size):
+                params = [value for m in chunk for value in plan.encode_auto_id(m)]
+                rows = conn.execute(plan.insert_auto_id_sql(len(chunk)), params)
+                chunk_ids = sorted(id for (id,) in rows)
+                if plan.associations:
+                    for m, id in zip(chunk, chunk_ids):
+                        self._write_members(conn, plan, m, id)
+                ids.extend(chunk_ids)
+            return ids
+
+        return self.writer.execute(insert)
+
+    def get(
+        self, model: Type[BaseModel], id: int, fields: Optional[List[str]] = None
+    ) -> Union[BaseModel, Dict[str, Any], None]:
+        # With fields, only those columns are read and a dict is returned
+        reader = self._reader(model, fields)
+        with self.pool.connection() as conn:
+            row = conn.execute(reader.select_by_id_sql, (id,)).fetchone()
+            if row is None:
                 return None
+            return self._decode(conn, reader, [row])[0]
 
-    def update(self, model: BaseModel) -> BaseModel:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Get the table name from the model class
-            table_name = model.__class__.__name__.lower() + "s"
-            # Build the UPDATE query dynamically based on the model's fields
-            set_clause = ", ".join(f"{field} = ?" for field in model.model_fields)
-            query = f"UPDATE {table_name} SET {set_clause} WHERE id = ?"
-            # Convert the model instance to a list of values (handle JSON serialization)
-            values = [
-                json.dumps(value) if isinstance(value, (list, dict)) else value
-                for value in model.model_dump().values()
-            ] + [model.id]
-            cursor.execute(query, values)
-            conn.commit()
-            return model
-
-    def delete(self, model: Type[BaseModel], id: int) -> None:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Get the table name from the model class
-            table_name = model.__name__.lower() + "s"
-            query = f"DELETE FROM {table_name} WHERE id = ?"
-            cursor.execute(query, (id,))
-            conn.commit()
-
-    def list(self, model: Type[BaseModel], **filters) -> List[BaseModel]:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Get the table name from the model class
-            table_name = model.__name__.lower() + "s"
-            # Build the SELECT query dynamically based on the filters
-            where_clause = " AND ".join(f"{field} = ?" for field in filters)
-            query = f"SELECT * FROM {table_name}"
-            if where_clause:
-                query += f" WHERE {where_clause}"
-            # Execute the query and convert the rows to model instances
-            cursor.execute(query, list(filters.values()))
-            rows = cursor.fetchall()
-            return [
-                model(
-                    **{
-                        field: (
-                            json.loads(value)
-                            if isinstance(model.model_fields[field].type_, (list, dict))
-                            else value
+    def update(
+        self, model: BaseModel, fields: Optional[Iterable[str]] = None
+    ) -> Optional[BaseModel]:
+        # Writes only the fields set on the model (or the given ones) and
+        # returns the stored row, or None if there is no row with that id
+        plan = plan_for(model.__class__)
+        changed = self._changed(plan, model, fields)
+        if not changed:
+            return self.get(model.__class__, model.id)
+        partial = partial_update_for(model.__class__, changed)
+        params = partial.encode(model) + [model.id]
+
+        def update(conn) -> Optional[BaseModel]:
+            row = conn.execute(partial.update_returning_sql, params).fetchone()
+            if row is None:
+                return None
+            self._write_members(conn, plan, model, model.id, changed)
+            return self._decode(conn, plan, [row])[0]
+
+        return self.writer.execute(update)
+
+    def update_many(
+        self, models: List[BaseModel], chunk_size: int = settings.bulk_chunk_size
+    ) -> int:
+        if not models:
+            return 0
+        plan = plan_for(models[0].__class__)
+        # Models setting the same fields share one UPDATE statement
+        groups: Dict[Tuple[str, ...], List[BaseModel]] = {}
+        for m in models:
+            changed = self._changed(plan, m, None)
+            if changed:
+                groups.setdefault(changed, []).append(m)
+
+        # Ids with no row are skipped, along with their members, whose
+        # junction rows would reference a missing owner
+        def update(conn) -> int:
+            updated = 0
+            for changed, group in groups.items():
+                partial = partial_update_for(plan.model, changed)
+                for chunk in chunked(group, chunk_size):
+                    placeholders = ", ".join("?" for _ in chunk)
+                    existing = {
+                        id
+                        for (id,) in conn.execute(
+                            f"SELECT id FROM {plan.table_name} "
+                            f"WHERE id IN ({placeholders})",
+                            [m.id for m in chunk],
                         )
-                        for field, value in zip(model.model_fields, row)
                     }
-                )
-                for row in rows
-            ]
+                    chunk = [m for m in chunk if m.id in existing]
+                    cursor = conn.executemany(
+                        partial.update_sql,
+                        (partial.encode(m) + [m.id] for m in chunk),
+                    )
+                    updated += cursor.rowcount
+                    if plan.associations:
+                        for m in chunk:
+                            self._write_members(conn, plan, m, m.id, changed)
+            return updated
+
+        return self.writer.execute(update)
+
+    def upsert(
+        self, model: BaseModel, key: Union[str, Tuple[str, ...]] = "id"
+    ) -> BaseModel:
+        # Inserts the model, or writes the fields set on it over the row with
+        # the same key (id, or columns under a UNIQUE constraint); returns the row
+        plan = plan_for(model.__class__)
+        upsert = self._upsert(plan, model, key)
+        params = upsert.encode(model)
+        # A new row has no members yet, so writing only the lists set on the
+        # model suits both outcomes
+        changed = self._changed(plan, model, None)
+
+        def write(conn) -> BaseModel:
+            row = conn.execute(upsert.upsert_sql, params).fetchone()
+            id = row[plan.columns.index("id")]
+            self._write_members(conn, plan, model, id, changed)
+            return self._decode(conn, plan, [row])[0]
+
+        return self.writer.execute(write)
+
+    def upsert_many(
+        self,
+        models: List[BaseModel],
+        key: Union[str, Tuple[str, ...]] = "id",
+        chunk_size: int = settings.bulk_chunk_size,
+    ) -> List[int]:
+        if not models:
+            return []
+        plan = plan_for(models[0].__class__)
+        # Models setting the same fields share one statement shape
+        groups: Dict[Upsert, List[Tuple[int, BaseModel]]] = {}
+        for position, m in enumerate(models):
+            groups.setdefault(self._upsert(plan, m, key), []).append((position, m))
+
+        # One multi-row INSERT ... ON CONFLICT per chunk, all in one transaction
+        def write(conn) -> List[int]:
+            ids: List[int] = [0] * len(models)
+            for upsert, group in groups.items():
+                for chunk in chunked(group, chunk_size):
+                    params = [value for _, m in chunk for value in upsert.encode(m)]
+                    rows = conn.execute(upsert.batch_sql(len(chunk)), params)
+                    # RETURNING order is unspecified, so match rows by key
+                    stored = {tuple(row[1:]): row[0] for row in rows}
+                    for position, m in chunk:
+                        id = stored[tuple(getattr(m, c) for c in upsert.key)]
+                        ids[position] = id
+                        if plan.associations:
+                            changed = self._changed(plan, m, None)
+                            self._write_members(conn, plan, m, id, changed)
+            return ids
+
+        return self.writer.execute(write)
+
+    def delete(self, model: Type[BaseModel], id: int) -> int:
+        # Junction rows go with their owner through ON DELETE CASCADE
+        plan = plan_for(model)
+        return self.writer.execute(
+            lambda conn: conn.execute(plan.delete_sql, (id,)).rowcount
+        )
+
+    def delete_many(
+        self,
+        model: Type[BaseModel],
+        ids: List[int],
+        chunk_size: int = settings.bulk_chunk_size,
+    ) -> int:
+        plan = plan_for(model)
+
+        def delete(conn) -> int:
+            deleted = 0
+            for chunk in chunked(ids, chunk_size):
+                cursor = conn.executemany(plan.delete_sql, ((id,) for id in chunk))
+                deleted += cursor.rowcount
+            return deleted
+
+        return self.writer.execute(delete)
+
+    def delete_where(
+        self,
+        model: Type[BaseModel],
+        chunk_size: int = settings.bulk_chunk_size,
+        **filters,
+    ) -> int:
+        # Each chunk is its own write, so other writers get the lock in between
+        if not filters:
+            raise ValueError("delete_where needs at least one filter")
+        plan = plan_for(model)
+        ids, params = self._select(
+            model, f"SELECT id FROM {plan.table_name}", filters, limit=chunk_size
+        )
+        query = f"DELETE FROM {plan.table_name} WHERE id IN ({ids})"
+        deleted = 0
+        while True:
+            count = self.writer.execute(
+                lambda conn: conn.execute(query, params).rowcount
+            )
+            deleted += count
+            if count < chunk_size:
+                return deleted
+
+    def list(
+        self,
+        model: Type[BaseModel],
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        order_by: Union[str, List[str], None] = None,
+        **filters,
+    ) -> List[Union[BaseModel, Dict[str, Any]]]:
+        # filters take field=value or field__op=value, see database/filters.py
+        reader = self._reader(model, fields)
+        query, params = self._select(
+            model, reader.select_sql, filters, order_by, limit, after
+        )
+        with self.pool.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+            return self._decode(conn, reader, rows)
+
+    def stream(
+        self,
+        model: Type[BaseModel],
+        batch_size: int = settings.stream_batch_size,
+        fields: Optional[List[str]] = None,
+        order_by: Union[str, List[str], None] = None,
+        **filters,
+    ) -> Iterator[Union[BaseModel, Dict[str, Any]]]:
+        # Holds one pooled connection until the generator is exhausted or closed
+        reader = self._reader(model, fields)
+        query, params = self._select(model, reader.select_sql, filters, order_by)
+        with self.pool.connection() as conn:
+            cursor = conn.execute(query, params)
+            while rows := cursor.fetchmany(batch_size):
+                yield from self._decode(conn, reader, rows)
+
+    @staticmethod
+    def _changed(
+        plan: TablePlan, model: BaseModel, fields: Optional[Iterable[str]]
+    ) -> Tuple[str, ...]:
+        # Pydantic tracks the fields set at construction or by assignment
+        dirty = set(model.model_fields_set if fields is None else fields)
+        unknown = dirty - set(plan.columns)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        return tuple(c for c in plan.columns if c in dirty and c != "id")
+
+    @classmethod
+    def _upsert(
+        cls, plan: TablePlan, model: BaseModel, key: Union[str, Tuple[str, ...]]
+    ) -> Upsert:
+        # Existing rows only get the fields set on the model
+        return upsert_for(
+            plan.model,
+            (key,) if isinstance(key, str) else tuple(key),
+            cls._changed(plan, model, None),
+            getattr(model, "id", None) is not None,
+        )
+
+    @staticmethod
+    def _write_members(
+        conn,
+        plan: TablePlan,
+        model: BaseModel,
+        id: int,
+        columns: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        # List columns backed by junction tables are stored outside the row
+        for index, association in plan.associations:
+            column = plan.columns[index]
+            if columns is None or column in columns:
+                replace_members(conn, association, id, getattr(model, column))
+
+    @staticmethod
+    def _decode(
+        conn, reader: Union[TablePlan, Projection], rows: List[Any]
+    ) -> List[Union[BaseModel, Dict[str, Any]]]:
+        if reader.associations:
+            id_index = reader.columns.index("id")
+            rows = attach_members(conn, reader.associations, id_index, rows)
+        decode = reader.decode
+        return [decode(row) for row in rows]
+
+    @staticmethod
+    def _reader(
+        model: Type[BaseModel], fields: Optional[List[str]]
+    ) -> Union[TablePlan, Projection]:
+        # Both expose select_sql, select_by_id_sql and decode
+        if fields:
+            return projection_for(model, tuple(fields))
+        return plan_for(model)
+
+    @staticmethod
+    def _select(
+        model: Type[BaseModel],
+        select_sql: str,
+        filters: Dict[str, Any],
+        order_by: Union[str, List[str], None] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> Tuple[str, List[Any]]:
+        # Only the WHERE/ORDER BY/LIMIT tail depends on the call
+        plan = plan_for(model)
+        columns = plan.columns
+        orderings = parse_order_by(order_by, columns)
+        check_keyset(orderings, after)
+        # json_extract cannot read binary-encoded columns
+        json_columns = [
+            columns[index]
+            for index in plan.json_columns
+            if columns[index] not in plan.binary_columns
+        ]
+        conditions = parse_filters(filters, columns, json_columns)
+        clauses, params = compile_sqlite(conditions)
+        # Keyset pagination: resume after the last id the caller has seen
+        if after is not None:
+            clauses.append("id > ?")
+            params.append(after)
+        query = select_sql
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        terms = [f"{o.field} DESC" if o.descending else o.field for o in orderings]
+        # id breaks ties so pages are stable. With a JSON key filter, +id stops
+        # the planner from preferring an id-ordered scan over the JSON index.
+        if "id" not in (o.field for o in orderings):
+            json_filtered = any(c.key is not None for c in conditions)
+            terms.append("+id" if json_filtered else "id")
+        query += " ORDER BY " + ", ".join(terms)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query, params
@@ -0,0 +1,439 @@
+# database/table_plan.py
+import types
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (Any, Callable, Dict, List, Sequence, Tuple, Type, Union,
+                    get_args, get_origin)
+
+from pydantic import BaseModel
+
+from .associations import association_for
+from .codecs import Encoded, codec_for, decode_value, encoder_for
+from .create_tables import AssociationSpec
+
+JSON_TYPES = (list, dict, tuple, set)
+
+
+def is_json_annotation(annotation: Any) -> bool:
+    """Tell whether a field annotation is stored as a JSON TEXT column.
+
+    ``Optional[...]`` and other unions count as JSON when any member does.
+
+    Args:
+        annotation (Any): The field's type annotation.
+
+    Returns:
+        bool: True for list, dict, tuple and set annotations.
+    """
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        return any(is_json_annotation(arg) for arg in get_args(annotation))
+    return (origin or annotation) in JSON_TYPES
+
+
+@dataclass(frozen=True)
+class TablePlan:
+    """Everything SQLiteRepository needs to query one model, computed once.
+
+    Attributes:
+        model (Type[BaseModel]): The model class the plan was built for.
+        table_name (str): Table backing the model.
+        columns (Tuple[str, ...]): Column names in model field order.
+        json_columns (Tuple[int, ...]): Positions of structured (list/dict)
+            columns stored with a codec.
+        encoders (Tuple[Callable[[Any], Encoded], ...]): Codec encoder of each
+            structured column, aligned with ``json_columns``.
+        binary_columns (Tuple[str, ...]): Structured columns written in a
+            binary codec, which SQL-side ``json_extract`` cannot read.
+        associations (Tuple[Tuple[int, AssociationSpec], ...]): Positions of
+            list columns stored in junction tables, with their association.
+        insert_sql (str): INSERT for every column, returning the stored row.
+        insert_auto_id_prefix (str): ``INSERT INTO ... VALUES`` of every
+            column except ``id``, for batches whose ids the database assigns.
+        auto_id_placeholders (str): Placeholder tuple of one such row.
+        select_sql (str): SELECT of every column, without a WHERE clause.
+        select_by_id_sql (str): SELECT of every column for one id.
+        update_sql (str): UPDATE of every column for one id.
+        delete_sql (str): DELETE for one id.
+        decode (Callable[[Sequence[Any]], BaseModel]): Row to model decoder.
+    """
+
+    model: Type[BaseModel]
+    table_name: str
+    columns: Tuple[str, ...]
+    json_columns: Tuple[int, ...]
+    encoders: Tuple[Callable[[Any], Encoded], ...]
+    binary_columns: Tuple[str, ...]
+    associations: Tuple[Tuple[int, AssociationSpec], ...]
+    insert_sql: str
+    insert_auto_id_prefix: str
+    auto_id_placeholders: str
+    select_sql: str
+    select_by_id_sql: str
+    update_sql: str
+    delete_sql: str
+    decode: Callable[[Sequence[Any]], BaseModel]
+
+    def encode(self, entity: BaseModel) -> List[Any]:
+        """Convert a model instance into bind values in column order.
+
+        Args:
+            entity (BaseModel): The instance to encode.
+
+        Returns:
+            List[Any]: Values with structured columns encoded and association
+                columns cleared; the repository writes those separately.
+        """
+        data = entity.model_dump()
+        values = [data[column] for column in self.columns]
+        for index, encode in zip(self.json_columns, self.encoders):
+            if values[index] is not None:
+                values[index] = encode(values[index])
+        for index, _ in self.associations:
+            values[index] = None
+        return values
+
+    def encode_auto_id(self, entity: BaseModel) -> List[Any]:
+        """Like :meth:`encode` but leaves ``id`` out for the database to assign.
+
+        Args:
+            entity (BaseModel): The instance to encode.
+
+        Returns:
+            List[Any]: Values matching :attr:`auto_id_placeholders`.
+        """
+        values = self.encode(entity)
+        if "id" in self.columns:
+            del values[self.columns.index("id")]
+        return values
+
+    def insert_auto_id_sql(self, rows: int) -> str:
+        """Build the insert of ``rows`` rows as one multi-row INSERT.
+
+        Args:
+            rows (int): Number of rows in the batch.
+
+        Returns:
+            str: The statement, returning the ``id`` assigned to each row.
+        """
+        values = ", ".join(self.auto_id_placeholders for _ in range(rows))
+        return f"{self.insert_auto_id_prefix}{values} RETURNING id"
+
+
+@dataclass(frozen=True)
+class Projection:
+    """A column subset of a table plan, used for sparse fieldsets.
+
+    Attributes:
+        columns (Tuple[str, ...]): Selected columns; ``id`` always comes first.
+        associations (Tuple[Tuple[int, AssociationSpec], ...]): Positions of
+            selected list columns stored in junction tables.
+        select_sql (str): SELECT of the selected columns, without a WHERE clause.
+        select_by_id_sql (str): SELECT of the selected columns for one id.
+        decode (Callable[[Sequence[Any]], Dict[str, Any]]): Row to dict decoder
+            that only decodes the selected structured columns.
+    """
+
+    columns: Tuple[str, ...]
+    associations: Tuple[Tuple[int, AssociationSpec], ...]
+    select_sql: str
+    select_by_id_sql: str
+    decode: Callable[[Sequence[Any]], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class PartialUpdate:
+    """An UPDATE of some columns of a table plan, used for dirty-field updates.
+
+    Attributes:
+        columns (Tuple[str, ...]): Updated columns, in model order.
+        update_sql (str): UPDATE of those columns for one id.
+        update_returning_sql (str): Like ``update_sql`` but returning every
+            column of the stored row.
+        encode (Callable[[BaseModel], List[Any]]): Instance to bind values for
+            the updated columns only.
+    """
+
+    columns: Tuple[str, ...]
+    update_sql: str
+    update_returning_sql: str
+    encode: Callable[[BaseModel], List[Any]]
+
+
+@dataclass(frozen=True)
+class Upsert:
+    """An INSERT ... ON CONFLICT DO UPDATE of some columns of a table plan.
+
+    Attributes:
+        columns (Tuple[str, ...]): Inserted columns, in model order; every
+            column, less ``id`` when the database assigns it.
+        key (Tuple[str, ...]): Conflict target, ``id`` or UNIQUE columns.
+        upsert_sql (str): Upsert of one row, returning every column of the
+            stored row.
+        encode (Callable[[BaseModel], List[Any]]): Instance to bind values for
+            the inserted columns.
+        insert_prefix (str): ``INSERT INTO ... VALUES`` of a batch upsert.
+        row_placeholders (str): Placeholder tuple of one row of a batch.
+        batch_suffix (str): ON CONFLICT clause of a batch upsert, returning
+            ``id`` and the key.
+    """
+
+    columns: Tuple[str, ...]
+    key: Tuple[str, ...]
+    upsert_sql: str
+    encode: Callable[[BaseModel], List[Any]]
+    insert_prefix: str
+    row_placeholders: str
+    batch_suffix: str
+
+    def batch_sql(self, rows: int) -> str:
+        """Build the upsert of ``rows`` rows as one multi-row INSERT.
+
+        Args:
+            rows (int): Number of rows in the batch.
+
+        Returns:
+            str: The statement, returning ``id`` and the key of each row.
+        """
+        values = ", ".join(self.row_placeholders for _ in range(rows))
+        return f"{self.insert_prefix}{values}{self.batch_suffix}"
+
+
+def _make_column_encoder(
+    plan: TablePlan, columns: Tuple[str, ...]
+) -> Callable[[BaseModel], List[Any]]:
+    # Only the given fields are dumped and encoded; association columns
+    # are cleared since junction tables store them
+    encoders = dict(zip(plan.json_columns, plan.encoders))
+    association_columns = {plan.columns[index] for index, _ in plan.associations}
+    slots = tuple(
+        (column, encoders.get(plan.columns.index(column)))
+        for column in columns
+        if column not in association_columns
+    )
+    include = {column for column, _ in slots}
+
+    def encode(entity: BaseModel) -> List[Any]:
+        data = entity.model_dump(include=include)
+        encoded = {}
+        for column, encoder in slots:
+            value = data[column]
+            if encoder is not None and value is not None:
+                value = encoder(value)
+            encoded[column] = value
+        return [encoded.get(column) for column in columns]
+
+    return encode
+
+
+def _make_decoder(
+    factory: Callable[..., Any],
+    columns: Tuple[str, ...],
+    json_columns: Tuple[int, ...],
+) -> Callable[[Sequence[Any]], Any]:
+    # factory is the model class, or dict for projections
+    loads = decode_value
+    if not json_columns:
+        return lambda row: factory(**dict(zip(columns, row)))
+
+    def decode(row: Sequence[Any]) -> Any:
+        values = list(row)
+        for index in json_columns:
+            if values[index] is not None:
+                values[index] = loads(values[index])
+        return factory(**dict(zip(columns, values)))
+
+    return decode
+
+
+@lru_cache(maxsize=None)
+def plan_for(model: Type[BaseModel]) -> TablePlan:
+    """Build, or fetch the cached, table plan for a model class.
+
+    Args:
+        model (Type[BaseModel]): The model class.
+
+    Returns:
+        TablePlan: The compiled plan.
+    """
+    # An explicit __tablename__, as on the ORM models, names the table
+    table_name = getattr(model, "__tablename__", None)
+    if not isinstance(table_name, str):
+        table_name = model.__name__.lower() + "s"
+    columns = tuple(model.model_fields)
+    associations = tuple(
+        (index, association)
+        for index, column in enumerate(columns)
+        if (association := association_for(table_name, column)) is not None
+    )
+    association_columns = {index for index, _ in associations}
+    json_columns = tuple(
+        index
+        for index, field in enumerate(model.model_fields.values())
+        if is_json_annotation(field.annotation) and index not in association_columns
+    )
+    column_list = ", ".join(columns)
+    placeholders = ", ".join("?" for _ in columns)
+    auto_id_columns = [column for column in columns if column != "id"]
+    set_clause = ", ".join(f"{column} = ?" for column in columns)
+    return TablePlan(
+        model=model,
+        table_name=table_name,
+        columns=columns,
+        json_columns=json_columns,
+        encoders=tuple(encoder_for(table_name, columns[i]) for i in json_columns),
+        binary_columns=tuple(
+            columns[i]
+            for i in json_columns
+            if codec_for(table_name, columns[i]) != "json"
+        ),
+        associations=associations,
+        insert_sql=(
+            f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders}) "
+            f"RETURNING {column_list}"
+        ),
+        insert_auto_id_prefix=(
+            f"INSERT INTO {table_name} ({', '.join(auto_id_columns)}) VALUES "
+        ),
+        auto_id_placeholders=f"({', '.join('?' for _ in auto_id_columns)})",
+        select_sql=f"SELECT {column_list} FROM {table_name}",
+        select_by_id_sql=f"SELECT {column_list} FROM {table_name} WHERE id = ?",
+        update_sql=f"UPDATE {table_name} SET {set_clause} WHERE id = ?",
+        delete_sql=f"DELETE FROM {table_name} WHERE id = ?",
+        decode=_make_decoder(model, columns, json_columns),
+    )
+
+
+@lru_cache(maxsize=256)
+def projection_for(model: Type[BaseModel], fields: Tuple[str, ...]) -> Projection:
+    """Build, or fetch the cached, projection of a model onto some fields.
+
+    Args:
+        model (Type[BaseModel]): The model class.
+        fields (Tuple[str, ...]): Requested field names.
+
+    Returns:
+        Projection: The compiled projection.
+
+    Raises:
+        ValueError: If a requested field is not a column of the model.
+    """
+    plan = plan_for(model)
+    unknown = set(fields) - set(plan.columns)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields for {model.__name__}: {', '.join(sorted(unknown))}"
+        )
+    # Keep model order so equivalent requests share the same SQL text
+    columns = ("id",) + tuple(
+        column for column in plan.columns if column in fields and column != "id"
+    )
+    json_columns = tuple(
+        index
+        for index, column in enumerate(columns)
+        if plan.columns.index(column) in plan.json_columns
+    )
+    associations = tuple(
+        (columns.index(plan.columns[index]), association)
+        for index, association in plan.associations
+        if plan.columns[index] in columns
+    )
+    column_list = ", ".join(columns)
+    return Projection(
+        columns=columns,
+        associations=associations,
+        select_sql=f"SELECT {column_list} FROM {plan.table_name}",
+        select_by_id_sql=(f"SELECT {column_list} FROM {plan.table_name} WHERE id = ?"),
+        decode=_make_decoder(dict, columns, json_columns),
+    )
+
+
+@lru_cache(maxsize=256)
+def partial_update_for(
+    model: Type[BaseModel], fields: Tuple[str, ...]
+) -> PartialUpdate:
+    """Build, or fetch the cached, UPDATE of a model's given fields.
+
+    Args:
+        model (Type[BaseModel]): The model class.
+        fields (Tuple[str, ...]): Fields to write; ``id`` is never updated.
+
+    Returns:
+        PartialUpdate: The compiled partial update.
+
+    Raises:
+        ValueError: If a field is not a column of the model.
+    """
+    plan = plan_for(model)
+    unknown = set(fields) - set(plan.columns)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields for {model.__name__}: {', '.join(sorted(unknown))}"
+        )
+    columns = tuple(c for c in plan.columns if c in fields and c != "id")
+    set_clause = ", ".join(f"{column} = ?" for column in columns)
+    update_sql = f"UPDATE {plan.table_name} SET {set_clause} WHERE id = ?"
+    return PartialUpdate(
+        columns=columns,
+        update_sql=update_sql,
+        update_returning_sql=f"{update_sql} RETURNING {', '.join(plan.columns)}",
+        encode=_make_column_encoder(plan, columns),
+    )
+
+
+@lru_cache(maxsize=256)
+def upsert_for(
+    model: Type[BaseModel],
+    key: Tuple[str, ...],
+    updated: Tuple[str, ...],
+    with_id: bool,
+) -> Upsert:
+    """Build, or fetch the cached, upsert of a model keyed on some columns.
+
+    New rows are inserted whole, like ``create``; existing rows only get the
+    ``updated`` fields written. ``key`` must be ``id`` or columns under a
+    UNIQUE constraint, such as ``User.username``.
+
+    Args:
+        model (Type[BaseModel]): The model class.
+        key (Tuple[str, ...]): Columns identifying existing rows.
+        updated (Tuple[str, ...]): Fields to write on existing rows.
+        with_id (bool): Whether rows carry their ``id``; otherwise new rows
+            get one from the database.
+
+    Returns:
+        Upsert: The compiled upsert.
+
+    Raises:
+        ValueError: If a key or updated field is not a column of the model,
+            or the key is ``id`` but rows have none.
+    """
+    plan = plan_for(model)
+    unknown = (set(key) | set(updated)) - set(plan.columns)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields for {model.__name__}: {', '.join(sorted(unknown))}"
+        )
+    if "id" in key and not with_id:
+        raise ValueError("Upserting on id needs every row to have one")
+    columns = tuple(c for c in plan.columns if with_id or c != "id")
+    # Updated association columns are set to None: their lists go to the
+    # junction tables, and a legacy JSON value must not shadow them
+    assignments = [c for c in plan.columns if c in updated and c not in key + ("id",)]
+    # With nothing else to update, rewriting the key still returns the row
+    set_clause = ", ".join(f"{c} = excluded.{c}" for c in assignments or key)
+    conflict = f" ON CONFLICT ({', '.join(key)}) DO UPDATE SET {set_clause}"
+    insert_prefix = f"INSERT INTO {plan.table_name} ({', '.join(columns)}) VALUES "
+    row_placeholders = f"({', '.join('?' for _ in columns)})"
+    return Upsert(
+        columns=columns,
+        key=key,
+        upsert_sql=(
+            f"{insert_prefix}{row_placeholders}{conflict} "
+            f"RETURNING {', '.join(plan.columns)}"
+        ),
+        encode=_make_column_encoder(plan, columns),
+        insert_prefix=insert_prefix,
+        row_placeholders=row_placeholders,
+        batch_suffix=f"{conflict} RETURNING {', '.join(('id',) + key)}",
+    )
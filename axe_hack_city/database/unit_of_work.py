@@ -0,0 +1,70 @@
+# database/unit_of_work.py
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .session import AsyncSessionLocal, SessionLocal
+
+# One transaction per request: repositories only flush, and the request's
+# unit of work commits once after the endpoint returns, or rolls everything
+# back if it raised. The FastAPI we pin (0.115) runs the exit code of yield
+# dependencies before sending the response, so a failed commit still turns
+# into an error response:
+#
+#     session: Session = Depends(unit_of_work)
+
+
+def unit_of_work() -> Iterator[Session]:
+    """FastAPI dependency yielding a session inside one request transaction.
+
+    Yields:
+        Session: A session with an open transaction, committed when the
+            endpoint returns and rolled back if it raises.
+    """
+    with SessionLocal() as session, session.begin():
+        yield session
+
+
+async def async_unit_of_work() -> AsyncIterator[AsyncSession]:
+    """Async counterpart of :func:`unit_of_work`.
+
+    Yields:
+        AsyncSession: A session with an open transaction, committed when
+            the endpoint returns and rolled back if it raises.
+    """
+    async with AsyncSessionLocal() as session, session.begin():
+        yield session
+
+
+@contextmanager
+def savepoint(session: Session) -> Iterator[Session]:
+    """Opt-in nested transaction for a step that may fail on its own.
+
+    If the block raises, only its changes are rolled back (ROLLBACK TO
+    SAVEPOINT) and the exception propagates; the caller may catch it and
+    carry on with the request's transaction.
+
+    Args:
+        session (Session): The unit of work's session.
+
+    Yields:
+        Session: The same session, now inside the savepoint.
+    """
+    with session.begin_nested():
+        yield session
+
+
+@asynccontextmanager
+async def async_savepoint(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Async counterpart of :func:`savepoint`.
+
+    Args:
+        session (AsyncSession): The unit of work's session.
+
+    Yields:
+        AsyncSession: The same session, now inside the savepoint.
+    """
+    async with session.begin_nested():
+        yield session
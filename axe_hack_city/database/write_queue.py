@@ -0,0 +1,252 @@
+# database/write_queue.py
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from queue import Empty, Queue
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from ..config.settings import settings
+from .connection_pool import sqlite_path
+from .pragmas import apply_pragmas, resolve_pragmas
+
+R = TypeVar("R")
+
+# An operation runs inside the writer's open transaction and must not commit
+WriteOperation = Callable[[sqlite3.Connection], R]
+
+_STOP = object()
+
+
+@dataclass
+class WriterMetrics:
+    """Counters describing how well writes are being grouped.
+
+    Attributes:
+        writes (int): Operations executed by the writer.
+        failed_writes (int): Operations that raised and were rolled back.
+        commits (int): Transactions committed; one per batch.
+        largest_batch (int): Most operations ever shared by one commit.
+        queued (int): Operations waiting for the writer right now.
+    """
+
+    writes: int
+    failed_writes: int
+    commits: int
+    largest_batch: int
+    queued: int
+
+
+class WriteQueue:
+    """Serializes every write to one database through a single thread.
+
+    SQLite allows one writer at a time, so instead of each caller opening a
+    transaction and racing for the lock, callers submit operations here.
+    The writer thread takes everything that arrives within a short window,
+    runs it in one transaction and commits once. Each operation runs under
+    its own savepoint, so a failing one is rolled back without affecting
+    the rest of its batch.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        window: float = settings.sqlite_write_window_ms / 1000,
+        max_batch: int = settings.sqlite_write_batch_size,
+        pragmas: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize the queue. The writer thread starts on first submit.
+
+        Args:
+            db_path (str): Database URL or file path.
+            window (float): Seconds to wait for more writes after the first
+                one of a batch arrives.
+            max_batch (int): Most operations committed together.
+            pragmas (Optional[Dict[str, Any]]): PRAGMAs for the write
+                connection; defaults to the profile configured in Settings.
+        """
+        self.db_path = sqlite_path(db_path)
+        self.window = window
+        self.max_batch = max_batch
+        self.pragmas = resolve_pragmas() if pragmas is None else pragmas
+        self._queue: Queue = Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._writes = 0
+        self._failed_writes = 0
+        self._commits = 0
+        self._largest_batch = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: the writer issues BEGIN/SAVEPOINT/COMMIT itself
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        apply_pragmas(conn, self.pragmas)
+        return conn
+
+    def submit(self, operation: WriteOperation) -> "Future[R]":
+        """Queue an operation for the writer thread.
+
+        Async callers can await the result with ``asyncio.wrap_future``.
+
+        Args:
+            operation (WriteOperation): Called with the write connection
+                inside an open transaction; its return value resolves the
+                future once the batch has committed.
+
+        Returns:
+            Future[R]: Resolved with the operation's result, or with its
+                exception (or the commit's) if the write did not persist.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write queue is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sqlite-writer", daemon=True
+                )
+                self._thread.start()
+            self._queue.put((operation, future))
+        return future
+
+    def execute(self, operation: WriteOperation) -> R:
+        """Queue an operation and block until its batch has committed.
+
+        Args:
+            operation (WriteOperation): See :meth:`submit`.
+
+        Returns:
+            R: The operation's result.
+        """
+        return self.submit(operation).result()
+
+    def _run(self) -> None:
+        conn = self._connect()
+        try:
+            stopping = False
+            while not stopping:
+                job = self._queue.get()
+                if job is _STOP:
+                    break
+                batch = [job]
+                deadline = time.monotonic() + self.window
+                while len(batch) < self.max_batch:
+                    try:
+                        job = self._queue.get(
+                            timeout=max(deadline - time.monotonic(), 0)
+                        )
+                    except Empty:
+                        break
+                    if job is _STOP:
+                        stopping = True
+                        break
+                    batch.append(job)
+                self._commit(conn, batch)
+        finally:
+            conn.close()
+
+    def _commit(
+        self, conn: sqlite3.Connection, batch: List[Tuple[WriteOperation, Future]]
+    ) -> None:
+        outcomes: List[Tuple[Future, Any, Optional[BaseException]]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for operation, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                conn.execute("SAVEPOINT write")
+                try:
+                    result = operation(conn)
+                except Exception as exc:
+                    conn.execute("ROLLBACK TO write")
+                    conn.execute("RELEASE write")
+                    outcomes.append((future, None, exc))
+                else:
+                    conn.execute("RELEASE write")
+                    outcomes.append((future, result, None))
+            conn.execute("COMMIT")
+        except Exception as exc:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            # Nothing in the batch persisted, so every caller gets the error
+            for operation, future in batch:
+                if future.running():
+                    future.set_exception(exc)
+                elif not future.done():
+                    future.set_running_or_notify_cancel()
+                    future.set_exception(exc)
+            with self._lock:
+                self._failed_writes += len(batch)
+            return
+        failed = 0
+        for future, result, exc in outcomes:
+            if exc is None:
+                future.set_result(result)
+            else:
+                failed += 1
+                future.set_exception(exc)
+        with self._lock:
+            self._writes += len(outcomes)
+            self._failed_writes += failed
+            self._commits += 1
+            self._largest_batch = max(self._largest_batch, len(outcomes))
+
+    def metrics(self) -> WriterMetrics:
+        """Return a snapshot of the writer counters.
+
+        Returns:
+            WriterMetrics: The current writer metrics.
+        """
+        with self._lock:
+            return WriterMetrics(
+                writes=self._writes,
+                failed_writes=self._failed_writes,
+                commits=self._commits,
+                largest_batch=self._largest_batch,
+                queued=self._queue.qsize(),
+            )
+
+    def close(self) -> None:
+        """Finish every queued write, then stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+
+_writers: Dict[str, WriteQueue] = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(db_path: str = settings.database_url) -> WriteQueue:
+    """Return the process-wide write queue for a database, creating it if needed.
+
+    Args:
+        db_path (str): Database URL or file path.
+
+    Returns:
+        WriteQueue: The shared write queue for that database.
+    """
+    key = sqlite_path(db_path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = WriteQueue(db_path)
+        return writer
+
+
+def close_writers() -> None:
+    """Drain and stop every write queue opened by :func:`get_writer`."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
@@ -4,9 +4,30 @@ from pathlib import Path
 # Add the parent directory to the path
 sys.path.append(str(Path(__file__).resolve().parent))
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-app = FastAPI()
+from .config.settings import settings
+from .database.connection_pool import close_pools
+from .database.migrations import bootstrap_schema
+from .database.session import async_engine
+from .database.write_queue import close_writers, get_writer
+from .models.base import configure_models
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Migrate and configure mappers on startup; drain writes and close on shutdown."""
+    configure_models()
+    bootstrap_schema(get_writer(settings.database_url))
+    yield
+    close_writers()
+    close_pools()
+    await async_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Importing routers
 from .routers.authentication_router import router as authentication_router
@@ -21,10 +42,12 @@ from .routers.game_session_router import router as game_session_router
 from .routers.inventory_router import router as inventory_router
 from .routers.item_router import router as item_router
 from .routers.location_router import router as location_router
+from .routers.metrics_router import router as metrics_router
 from .routers.mission_router import router as mission_router
 from .routers.npc_router import router as npc_router
 from .routers.progression_router import router as progression_router
 from .routers.skill_router import router as skill_router
+from .routers.street_router import router as street_router
 from .routers.user_router import router as user_router
 
 # Including routers with prefixes and tags
@@ -40,6 +63,7 @@ app.include_router(
     progression_router, prefix="/api/progressions", tags=["progressions"]
 )
 app.include_router(skill_router, prefix="/api/skills", tags=["skills"])
+app.include_router(street_router, prefix="/api/streets", tags=["streets"])
 app.include_router(building_router, prefix="/api/buildings", tags=["buildings"])
 app.include_router(character_router, prefix="/api/characters", tags=["characters"])
 app.include_router(crafting_router, prefix="/api/crafting", tags=["crafting"])
@@ -49,6 +73,7 @@ app.include_router(
     floor_layout_router, prefix="/api/floor-layouts", tags=["floor layouts"]
 )
 app.include_router(floor_router, prefix="/api/floors", tags=["floors"])
+app.include_router(metrics_router, prefix="/api/metrics", tags=["metrics"])
 
 # Run the application
 if __name__ == "__main__":
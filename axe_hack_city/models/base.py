@@ -0,0 +1,70 @@
+# models/base.py
+from importlib import import_module
+
+from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy.orm import configure_mappers, declarative_base
+
+# Every ORM model derives from this one Base, so string targets such as
+# relationship("Floor") resolve within a single registry and metadata and
+# can be loaded with JOINs instead of one query per relationship.
+Base = declarative_base()
+
+# Modules defining mapped classes, imported by configure_models()
+MODEL_MODULES = (
+    "building_model",
+    "character_model",
+    "crafting_model",
+    "event_model",
+    "faction_model",
+    "floor_layout_model",
+    "floor_model",
+    "inventory_model",
+    "item_model",
+    "location_model",
+    "mission_model",
+    "npc_model",
+    "progression_model",
+    "skill_model",
+    "street_model",
+    "user_model",
+)
+
+
+def association_table(
+    name: str, left_key: str, left: str, right_key: str, right: str
+) -> Table:
+    """Declare a many-to-many link table on the shared metadata.
+
+    Args:
+        name (str): Table name.
+        left_key (str): Column holding the first ID.
+        left (str): ``table.column`` the first ID references.
+        right_key (str): Column holding the second ID.
+        right (str): ``table.column`` the second ID references.
+
+    Returns:
+        Table: The link table, keyed on both columns.
+    """
+    return Table(
+        name,
+        Base.metadata,
+        Column(left_key, ForeignKey(left, ondelete="CASCADE"), primary_key=True),
+        Column(right_key, ForeignKey(right, ondelete="CASCADE"), primary_key=True),
+    )
+
+
+def configure_models() -> None:
+    """Import every model and configure all mappers.
+
+    Mappers are otherwise configured lazily by the first query, which hides
+    broken relationships until then and pays the cost inside a request. Run
+    this once at startup instead.
+
+    Raises:
+        sqlalchemy.exc.InvalidRequestError: If a relationship cannot be
+            resolved.
+    """
+    for module in MODEL_MODULES:
+        import_module(f"{__package__}.{module}")
+
+    configure_mappers()
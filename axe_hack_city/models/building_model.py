@@ -1,9 +1,12 @@
 # models/building_model.py
 from sqlalchemy import Column, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base, association_table
+
+building_entrances = association_table(
+    "building_entrances", "building_id", "buildings.id", "location_id", "locations.id"
+)
 
 
 class Building(Base):
@@ -25,6 +28,11 @@ class Building(Base):
 
     # Relationships
     floors = relationship("Floor", back_populates="building")
-    entrances = relationship("Location", back_populates="connected_buildings")
+    entrances = relationship(
+        "Location", secondary=building_entrances, back_populates="connected_buildings"
+    )
+    connected_streets = relationship(
+        "Street", secondary="street_buildings", back_populates="connected_buildings"
+    )
     loot = relationship("Item", back_populates="building")
     npcs = relationship("NPC", back_populates="building")
@@ -1,17 +1,9 @@
 # models/character_model.py
-from enum import Enum
-
-from sqlalchemy import ARRAY, Column, ForeignKey, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import ARRAY, Column, Enum, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
-
-
-class SkillType(Enum):
-    """Enumeration of possible skill types."""
-
-    # Add the skill types here
+from .base import Base
+from .skill_model import SkillType
 
 
 class Character(Base):
@@ -40,3 +32,9 @@ class Character(Base):
     inventory_id: int = Column(Integer, ForeignKey("inventories.id"))
 
     inventory = relationship("Inventory", back_populates="characters")
+    events = relationship(
+        "Event", secondary="event_characters", back_populates="participants"
+    )
+    progression = relationship(
+        "PlayerProgression", back_populates="character", uselist=False
+    )
@@ -1,9 +1,12 @@
 # models/crafting_model.py
 from sqlalchemy import Column, ForeignKey, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base, association_table
+
+crafting_recipe_items = association_table(
+    "crafting_recipe_items", "recipe_id", "crafting_recipes.id", "item_id", "items.id"
+)
 
 
 class CraftingRecipe(Base):
@@ -21,7 +24,9 @@ class CraftingRecipe(Base):
     name: str = Column(String)
     description: str = Column(String)
 
-    ingredients = relationship("Item", back_populates="crafting_recipes")
+    ingredients = relationship(
+        "Item", secondary=crafting_recipe_items, back_populates="crafting_recipes"
+    )
     output_id: int = Column(Integer, ForeignKey("items.id"))
     skill_required_id: int = Column(Integer, ForeignKey("skills.id"))
 
@@ -1,9 +1,12 @@
 # models/event_model.py
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base, association_table
+
+event_characters = association_table(
+    "event_characters", "event_id", "events.id", "character_id", "characters.id"
+)
 
 
 class Event(Base):
@@ -28,4 +31,6 @@ class Event(Base):
     end_time: DateTime = Column(DateTime)
 
     location = relationship("Location", back_populates="events")
-    participants = relationship("Character", back_populates="events")
+    participants = relationship(
+        "Character", secondary=event_characters, back_populates="events"
+    )
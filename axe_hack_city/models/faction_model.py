@@ -1,9 +1,15 @@
 # models/faction_model.py
 from sqlalchemy import Column, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base, association_table
+
+faction_alliances = association_table(
+    "faction_alliances", "faction_id", "factions.id", "ally_id", "factions.id"
+)
+faction_rivalries = association_table(
+    "faction_rivalries", "faction_id", "factions.id", "enemy_id", "factions.id"
+)
 
 
 class Faction(Base):
@@ -23,6 +29,16 @@ class Faction(Base):
     description: str = Column(String)
     reputation: int = Column(Integer)
 
-    allies = relationship("Faction", back_populates="enemies")
-    enemies = relationship("Faction", back_populates="allies")
+    allies = relationship(
+        "Faction",
+        secondary=faction_alliances,
+        primaryjoin=id == faction_alliances.c.faction_id,
+        secondaryjoin=id == faction_alliances.c.ally_id,
+    )
+    enemies = relationship(
+        "Faction",
+        secondary=faction_rivalries,
+        primaryjoin=id == faction_rivalries.c.faction_id,
+        secondaryjoin=id == faction_rivalries.c.enemy_id,
+    )
     npcs = relationship("NPC", back_populates="faction")
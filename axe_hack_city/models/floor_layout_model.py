@@ -1,9 +1,8 @@
 # models/floor_layout_model.py
 from sqlalchemy import ARRAY, Column, Float, ForeignKey, Integer
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base
 
 
 class Wall(Base):
@@ -13,7 +12,7 @@ class Wall(Base):
         id (int): Unique identifier for the wall.
         start (list[float]): Starting coordinates of the wall.
         end (list[float]): Ending coordinates of the wall.
-        floor_id (int): ID of the associated floor.
+        layout_id (int): ID of the associated floor layout.
     """
 
     __tablename__ = "walls"
@@ -21,9 +20,9 @@ class Wall(Base):
     id: int = Column(Integer, primary_key=True, index=True)
     start: list[float] = Column(ARRAY(Float))
     end: list[float] = Column(ARRAY(Float))
-    floor_id: int = Column(Integer, ForeignKey("floors.id"))
+    layout_id: int = Column(Integer, ForeignKey("floor_layouts.id"))
 
-    floor = relationship("Floor", back_populates="walls")
+    layout = relationship("FloorLayout", back_populates="walls")
 
 
 class Door(Base):
@@ -33,7 +32,7 @@ class Door(Base):
         id (int): Unique identifier for the door.
         position (list[float]): Position of the door.
         width (float): Width of the door.
-        floor_id (int): ID of the associated floor.
+        layout_id (int): ID of the associated floor layout.
     """
 
     __tablename__ = "doors"
@@ -41,9 +40,9 @@ class Door(Base):
     id: int = Column(Integer, primary_key=True, index=True)
     position: list[float] = Column(ARRAY(Float))
     width: float = Column(Float)
-    floor_id: int = Column(Integer, ForeignKey("floors.id"))
+    layout_id: int = Column(Integer, ForeignKey("floor_layouts.id"))
 
-    floor = relationship("Floor", back_populates="doors")
+    layout = relationship("FloorLayout", back_populates="doors")
 
 
 class FloorLayout(Base):
@@ -56,5 +55,6 @@ class FloorLayout(Base):
     __tablename__ = "floor_layouts"
 
     id: int = Column(Integer, primary_key=True, index=True)
-    walls = relationship("Wall", back_populates="floor")
-    doors = relationship("Door", back_populates="floor")
+    walls = relationship("Wall", back_populates="layout")
+    doors = relationship("Door", back_populates="layout")
+    floors = relationship("Floor", back_populates="layout")
@@ -1,9 +1,8 @@
 # models/floor_model.py
 from sqlalchemy import Column, ForeignKey, Integer
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base
 
 
 class Floor(Base):
@@ -13,6 +12,7 @@ class Floor(Base):
         id (int): Unique identifier for the floor.
         number (int): Floor number.
         layout_id (int): ID of the associated layout.
+        building_id (int): ID of the building the floor belongs to.
     """
 
     __tablename__ = "floors"
@@ -20,7 +20,9 @@ class Floor(Base):
     id: int = Column(Integer, primary_key=True, index=True)
     number: int = Column(Integer)
     layout_id: int = Column(Integer, ForeignKey("floor_layouts.id"))
+    building_id: int = Column(Integer, ForeignKey("buildings.id"))
 
-    layout = relationship("FloorLayout", back_populates="floor")
+    layout = relationship("FloorLayout", back_populates="floors")
+    building = relationship("Building", back_populates="floors")
     loot = relationship("Item", back_populates="floor")
     npcs = relationship("NPC", back_populates="floor")
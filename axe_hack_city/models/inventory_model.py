@@ -1,12 +1,10 @@
 # models/inventory_model.py
 from sqlalchemy import Column, Float, ForeignKey, Integer
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
+from .base import Base
 from .item_model import Item
 
-Base = declarative_base()
-
 
 class Inventory(Base):
     """Represents an inventory for a character.
@@ -24,6 +22,7 @@ class Inventory(Base):
     current_weight: float = Column(Float)
 
     items = relationship("Item", back_populates="inventory")
+    characters = relationship("Character", back_populates="inventory")
 
     def add_item(self, item: "Item") -> None:
         """Adds an item to the inventory.
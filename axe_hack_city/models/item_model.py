@@ -3,10 +3,9 @@ from enum import Enum as PyEnum
 from typing import Dict, List
 
 from sqlalchemy import ARRAY, Column, Enum, Float, ForeignKey, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base
 
 
 class ItemType(str, PyEnum):
@@ -51,5 +50,17 @@ class Item(Base):
     effects: List[Dict[str, int]] = Column(ARRAY(Dict[str, int]))
 
     inventory_id: int = Column(Integer, ForeignKey("inventories.id"))
-    crafting_recipes = relationship("CraftingRecipe", back_populates="ingredients")
+    crafting_recipes = relationship(
+        "CraftingRecipe",
+        secondary="crafting_recipe_items",
+        back_populates="ingredients",
+    )
     floor_id: int = Column(Integer, ForeignKey("floors.id"))
+    building_id: int = Column(Integer, ForeignKey("buildings.id"))
+
+    inventory = relationship("Inventory", back_populates="items")
+    floor = relationship("Floor", back_populates="loot")
+    building = relationship("Building", back_populates="loot")
+    missions = relationship(
+        "Mission", secondary="mission_reward_items", back_populates="rewards"
+    )
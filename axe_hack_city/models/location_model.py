@@ -1,14 +1,22 @@
 # models/location_model.py
-from enum import Enum
+from enum import Enum as PyEnum
 
-from sqlalchemy import ARRAY, Column, Float, ForeignKey, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Enum, Integer, String
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from ..database.codecs import EncodedJSON
+from .base import Base, association_table
 
+location_connections = association_table(
+    "location_connections",
+    "location_id",
+    "locations.id",
+    "connected_id",
+    "locations.id",
+)
 
-class LocationType(str, Enum):
+
+class LocationType(str, PyEnum):
     """Enumeration of possible location types."""
 
     street = "street"
@@ -34,7 +42,15 @@ class Location(Base):
     name: str = Column(String)
     type: LocationType = Column(Enum(LocationType))
     description: str = Column(String)
-    coordinates: list[float] = Column(ARRAY(Float))
-
-    connected_locations = relationship("Location", back_populates="entrances")
+    coordinates: list[float] = Column(EncodedJSON("msgpack"))
+
+    connected_locations = relationship(
+        "Location",
+        secondary=location_connections,
+        primaryjoin=id == location_connections.c.location_id,
+        secondaryjoin=id == location_connections.c.connected_id,
+    )
+    connected_buildings = relationship(
+        "Building", secondary="building_entrances", back_populates="entrances"
+    )
     events = relationship("Event", back_populates="location")
@@ -1,14 +1,17 @@
 # models/mission_model.py
-from enum import Enum
+from enum import Enum as PyEnum
 
-from sqlalchemy import ARRAY, Column, ForeignKey, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import ARRAY, Column, Enum, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base, association_table
 
+mission_reward_items = association_table(
+    "mission_reward_items", "mission_id", "missions.id", "item_id", "items.id"
+)
 
-class MissionStatus(str, Enum):
+
+class MissionStatus(str, PyEnum):
     """Enumeration of possible mission statuses."""
 
     active = "active"
@@ -35,6 +38,8 @@ class Mission(Base):
     objectives: list[str] = Column(ARRAY(String))
     status: MissionStatus = Column(Enum(MissionStatus))
 
-    rewards = relationship("Item", back_populates="missions")
+    rewards = relationship(
+        "Item", secondary=mission_reward_items, back_populates="missions"
+    )
     giver_id: int = Column(Integer, ForeignKey("npcs.id"))
     giver = relationship("NPC", back_populates="missions")
@@ -1,14 +1,13 @@
 # models/npc_model.py
-from enum import Enum
+from enum import Enum as PyEnum
 
 from sqlalchemy import Column, ForeignKey, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base
 
 
-class AggressionLevel(str, Enum):
+class AggressionLevel(str, PyEnum):
     """Enumeration of possible aggression levels for NPCs."""
 
     passive = "passive"
@@ -17,7 +16,7 @@ class AggressionLevel(str, Enum):
     hostile = "hostile"
 
 
-class Relationship(str, Enum):
+class Relationship(str, PyEnum):
     """Enumeration of possible relationships for NPCs."""
 
     ally = "ally"
@@ -31,9 +30,20 @@ class NPC(Base):
     Attributes:
         id (int): Unique identifier for the NPC.
         name (str): Name of the NPC.
+        faction_id (int): ID of the faction the NPC belongs to.
+        building_id (int): ID of the building the NPC is found in.
+        floor_id (int): ID of the floor the NPC is found on.
     """
 
     __tablename__ = "npcs"
 
     id: int = Column(Integer, primary_key=True, index=True)
     name: str = Column(String)
+    faction_id: int = Column(Integer, ForeignKey("factions.id"))
+    building_id: int = Column(Integer, ForeignKey("buildings.id"))
+    floor_id: int = Column(Integer, ForeignKey("floors.id"))
+
+    faction = relationship("Faction", back_populates="npcs")
+    building = relationship("Building", back_populates="npcs")
+    floor = relationship("Floor", back_populates="npcs")
+    missions = relationship("Mission", back_populates="giver")
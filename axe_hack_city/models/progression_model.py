@@ -1,9 +1,8 @@
 # models/progression_model.py
 from sqlalchemy import JSON, Column, ForeignKey, Integer
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base
 
 
 class PlayerProgression(Base):
@@ -2,9 +2,8 @@
 from enum import Enum as PyEnum
 
 from sqlalchemy import JSON, Column, Enum, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
 
-Base = declarative_base()
+from .base import Base
 
 
 class SkillType(str, PyEnum):
@@ -1,9 +1,12 @@
 # models/street_model.py
 from sqlalchemy import Column, Float, ForeignKey, Integer
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .base import Base, association_table
+
+street_buildings = association_table(
+    "street_buildings", "street_id", "streets.id", "building_id", "buildings.id"
+)
 
 
 class Street(Base):
@@ -23,4 +26,6 @@ class Street(Base):
     length: float = Column(Float)
     traffic: int = Column(Integer)
 
-    connected_buildings = relationship("Building", back_populates="connected_streets")
+    connected_buildings = relationship(
+        "Building", secondary=street_buildings, back_populates="connected_streets"
+    )
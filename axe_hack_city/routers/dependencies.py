@@ -0,0 +1,47 @@
+# routers/dependencies.py
+from typing import Any, Dict, List, Optional
+
+from fastapi import Query, Request
+
+# Query parameters with their own meaning on list routes
+RESERVED_LIST_PARAMS = {"limit", "after", "fields", "order_by"}
+
+
+def field_selection(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return, e.g. `id,name`.",
+    )
+) -> Optional[List[str]]:
+    """Parse the sparse fieldset query parameter.
+
+    Args:
+        fields: Comma-separated field names, or None for every field.
+
+    Returns:
+        The requested field names, or None when the client wants them all.
+    """
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def filter_params(request: Request) -> Dict[str, Any]:
+    """Collect list filters such as ``?traffic__gt=80&type__in=a,b``.
+
+    Every query parameter that is not reserved by the list route becomes a
+    ``field`` or ``field__op`` filter for the repository; ``__in`` values are
+    comma-separated.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The filters keyed by ``field`` or ``field__op``.
+    """
+    filters: Dict[str, Any] = {}
+    for key, value in request.query_params.items():
+        if key in RESERVED_LIST_PARAMS:
+            continue
+        filters[key] = value.split(",") if key.endswith("__in") else value
+    return filters
@@ -1,77 +1,175 @@
 # routers/location_router.py
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..controllers.location_controller import LocationController
+from ..controllers.location_controller import AsyncLocationController
+from ..database.unit_of_work import async_unit_of_work
 from ..models.location_model import Location
 from ..schemas.location_schema import (LocationCreateSchema, LocationSchema,
                                        LocationUpdateSchema)
+from .dependencies import field_selection, filter_params
 
 router = APIRouter()
 
 
-@router.post("/", response_model=Dict[str, Any])
-async def create_location(location: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a new location.
+def get_location_controller(session: AsyncSession) -> AsyncLocationController:
+    """
+    Get an instance of the AsyncLocationController.
 
     Args:
-        location: The location data.
+        session (AsyncSession): The async SQLAlchemy session.
 
     Returns:
-        The created location data.
+        AsyncLocationController: An instance of the AsyncLocationController.
     """
-    return {"id": 1, "name": location.get("name")}
+    return AsyncLocationController(session)
 
 
-@router.get("/{location_id}", response_model=Dict[str, Any])
-async def read_location(location_id: int) -> Dict[str, Any]:
-    """Retrieve a location by ID.
+@router.post("/", response_model=LocationSchema)
+async def create_location(
+    location: LocationCreateSchema,
+    session: AsyncSession = Depends(async_unit_of_work),
+) -> LocationSchema:
+    """
+    Create a new location.
 
     Args:
-        location_id: The ID of the location.
+        location (LocationCreateSchema): The location data to create.
+        session (AsyncSession): The async SQLAlchemy session.
 
     Returns:
-        The retrieved location data.
+        LocationSchema: The created location.
+    """
+    location_controller = get_location_controller(session)
+    new_location = await location_controller.create_location(
+        Location(**location.model_dump())
+    )
+    return LocationSchema.model_validate(new_location)
+
+
+@router.get("/{location_id}", response_model=Union[LocationSchema, Dict[str, Any]])
+async def read_location(
+    location_id: int,
+    fields: Optional[List[str]] = Depends(field_selection),
+    session: AsyncSession = Depends(async_unit_of_work),
+) -> Union[LocationSchema, Dict[str, Any]]:
     """
-    return {"id": location_id, "name": "Sample Location"}
+    Retrieve a location by ID.
 
+    Args:
+        location_id (int): The ID of the location.
+        fields (Optional[List[str]]): Only return these fields.
+        session (AsyncSession): The async SQLAlchemy session.
 
-@router.put("/{location_id}", response_model=Dict[str, Any])
-async def update_location(location_id: int, location: Dict[str, Any]) -> Dict[str, Any]:
-    """Update a location by ID.
+    Returns:
+        Union[LocationSchema, Dict[str, Any]]: The retrieved location, or just
+            the requested fields.
+    """
+    location_controller = get_location_controller(session)
+    try:
+        location = await location_controller.get_location(
+            location_id, fields, load=AsyncLocationController.SUMMARY_LOAD
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if location is None:
+        raise HTTPException(status_code=404, detail="Location not found")
+    if fields:
+        return location
+    return LocationSchema.model_validate(location)
+
+
+@router.put("/{location_id}", response_model=LocationSchema)
+async def update_location(
+    location_id: int,
+    location: LocationUpdateSchema,
+    session: AsyncSession = Depends(async_unit_of_work),
+) -> LocationSchema:
+    """
+    Update a location by ID.
 
     Args:
-        location_id: The ID of the location to update.
-        location: The updated location data.
+        location_id (int): The ID of the location to update.
+        location (LocationUpdateSchema): The updated location data; fields left
+            out of the request body are kept.
+        session (AsyncSession): The async SQLAlchemy session.
 
     Returns:
-        The updated location data.
+        LocationSchema: The updated location.
     """
-    return {"id": location_id, "name": location.get("name")}
+    location_controller = get_location_controller(session)
+    updated_location = await location_controller.update_location(
+        Location(id=location_id, **location.model_dump(exclude_unset=True))
+    )
+    if updated_location is None:
+        raise HTTPException(status_code=404, detail="Location not found")
+    return LocationSchema.model_validate(updated_location)
 
 
 @router.delete("/{location_id}", response_model=Dict[str, Any])
-async def delete_location(location_id: int) -> Dict[str, Any]:
-    """Delete a location by ID.
+async def delete_location(
+    location_id: int,
+    session: AsyncSession = Depends(async_unit_of_work),
+) -> Dict[str, Any]:
+    """
+    Delete a location by ID.
 
     Args:
-        location_id: The ID of the location to delete.
+        location_id (int): The ID of the location to delete.
+        session (AsyncSession): The async SQLAlchemy session.
 
     Returns:
-        A message confirming the successful deletion of the location.
+        Dict[str, Any]: A message confirming the successful deletion of the
+            location.
     """
+    location_controller = get_location_controller(session)
+    if not await location_controller.delete_location(location_id):
+        raise HTTPException(status_code=404, detail="Location not found")
     return {"detail": "Location deleted successfully"}
 
 
-@router.get("/", response_model=List[Dict[str, Any]])
-async def list_locations() -> List[Dict[str, Any]]:
-    """List all locations.
+@router.get("/", response_model=List[Union[LocationSchema, Dict[str, Any]]])
+async def list_locations(
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[int] = None,
+    fields: Optional[List[str]] = Depends(field_selection),
+    order_by: Optional[str] = Query(
+        None, description="Comma-separated fields; prefix with `-` to sort desc."
+    ),
+    filters: Dict[str, Any] = Depends(filter_params),
+    session: AsyncSession = Depends(async_unit_of_work),
+) -> List[Union[LocationSchema, Dict[str, Any]]]:
+    """
+    List a page of filtered locations, e.g. ``?type=district&order_by=name``.
+
+    Args:
+        limit (int): Maximum number of locations to return.
+        after (Optional[int]): Return only locations with an ID greater than
+            this, typically the last ID of the previous page.
+        fields (Optional[List[str]]): Only return these fields.
+        order_by (Optional[str]): Sort order; ID order when omitted.
+        filters (Dict[str, Any]): ``field`` or ``field__op`` filters taken from
+            the remaining query parameters.
+        session (AsyncSession): The async SQLAlchemy session.
 
     Returns:
-        A list of locations with their IDs and names.
+        List[Union[LocationSchema, Dict[str, Any]]]: A list of locations, or
+            just the requested fields of each.
     """
-    return [
-        {"id": 1, "name": "Sample Location 1"},
-        {"id": 2, "name": "Sample Location 2"},
-    ]
+    location_controller = get_location_controller(session)
+    try:
+        locations = await location_controller.list_locations(
+            limit=limit,
+            after=after,
+            fields=fields,
+            order_by=order_by,
+            load=AsyncLocationController.SUMMARY_LOAD,
+            **filters,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if fields:
+        return locations
+    return [LocationSchema.model_validate(location) for location in locations]
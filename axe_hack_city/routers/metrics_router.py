@@ -0,0 +1,40 @@
+# routers/metrics_router.py
+from dataclasses import asdict
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from ..config.settings import settings
+from ..database.connection_pool import get_pool
+from ..database.engine_pool import engine_pool_metrics
+from ..database.entity_cache import cache_metrics
+from ..database.session import async_engine, engine
+from ..database.single_flight import single_flight_metrics
+from ..database.write_queue import get_writer
+
+router = APIRouter()
+
+
+@router.get("/database", response_model=Dict[str, Any])
+def get_database_metrics() -> Dict[str, Any]:
+    """Report connection pool and writer usage for sizing the database layer.
+
+    Returns:
+        Pool size, checkout counts and wait times for the SQLite pool, how
+        many writes the single writer has grouped into each commit,
+        checkout latency and saturation of the SQLAlchemy engine pools,
+        hit, miss and eviction counts of the entity caches, and how many
+        reads were coalesced into another caller's query.
+    """
+    return {
+        "sqlite_pool": asdict(get_pool(settings.database_url).metrics()),
+        "sqlite_writer": asdict(get_writer(settings.database_url).metrics()),
+        "engine_pool": asdict(engine_pool_metrics(engine)),
+        "async_engine_pool": asdict(engine_pool_metrics(async_engine.sync_engine)),
+        "entity_caches": {
+            name: asdict(metrics) for name, metrics in cache_metrics().items()
+        },
+        "single_flight": {
+            name: asdict(metrics) for name, metrics in single_flight_metrics().items()
+        },
+    }
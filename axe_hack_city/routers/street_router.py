@@ -1,13 +1,15 @@
 # routers/street_router.py
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from ..controllers.street_controller import StreetController
+from ..database.unit_of_work import unit_of_work
 from ..models.street_model import Street
 from ..schemas.street_schema import (StreetCreateSchema, StreetSchema,
                                      StreetUpdateSchema)
+from .dependencies import field_selection, filter_params
 
 router = APIRouter()
 
@@ -26,7 +28,10 @@ def get_street_controller(session: Session) -> StreetController:
 
 
 @router.post("/", response_model=StreetSchema)
-def create_street(street: StreetCreateSchema, session: Session) -> StreetSchema:
+def create_street(
+    street: StreetCreateSchema,
+    session: Session = Depends(unit_of_work),
+) -> StreetSchema:
     """
     Create a new street.
 
@@ -42,33 +47,49 @@ def create_street(street: StreetCreateSchema, session: Session) -> StreetSchema:
     return StreetSchema.model_validate(new_street)
 
 
-@router.get("/{street_id}", response_model=StreetSchema)
-def get_street(street_id: int, session: Session) -> StreetSchema:
+@router.get("/{street_id}", response_model=Union[StreetSchema, Dict[str, Any]])
+def get_street(
+    street_id: int,
+    fields: Optional[List[str]] = Depends(field_selection),
+    session: Session = Depends(unit_of_work),
+) -> Union[StreetSchema, Dict[str, Any]]:
     """
     Retrieve a street by ID.
 
     Args:
         street_id (int): The ID of the street to retrieve.
+        fields (Optional[List[str]]): Only return these fields.
         session (Session): The SQLAlchemy session.
 
     Returns:
-        StreetSchema: The retrieved street.
+        Union[StreetSchema, Dict[str, Any]]: The retrieved street, or just the
+            requested fields.
     """
     street_controller = get_street_controller(session)
-    street = street_controller.get_street(street_id)
+    try:
+        street = street_controller.get_street(street_id, fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if street is None:
+        raise HTTPException(status_code=404, detail="Street not found")
+    if fields:
+        return street
     return StreetSchema.model_validate(street)
 
 
 @router.put("/{street_id}", response_model=StreetSchema)
 def update_street(
-    street_id: int, street: StreetUpdateSchema, session: Session
+    street_id: int,
+    street: StreetUpdateSchema,
+    session: Session = Depends(unit_of_work),
 ) -> StreetSchema:
     """
     Update an existing street.
 
     Args:
         street_id (int): The ID of the street to update.
-        street (StreetUpdateSchema): The updated street data.
+        street (StreetUpdateSchema): The updated street data; fields left out
+            of the request body are kept.
         session (Session): The SQLAlchemy session.
 
     Returns:
@@ -76,13 +97,17 @@ def update_street(
     """
     street_controller = get_street_controller(session)
     updated_street = street_controller.update_street(
-        Street(id=street_id, **street.model_dump())
+        Street(id=street_id, **street.model_dump(exclude_unset=True))
     )
+    if updated_street is None:
+        raise HTTPException(status_code=404, detail="Street not found")
     return StreetSchema.model_validate(updated_street)
 
 
 @router.delete("/{street_id}", response_model=Dict[str, Any])
-def delete_street(street_id: int, session: Session) -> Dict[str, Any]:
+def delete_street(
+    street_id: int, session: Session = Depends(unit_of_work)
+) -> Dict[str, Any]:
     """
     Delete a street by ID.
 
@@ -94,22 +119,47 @@ def delete_street(street_id: int, session: Session) -> Dict[str, Any]:
         Dict[str, Any]: A message confirming the successful deletion of the street.
     """
     street_controller = get_street_controller(session)
-    street_controller.delete_street(street_id)
+    if not street_controller.delete_street(street_id):
+        raise HTTPException(status_code=404, detail="Street not found")
     return {"message": "Street deleted successfully", "street_id": street_id}
 
 
-@router.get("/", response_model=List[StreetSchema])
-def list_streets(session: Session, **filters: Any) -> List[StreetSchema]:
+@router.get("/", response_model=List[Union[StreetSchema, Dict[str, Any]]])
+def list_streets(
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[int] = None,
+    fields: Optional[List[str]] = Depends(field_selection),
+    order_by: Optional[str] = Query(
+        None, description="Comma-separated fields; prefix with `-` to sort desc."
+    ),
+    filters: Dict[str, Any] = Depends(filter_params),
+    session: Session = Depends(unit_of_work),
+) -> List[Union[StreetSchema, Dict[str, Any]]]:
     """
-    List streets with optional filters.
+    List a page of filtered streets, e.g. ``?traffic__gt=80&order_by=-traffic``.
 
     Args:
+        limit (int): Maximum number of streets to return.
+        after (Optional[int]): Return only streets with an ID greater than this,
+            typically the last ID of the previous page.
+        fields (Optional[List[str]]): Only return these fields.
+        order_by (Optional[str]): Sort order; ID order when omitted.
+        filters (Dict[str, Any]): ``field`` or ``field__op`` filters taken from
+            the remaining query parameters (eq, ne, lt, lte, gt, gte, in,
+            startswith).
         session (Session): The SQLAlchemy session.
-        **filters (Any): Optional filters to apply to the street list.
 
     Returns:
-        List[StreetSchema]: A list of streets.
+        List[Union[StreetSchema, Dict[str, Any]]]: A list of streets, or just
+            the requested fields of each.
     """
     street_controller = get_street_controller(session)
-    streets = street_controller.list_streets(**filters)
+    try:
+        streets = street_controller.list_streets(
+            limit=limit, after=after, fields=fields, order_by=order_by, **filters
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if fields:
+        return streets
     return [StreetSchema.model_validate(street) for street in streets]
@@ -0,0 +1,29 @@
+# test/conftest.py
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from .models import Base
+
+# Settings requires an environment; set it before the app modules import it
+os.environ.setdefault("ENVIRONMENT", "test")
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    """URL of a fresh SQLite file holding the tables of test/models.py."""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def sessions(database_url):
+    """Session factory for :func:`database_url`."""
+    engine = create_engine(database_url)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
@@ -0,0 +1,14 @@
+# test/models.py
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+# A small ORM schema of its own, so tests of the repositories and the
+# per-request machinery do not depend on the app's models
+Base = declarative_base()
+
+
+class Gem(Base):
+    __tablename__ = "gems"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
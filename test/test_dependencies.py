@@ -0,0 +1,61 @@
+# test/test_dependencies.py
+from typing import Any, Dict, Optional
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from axe_hack_city.database.sqlalchemy_repository import SQLAlchemyRepository
+from axe_hack_city.routers.dependencies import filter_params
+
+from .models import Gem
+
+
+@pytest.fixture
+def client(sessions):
+    with sessions.begin() as session:
+        session.add_all(
+            [Gem(id=1, name="ruby"), Gem(id=2, name="opal"), Gem(id=3, name="jade")]
+        )
+    app = FastAPI()
+
+    # Wired like the street and location list routes
+    @app.get("/gems")
+    def list_gems(
+        order_by: Optional[str] = None,
+        filters: Dict[str, Any] = Depends(filter_params),
+    ):
+        with sessions() as session:
+            try:
+                gems = SQLAlchemyRepository(session, Gem).list(
+                    order_by=order_by, **filters
+                )
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc))
+            return [gem.id for gem in gems]
+
+    return TestClient(app)
+
+
+def test_query_parameters_become_filters(client):
+    assert client.get("/gems?name__in=ruby,jade").json() == [1, 3]
+    assert client.get("/gems?id__gt=1&name__startswith=o").json() == [2]
+
+
+def test_reserved_parameters_are_not_filters(client):
+    assert client.get("/gems?order_by=-name&limit=5").json() == [1, 2, 3]
+    assert client.get("/gems?order_by=name&id__ne=2").json() == [3, 1]
+
+
+@pytest.mark.parametrize(
+    "query, error",
+    [
+        ("colour=red", "Unknown filter field: colour"),
+        ("name__like=r", "Unknown filter operator: like"),
+        ("order_by=colour", "Unknown order_by field: colour"),
+    ],
+)
+def test_unknown_fields_are_rejected(client, query, error):
+    response = client.get(f"/gems?{query}")
+    assert response.status_code == 400
+    assert response.json() == {"detail": error}
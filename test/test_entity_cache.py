@@ -0,0 +1,72 @@
+# test/test_entity_cache.py
+import pytest
+
+from axe_hack_city.database.entity_cache import EntityCache
+from axe_hack_city.database.sqlalchemy_repository import SQLAlchemyRepository
+
+from .models import Gem
+
+
+class RacingRepository(SQLAlchemyRepository):
+    """Runs a callback after reading the row but before returning it."""
+
+    def __init__(self, session, model, during_read):
+        super().__init__(session, model)
+        self.during_read = during_read
+
+    def get(self, entity_id, fields=None, load=None):
+        entity = super().get(entity_id, fields, load)
+        self.during_read()
+        return entity
+
+
+@pytest.fixture(autouse=True)
+def gem(sessions):
+    with sessions.begin() as session:
+        session.add(Gem(id=1, name="old"))
+
+
+def test_read_racing_a_commit_is_not_cached(sessions):
+    cache = EntityCache(max_size=10, ttl=60)
+
+    def rename():
+        with sessions() as writer, writer.begin():
+            SQLAlchemyRepository(writer, Gem).update(Gem(id=1, name="new"))
+            cache.invalidate(writer, [1])
+
+    with sessions() as reader:
+        gem = cache.get(RacingRepository(reader, Gem, rename), 1)
+    assert gem.name == "old"
+    assert cache.metrics().size == 0
+
+    with sessions() as reader:
+        assert cache.get(SQLAlchemyRepository(reader, Gem), 1).name == "new"
+
+
+def test_steady_state_reads_hit_the_cache(sessions):
+    cache = EntityCache(max_size=10, ttl=60)
+    for _ in range(3):
+        with sessions() as session:
+            assert cache.get(SQLAlchemyRepository(session, Gem), 1).name == "old"
+    metrics = cache.metrics()
+    assert (metrics.misses, metrics.hits) == (1, 2)
+
+
+def test_write_invalidates_the_cached_row(sessions):
+    cache = EntityCache(max_size=10, ttl=60)
+    with sessions() as session:
+        cache.get(SQLAlchemyRepository(session, Gem), 1)
+    with sessions() as writer, writer.begin():
+        SQLAlchemyRepository(writer, Gem).update(Gem(id=1, name="new"))
+        cache.invalidate(writer, [1])
+    with sessions() as session:
+        assert cache.get(SQLAlchemyRepository(session, Gem), 1).name == "new"
+
+
+def test_invalidations_leave_no_per_key_state(sessions):
+    cache = EntityCache(max_size=10, ttl=60)
+    with sessions() as writer, writer.begin():
+        cache.invalidate(writer, range(1000))
+    with sessions() as reader:
+        cache.get(SQLAlchemyRepository(reader, Gem), 1)
+    assert cache._reads == {}
@@ -0,0 +1,30 @@
+# test/test_query_plans.py
+import sqlite3
+
+import pytest
+
+from axe_hack_city.database.migrations import migrate
+from axe_hack_city.database.query_plans import (QueryPlanError,
+                                                verify_query_plans)
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    migrate(connection)
+    yield connection
+    connection.close()
+
+
+def test_repository_queries_use_an_index(connection):
+    verify_query_plans(connection)
+
+
+def test_filtered_page_without_its_index_is_reported(connection):
+    (name,) = connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'Floor'"
+        " AND sql LIKE '%building_id%'"
+    ).fetchone()
+    connection.execute(f"DROP INDEX {name}")
+    with pytest.raises(QueryPlanError, match="FROM Floor WHERE building_id = \\?"):
+        verify_query_plans(connection)
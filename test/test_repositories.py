@@ -0,0 +1,164 @@
+# test/test_repositories.py
+import asyncio
+from typing import ClassVar, List, Optional
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from axe_hack_city.database.async_sqlalchemy_repository import \
+    AsyncSQLAlchemyRepository
+from axe_hack_city.database.sqlalchemy_repository import SQLAlchemyRepository
+from axe_hack_city.database.sqlite_repository import SQLiteRepository
+
+from .models import Gem
+
+
+class Faction(BaseModel):
+    """The columns of the SQLite ``Faction`` table these tests need."""
+
+    __tablename__: ClassVar[str] = "Faction"
+
+    id: Optional[int] = None
+    name: str
+    reputation: int
+
+
+class Account(BaseModel):
+    """The columns of the SQLite ``User`` table these tests need."""
+
+    __tablename__: ClassVar[str] = "User"
+
+    id: Optional[int] = None
+    username: str
+    password: str
+    timezone: str = "UTC"
+
+
+class Recipe(BaseModel):
+    """The columns of the SQLite ``CraftingRecipe`` table these tests need."""
+
+    __tablename__: ClassVar[str] = "CraftingRecipe"
+
+    id: Optional[int] = None
+    name: str
+    description: Optional[str] = None
+    ingredients: List[int] = []
+
+
+@pytest.fixture
+def gems(sessions):
+    with sessions.begin() as session:
+        session.add_all([Gem(id=1, name="ruby"), Gem(id=2, name="opal")])
+
+
+@pytest.fixture
+def repository(tmp_path):
+    return SQLiteRepository(str(tmp_path / "app.db"))
+
+
+def test_update_many_skips_missing_ids(sessions, gems):
+    with sessions.begin() as session:
+        repository = SQLAlchemyRepository(session, Gem)
+        updated = repository.update_many(
+            [Gem(id=1, name="jade"), Gem(id=99, name="lost")]
+        )
+        assert updated == 1
+        assert repository.get(1).name == "jade"
+        assert repository.get(99) is None
+
+
+def test_async_update_many_skips_missing_ids(database_url, gems):
+    async def run():
+        engine = create_async_engine(database_url.replace("sqlite", "sqlite+aiosqlite"))
+        async with async_sessionmaker(bind=engine).begin() as session:
+            repository = AsyncSQLAlchemyRepository(session, Gem)
+            updated = await repository.update_many(
+                [Gem(id=99, name="lost"), Gem(id=2, name="onyx")]
+            )
+            assert updated == 1
+            assert (await repository.get(2)).name == "onyx"
+            assert await repository.get(99) is None
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_sqlite_update_many_skips_missing_ids(repository):
+    (id,) = repository.create_many([Faction(name="Rats", reputation=0)])
+    updated = repository.update_many(
+        [
+            Faction(id=id, name="Kings", reputation=5),
+            Faction(id=id + 1, name="Owls", reputation=1),
+        ]
+    )
+    assert updated == 1
+    assert repository.get(Faction, id).name == "Kings"
+
+
+def test_sqlite_create_many_returns_the_stored_ids(repository):
+    recipes = [Recipe(name=f"r{n}", ingredients=[n, n + 1]) for n in range(5)]
+    ids = repository.create_many(recipes, chunk_size=2)
+    stored = [repository.get(Recipe, id) for id in ids]
+    assert [(r.name, r.ingredients) for r in stored] == [
+        (r.name, r.ingredients) for r in recipes
+    ]
+
+
+def test_sqlite_upsert_keeps_the_lists_it_does_not_set(repository):
+    sword = repository.create(Recipe(name="Sword", ingredients=[5, 6]))
+    shield = repository.create(Recipe(name="Shield", ingredients=[7]))
+
+    repository.upsert(Recipe(id=sword.id, name="Sword", description="sharp"))
+    repository.upsert_many([Recipe(id=shield.id, name="Shield", description="round")])
+
+    assert repository.get(Recipe, sword.id).ingredients == [5, 6]
+    assert repository.get(Recipe, shield.id).ingredients == [7]
+    upserted = repository.upsert(Recipe(id=sword.id, name="Sword", ingredients=[8]))
+    assert upserted.ingredients == [8]
+
+
+def test_sqlite_update_many_skips_the_lists_of_missing_ids(repository):
+    sword = repository.create(Recipe(name="Sword", ingredients=[5, 6]))
+    updated = repository.update_many(
+        [
+            Recipe(id=sword.id, name="Sword", ingredients=[7]),
+            Recipe(id=sword.id + 1, name="Ghost", ingredients=[8]),
+        ]
+    )
+    assert updated == 1
+    assert repository.get(Recipe, sword.id).ingredients == [7]
+    assert repository.get(Recipe, sword.id + 1) is None
+
+
+def test_sqlite_upsert_on_a_unique_column(repository):
+    created = repository.upsert(Account(username="ada", password="x"), "username")
+    updated = repository.upsert(Account(username="ada", password="y"), "username")
+    assert updated.id == created.id
+    assert repository.get(Account, created.id).password == "y"
+
+
+@pytest.mark.parametrize("matching, chunks", [(5, 3), (4, 3), (1, 1)])
+def test_sqlite_delete_where_loops_until_a_partial_chunk(repository, matching, chunks):
+    repository.create_many(
+        [Faction(name=f"f{n}", reputation=n) for n in range(matching)]
+        + [Faction(name="Kings", reputation=50)]
+    )
+    writes = repository.writer.metrics().writes
+    assert repository.delete_where(Faction, chunk_size=2, reputation__lt=10) == matching
+    assert repository.writer.metrics().writes - writes == chunks
+    assert [f.name for f in repository.list(Faction)] == ["Kings"]
+
+
+def test_delete_where_commits_each_chunk_outside_a_transaction(sessions):
+    with sessions.begin() as session:
+        session.add_all([Gem(id=n, name=f"g{n}") for n in range(1, 6)])
+        session.add(Gem(id=6, name="keep"))
+    with sessions() as session:
+        commits = []
+        event.listen(session, "after_commit", commits.append)
+        repository = SQLAlchemyRepository(session, Gem)
+        assert repository.delete_where(chunk_size=2, name__startswith="g") == 5
+        assert len(commits) == 3
+        assert [gem.name for gem in repository.list()] == ["keep"]
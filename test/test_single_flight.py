@@ -0,0 +1,114 @@
+# test/test_single_flight.py
+import asyncio
+import threading
+import time
+
+import pytest
+from sqlalchemy import (Column, ForeignKey, Integer, String, create_engine,
+                        event)
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+
+from axe_hack_city.database.async_sqlalchemy_repository import \
+    AsyncSQLAlchemyRepository
+from axe_hack_city.database.single_flight import (async_coalesced_get,
+                                                  coalesced_get,
+                                                  single_flight_metrics)
+from axe_hack_city.database.sqlalchemy_repository import SQLAlchemyRepository
+
+Base = declarative_base()
+
+SUMMARY_LOAD = {"*": "raise"}
+
+
+class Tower(Base):
+    __tablename__ = "towers"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    rooms = relationship("Room")
+
+
+class Room(Base):
+    __tablename__ = "rooms"
+
+    id = Column(Integer, primary_key=True)
+    tower_id = Column(Integer, ForeignKey("towers.id"))
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "flight.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine).begin() as session:
+        session.add(Tower(id=1, name="keep", rooms=[Room(id=1)]))
+    yield engine, path
+    engine.dispose()
+
+
+def _coalesced(kind):
+    return single_flight_metrics()[kind].coalesced
+
+
+def test_sync_follower_keeps_raise_loading(database):
+    engine, _ = database
+    sessions = sessionmaker(bind=engine)
+    joined = _coalesced("sync") + 1
+
+    # Hold the leader's query until the follower is waiting on it
+    @event.listens_for(engine, "before_cursor_execute")
+    def wait_for_follower(*args):
+        deadline = time.monotonic() + 5
+        while _coalesced("sync") < joined and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    results = {}
+
+    def read(name):
+        with sessions() as session:
+            repository = SQLAlchemyRepository(session, Tower)
+            tower = coalesced_get(repository, 1, load=SUMMARY_LOAD)
+            try:
+                tower.rooms
+            except InvalidRequestError as error:
+                results[name] = (tower.name, str(error))
+
+    threads = [threading.Thread(target=read, args=(n,)) for n in ("a", "b")]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join()
+
+    assert _coalesced("sync") == joined
+    assert set(results) == {"a", "b"}
+    for name, message in results.values():
+        assert name == "keep"
+        assert "lazy='raise'" in message
+
+
+def test_async_follower_keeps_raise_loading(database):
+    _, path = database
+
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        sessions = async_sessionmaker(engine)
+        before = _coalesced("async")
+
+        async def read():
+            async with sessions() as session:
+                repository = AsyncSQLAlchemyRepository(session, Tower)
+                tower = await async_coalesced_get(repository, 1, load=SUMMARY_LOAD)
+                with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+                    tower.rooms
+                return tower.name
+
+        names = await asyncio.gather(read(), read())
+        await engine.dispose()
+        return names, _coalesced("async") - before
+
+    names, coalesced = asyncio.run(main())
+    assert names == ["keep", "keep"]
+    assert coalesced == 1
@@ -0,0 +1,60 @@
+# test/test_unit_of_work.py
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from axe_hack_city.database import unit_of_work as uow
+from axe_hack_city.database.sqlalchemy_repository import SQLAlchemyRepository
+
+from .models import Gem
+
+
+@pytest.fixture
+def client(sessions, monkeypatch):
+    # The request transactions run against the test database
+    monkeypatch.setattr(uow, "SessionLocal", sessions)
+    app = FastAPI()
+
+    @app.post("/gems/{name}")
+    def create_gem(name: str, session: Session = Depends(uow.unit_of_work)):
+        return SQLAlchemyRepository(session, Gem).create(Gem(name=name)).id
+
+    @app.post("/gems/{name}/reject")
+    def reject_gem(name: str, session: Session = Depends(uow.unit_of_work)):
+        SQLAlchemyRepository(session, Gem).create(Gem(name=name))
+        raise HTTPException(status_code=409, detail="rejected")
+
+    @app.post("/gems/{name}/with-spare")
+    def create_with_spare(name: str, session: Session = Depends(uow.unit_of_work)):
+        repository = SQLAlchemyRepository(session, Gem)
+        repository.create(Gem(name=name))
+        try:
+            with uow.savepoint(session):
+                repository.create(Gem(name="spare"))
+                raise ValueError("no spare today")
+        except ValueError:
+            pass
+
+    return TestClient(app)
+
+
+def stored(sessions):
+    with sessions() as session:
+        return [gem.name for gem in SQLAlchemyRepository(session, Gem).list()]
+
+
+def test_request_commits_when_the_endpoint_returns(client, sessions):
+    assert client.post("/gems/ruby").status_code == 200
+    assert client.post("/gems/opal").status_code == 200
+    assert stored(sessions) == ["ruby", "opal"]
+
+
+def test_request_rolls_back_when_the_endpoint_raises(client, sessions):
+    assert client.post("/gems/ruby/reject").status_code == 409
+    assert stored(sessions) == []
+
+
+def test_savepoint_rolls_back_only_its_block(client, sessions):
+    assert client.post("/gems/ruby/with-spare").status_code == 200
+    assert stored(sessions) == ["ruby"]
@@ -0,0 +1,52 @@
+# test/test_write_queue.py
+import sqlite3
+
+import pytest
+
+from axe_hack_city.database.write_queue import WriteQueue
+
+
+@pytest.fixture
+def writer(tmp_path):
+    # A wide window, so writes submitted back to back share one batch
+    writer = WriteQueue(str(tmp_path / "queue.db"), window=0.5)
+    writer.execute(lambda conn: conn.execute("CREATE TABLE notes (text TEXT)"))
+    yield writer
+    writer.close()
+
+
+def insert(text):
+    return lambda conn: conn.execute("INSERT INTO notes VALUES (?)", (text,)).rowcount
+
+
+def fail_after_insert(conn):
+    insert("lost")(conn)
+    raise ValueError("rejected")
+
+
+def stored(writer):
+    with sqlite3.connect(writer.db_path) as conn:
+        return [text for (text,) in conn.execute("SELECT text FROM notes ORDER BY 1")]
+
+
+def test_concurrent_writes_share_one_commit(writer):
+    commits = writer.metrics().commits
+    futures = [writer.submit(insert(text)) for text in ("a", "b", "c")]
+    assert [future.result() for future in futures] == [1, 1, 1]
+    metrics = writer.metrics()
+    assert metrics.commits == commits + 1
+    assert metrics.largest_batch == 3
+    assert stored(writer) == ["a", "b", "c"]
+
+
+def test_failing_write_is_rolled_back_alone(writer):
+    futures = [
+        writer.submit(op) for op in (insert("a"), fail_after_insert, insert("b"))
+    ]
+    assert futures[0].result() == 1
+    with pytest.raises(ValueError, match="rejected"):
+        futures[1].result()
+    assert futures[2].result() == 1
+    metrics = writer.metrics()
+    assert (metrics.largest_batch, metrics.failed_writes) == (3, 1)
+    assert stored(writer) == ["a", "b"]